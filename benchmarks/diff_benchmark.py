@@ -0,0 +1,129 @@
+# diff benchmark module
+
+# Code destined to timing SnapshotDiff
+# (path hash index) on synthetic snapshots,
+# for increasing row counts.
+
+######################################################################
+# imports
+
+# importing required libraries
+from numpy import arange
+from pandas import DataFrame
+from time import perf_counter
+from argparse import ArgumentParser
+from pytree.classes.SnapshotDiff import SnapshotDiff
+
+######################################################################
+# defining auxiliary functions
+
+
+def get_args_dict() -> dict:
+    """
+    Parses the arguments and returns a dictionary of the arguments.
+    :return: Dictionary. Represents the parsed arguments.
+    """
+    # creating a parser instance
+    parser = ArgumentParser(description='benchmarks snapshot diff on synthetic output tables')
+
+    # max rows num param
+    parser.add_argument('-n', '--max-rows-num',
+                        dest='max_rows_num',
+                        type=int,
+                        help='largest number of rows per snapshot (row counts double up to it)',
+                        default=2_000_000)
+
+    # changed ratio param
+    parser.add_argument('-r', '--changed-ratio',
+                        dest='changed_ratio',
+                        type=float,
+                        help='ratio of rows added/removed/resized between snapshots',
+                        default=0.001)
+
+    # creating arguments dictionary
+    args_dict = vars(parser.parse_args())
+
+    # returning the arguments dictionary
+    return args_dict
+
+
+def get_synthetic_snapshot(rows_num: int,
+                           first_row: int = 0
+                           ) -> DataFrame:
+    """
+    Given a rows num, returns synthetic output
+    table with as many files (100 per folder),
+    starting at given row number.
+    """
+    # getting rows numbers
+    rows = arange(first_row, first_row + rows_num)
+
+    # getting names/parents
+    names = [f'file_{row}.txt' for row in rows]
+    parents = [f'/synthetic/root/folder_{row // 100}' for row in rows]
+
+    # assembling snapshot df
+    snapshot_df = DataFrame({'name': names,
+                             'path': [f'{parent}/{name}' for parent, name in zip(parents, names)],
+                             'level': 2,
+                             'parent': parents,
+                             'type': 'file',
+                             'size': rows * 10})
+
+    # returning snapshot df
+    return snapshot_df
+
+######################################################################
+# defining main function
+
+
+def main():
+    """Runs main code."""
+    # getting args dict
+    args_dict = get_args_dict()
+    max_rows_num = args_dict['max_rows_num']
+    changed_ratio = args_dict['changed_ratio']
+
+    # defining starting rows num
+    rows_num = 250_000
+
+    # iterating over rows nums
+    while rows_num <= max_rows_num:
+
+        # getting changed rows num
+        changed_num = max(1, int(rows_num * changed_ratio))
+
+        # getting snapshots (new snapshot drops first rows, adds last rows, and resizes some)
+        old_df = get_synthetic_snapshot(rows_num=rows_num)
+        new_df = get_synthetic_snapshot(rows_num=rows_num,
+                                        first_row=changed_num)
+        new_df.loc[:changed_num, 'size'] += 1
+
+        # timing diff
+        start_time = perf_counter()
+        snapshot_diff = SnapshotDiff(old_df=old_df,
+                                     new_df=new_df)
+        diff_df = snapshot_diff.get_diff_df()
+        diff_time = perf_counter() - start_time
+
+        # timing changed rows selection
+        start_time = perf_counter()
+        changed_df = snapshot_diff.get_changed_df(diff_df=diff_df)
+        changed_time = perf_counter() - start_time
+
+        # printing results
+        print(f'{rows_num} rows: diff {diff_time:.2f}s ({diff_time / rows_num * 1e6:.2f}us/row), '
+              f'{len(changed_df)} changed rows selected in {changed_time:.2f}s')
+
+        # updating rows num
+        rows_num *= 2
+
+######################################################################
+# running main function
+
+
+if __name__ == '__main__':
+    main()
+
+######################################################################
+# end of current module
@@ -0,0 +1,149 @@
+# export benchmark module
+
+# Code destined to comparing legacy per row
+# DataFrame + concat export against bulk
+# PyTree.dict_to_df, for increasing node counts.
+
+######################################################################
+# imports
+
+# importing required libraries
+from pandas import concat
+from pandas import DataFrame
+from time import perf_counter
+from argparse import ArgumentParser
+from pytree.classes.PyTree import PyTree
+from memory_benchmark import build_node_store
+from pytree.classes.NodeStore import NodeStore
+from memory_benchmark import get_synthetic_folders
+
+######################################################################
+# defining auxiliary functions
+
+
+def get_args_dict() -> dict:
+    """
+    Parses the arguments and returns a dictionary of the arguments.
+    :return: Dictionary. Represents the parsed arguments.
+    """
+    # creating a parser instance
+    parser = ArgumentParser(description='benchmarks legacy against bulk table export')
+
+    # max files num param
+    parser.add_argument('-n', '--max-files-num',
+                        dest='max_files_num',
+                        type=int,
+                        help='largest number of file nodes exported (node counts double up to it)',
+                        default=500_000)
+
+    # legacy max files num param
+    parser.add_argument('-m', '--legacy-max-files-num',
+                        dest='legacy_max_files_num',
+                        type=int,
+                        help='largest number of file nodes exported with legacy method (it is slow)',
+                        default=20_000)
+
+    # creating arguments dictionary
+    args_dict = vars(parser.parse_args())
+
+    # returning the arguments dictionary
+    return args_dict
+
+
+def legacy_dict_to_df(tree_dict: NodeStore) -> DataFrame:
+    """
+    Converts node store into a DataFrame
+    the way PyTree used to (one single row
+    DataFrame per node, concatenated).
+    """
+    # getting columns dict (only used to get per node values)
+    columns_dict = tree_dict.get_columns_dict(node_indices=list(tree_dict.get_ordered_indices()))
+
+    # getting single row dfs
+    dfs_list = [DataFrame({column_name: column_values[row_index]
+                           for column_name, column_values in columns_dict.items()},
+                          index=[0])
+                for row_index
+                in range(len(tree_dict))]
+
+    # concatenating dfs
+    final_df = concat(dfs_list,
+                      ignore_index=True)
+
+    # returning final df
+    return final_df
+
+######################################################################
+# defining main function
+
+
+def main():
+    """Runs main code."""
+    # getting args dict
+    args_dict = get_args_dict()
+    max_files_num = args_dict['max_files_num']
+    legacy_max_files_num = args_dict['legacy_max_files_num']
+
+    # defining synthetic root path
+    root_path = '/synthetic/tree/root'
+
+    # getting pytree instance (only used for its export methods)
+    pytree = PyTree(start_path=root_path,
+                    dirs_only=False,
+                    include_counts=True,
+                    include_sizes=True,
+                    extension=None,
+                    keyword=None,
+                    level=-1,
+                    loc=True,
+                    output_path=None,
+                    quiet=True)
+
+    # defining starting files num
+    files_num = 10_000
+
+    # iterating over files nums
+    while files_num <= max_files_num:
+
+        # getting node store
+        synthetic_folders = get_synthetic_folders(root_path=root_path,
+                                                  files_num=files_num,
+                                                  files_per_folder=100)
+        node_store = build_node_store(root_path=root_path,
+                                      synthetic_folders=synthetic_folders)
+        nodes_num = len(node_store)
+
+        # timing bulk export
+        start_time = perf_counter()
+        pytree.dict_to_df(tree_dict=node_store)
+        bulk_time = perf_counter() - start_time
+
+        # getting results string
+        results_str = f'{nodes_num} nodes: bulk {bulk_time:.3f}s ({bulk_time / nodes_num * 1e6:.2f}us/node)'
+
+        # checking whether to time legacy export
+        if files_num <= legacy_max_files_num:
+
+            # timing legacy export
+            start_time = perf_counter()
+            legacy_dict_to_df(tree_dict=node_store)
+            legacy_time = perf_counter() - start_time
+
+            # updating results string
+            results_str += f', legacy {legacy_time:.3f}s ({legacy_time / nodes_num * 1e6:.2f}us/node)'
+
+        # printing results
+        print(results_str)
+
+        # updating files num
+        files_num *= 2
+
+######################################################################
+# running main function
+
+
+if __name__ == '__main__':
+    main()
+
+######################################################################
+# end of current module
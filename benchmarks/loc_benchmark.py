@@ -0,0 +1,130 @@
+# loc benchmark module
+
+# Code destined to comparing serial lines of
+# code counting against process pool based
+# get_loc_dict, for increasing workers nums.
+
+######################################################################
+# imports
+
+# importing required libraries
+from os import walk
+from os import cpu_count
+from os.path import join
+from os.path import exists
+from time import perf_counter
+from tempfile import gettempdir
+from argparse import ArgumentParser
+from pytree.utils.aux_funcs import get_loc
+from tree_generators import create_python_tree
+from pytree.utils.aux_funcs import get_loc_dict
+
+######################################################################
+# defining auxiliary functions
+
+
+def get_args_dict() -> dict:
+    """
+    Parses the arguments and returns a dictionary of the arguments.
+    :return: Dictionary. Represents the parsed arguments.
+    """
+    # creating a parser instance
+    parser = ArgumentParser(description='benchmarks serial against process pool lines of code counting')
+
+    # files num param
+    parser.add_argument('-n', '--files-num',
+                        dest='files_num',
+                        type=int,
+                        help='number of python files in synthetic tree',
+                        default=100_000)
+
+    # tree path param
+    parser.add_argument('-t', '--tree-path',
+                        dest='tree_path',
+                        type=str,
+                        help='path to synthetic tree (created if non-existent)',
+                        default=None)
+
+    # creating arguments dictionary
+    args_dict = vars(parser.parse_args())
+
+    # returning the arguments dictionary
+    return args_dict
+
+
+def get_python_files(start_path: str) -> list:
+    """
+    Given a start path, returns paths
+    to python files inside it.
+    """
+    # getting python files
+    python_files = [join(folder_path, file_name)
+                    for folder_path, _, files in walk(start_path)
+                    for file_name in files
+                    if file_name.endswith('.py')]
+
+    # returning python files
+    return python_files
+
+######################################################################
+# defining main function
+
+
+def main():
+    """Runs main code."""
+    # getting args dict
+    args_dict = get_args_dict()
+    files_num = args_dict['files_num']
+    tree_path = args_dict['tree_path']
+
+    # checking whether tree path was given
+    if tree_path is None:
+
+        # defining default tree path
+        tree_path = join(gettempdir(), f'pytree_loc_benchmark_{files_num}')
+
+    # checking whether tree already exists
+    if not exists(tree_path):
+
+        # creating synthetic tree
+        print(f'creating synthetic python tree with {files_num} files at "{tree_path}"...')
+        create_python_tree(root_path=tree_path,
+                           files_num=files_num)
+
+    # getting python files
+    python_files = get_python_files(start_path=tree_path)
+
+    # timing serial run
+    start_time = perf_counter()
+    serial_results = [get_loc(file_path=file_path) for file_path in python_files]
+    serial_time = perf_counter() - start_time
+    print(f'serial: {serial_time:.3f}s')
+
+    # getting workers nums to test (powers of two up to cpu count)
+    workers_nums = [2 ** power for power in range(1, 8) if 2 ** power <= (cpu_count() or 1)]
+
+    # iterating over workers nums
+    for workers in workers_nums:
+
+        # timing process pool run
+        start_time = perf_counter()
+        loc_dict = get_loc_dict(file_paths=python_files,
+                                workers=workers)
+        pool_time = perf_counter() - start_time
+
+        # checking results match serial run
+        pool_results = [loc_dict[file_path] for file_path in python_files]
+        results_match = (pool_results == serial_results)
+
+        # printing results
+        print(f'{workers} processes: {pool_time:.3f}s (speedup: {serial_time / pool_time:.2f}x, results match: {results_match})')
+
+######################################################################
+# running main function
+
+
+if __name__ == '__main__':
+    main()
+
+######################################################################
+# end of current module
@@ -0,0 +1,247 @@
+# memory benchmark module
+
+# Code destined to comparing memory used by
+# legacy tree dict (one dict per path, keyed
+# by full path, reversed afterwards) against
+# columnar NodeStore, for the same nodes.
+
+######################################################################
+# imports
+
+# importing required libraries
+from os.path import join
+from os.path import dirname
+from tracemalloc import stop
+from tracemalloc import start
+from argparse import ArgumentParser
+from tracemalloc import get_traced_memory
+from pytree.utils.global_vars import FILE_TYPE
+from pytree.classes.NodeStore import NodeStore
+from pytree.utils.global_vars import FOLDER_TYPE
+
+######################################################################
+# defining auxiliary functions
+
+
+def get_args_dict() -> dict:
+    """
+    Parses the arguments and returns a dictionary of the arguments.
+    :return: Dictionary. Represents the parsed arguments.
+    """
+    # creating a parser instance
+    parser = ArgumentParser(description='benchmarks legacy tree dict against columnar node store memory usage')
+
+    # files num param
+    parser.add_argument('-n', '--files-num',
+                        dest='files_num',
+                        type=int,
+                        help='number of file nodes in synthetic tree',
+                        default=1_000_000)
+
+    # files per folder param
+    parser.add_argument('-f', '--files-per-folder',
+                        dest='files_per_folder',
+                        type=int,
+                        help='number of file nodes per synthetic folder',
+                        default=100)
+
+    # creating arguments dictionary
+    args_dict = vars(parser.parse_args())
+
+    # returning the arguments dictionary
+    return args_dict
+
+
+def get_synthetic_folders(root_path: str,
+                          files_num: int,
+                          files_per_folder: int
+                          ) -> list:
+    """
+    Given a root path and files num, returns list of
+    (folder_path, file_names) tuples, in bottom-up
+    order (as yielded by pytree walker).
+    """
+    # getting folders num
+    folders_num = -(-files_num // files_per_folder)
+
+    # getting synthetic folders (file names repeat across folders, as in real python trees)
+    synthetic_folders = [(join(root_path, f'package_{folder_index:06d}'),
+                          [f'module_{file_index:04d}.py' for file_index in range(files_per_folder)])
+                         for folder_index in range(folders_num)]
+
+    # returning synthetic folders
+    return synthetic_folders
+
+
+def build_legacy_dict(root_path: str,
+                      synthetic_folders: list
+                      ) -> dict:
+    """
+    Builds tree dict the way PyTree used to
+    (one description dict per path, keyed by
+    full path, reversed after scan).
+    """
+    # defining base tree dict
+    tree_dict = {}
+
+    # iterating over synthetic folders
+    for folder_path, file_names in synthetic_folders:
+
+        # iterating over folder files
+        for file_name in file_names:
+
+            # getting file path
+            file_path = join(folder_path, file_name)
+
+            # updating tree dict
+            tree_dict[file_path] = {'name': file_name,
+                                    'path': file_path,
+                                    'level': 2,
+                                    'parent': dirname(file_path),
+                                    'type': 'file',
+                                    'size': 1024,
+                                    'loc': 100,
+                                    'com': 10}
+
+        # updating tree dict
+        tree_dict[folder_path] = {'name': folder_path.split('/')[-1],
+                                  'path': folder_path,
+                                  'level': 1,
+                                  'parent': root_path,
+                                  'type': 'folder',
+                                  'size': 1024 * len(file_names),
+                                  'count': len(file_names),
+                                  'loc': 100 * len(file_names),
+                                  'com': 10 * len(file_names)}
+
+    # reversing dict (legacy per-path dicts were kept top-down, after being built bottom-up)
+    tree_dict = dict(reversed(tree_dict.items()))
+
+    # returning tree dict
+    return tree_dict
+
+
+def build_node_store(root_path: str,
+                     synthetic_folders: list
+                     ) -> NodeStore:
+    """
+    Builds columnar node store for
+    the same nodes as legacy dict.
+    """
+    # defining base node store
+    node_store = NodeStore(root_path=root_path,
+                           include_sizes=True,
+                           include_counts=True,
+                           include_loc=True)
+
+    # iterating over synthetic folders
+    for folder_path, file_names in synthetic_folders:
+
+        # adding file nodes
+        file_indices = [node_store.add_node(name=file_name,
+                                            level=2,
+                                            node_type=FILE_TYPE,
+                                            size=1024,
+                                            loc=100,
+                                            com=10)
+                        for file_name in file_names]
+
+        # adding folder node
+        folder_index = node_store.add_node(name=folder_path.split('/')[-1],
+                                           level=1,
+                                           node_type=FOLDER_TYPE,
+                                           size=1024 * len(file_names),
+                                           count=len(file_names),
+                                           loc=100 * len(file_names),
+                                           com=10 * len(file_names))
+
+        # iterating over file indices
+        for file_index in file_indices:
+
+            # updating file parent
+            node_store.set_parent(node_index=file_index,
+                                  parent_index=folder_index)
+
+    # returning node store
+    return node_store
+
+
+def get_memory_usage(build_function,
+                     root_path: str,
+                     files_num: int,
+                     files_per_folder: int
+                     ) -> tuple:
+    """
+    Given a build function, returns (retained, peak)
+    memory in bytes allocated while building structure
+    (synthetic input is generated inside traced region,
+    but freed before retained memory is measured).
+    """
+    # starting memory tracing
+    start()
+
+    # getting synthetic folders (mimicking walker output, freed once scanned)
+    synthetic_folders = get_synthetic_folders(root_path=root_path,
+                                              files_num=files_num,
+                                              files_per_folder=files_per_folder)
+
+    # building structure
+    structure = build_function(root_path=root_path,
+                               synthetic_folders=synthetic_folders)
+
+    # freeing synthetic input
+    del synthetic_folders
+
+    # getting traced memory
+    retained_memory, peak_memory = get_traced_memory()
+
+    # stopping memory tracing
+    stop()
+
+    # freeing structure
+    del structure
+
+    # assembling memory tuple
+    memory_tuple = (retained_memory, peak_memory)
+
+    # returning memory tuple
+    return memory_tuple
+
+######################################################################
+# defining main function
+
+
+def main():
+    """Runs main code."""
+    # getting args dict
+    args_dict = get_args_dict()
+    files_num = args_dict['files_num']
+    files_per_folder = args_dict['files_per_folder']
+
+    # defining synthetic root path
+    root_path = '/synthetic/tree/root'
+
+    # getting memory usage
+    legacy_retained, legacy_peak = get_memory_usage(build_function=build_legacy_dict,
+                                                    root_path=root_path,
+                                                    files_num=files_num,
+                                                    files_per_folder=files_per_folder)
+    store_retained, store_peak = get_memory_usage(build_function=build_node_store,
+                                                  root_path=root_path,
+                                                  files_num=files_num,
+                                                  files_per_folder=files_per_folder)
+
+    # printing results
+    print(f'legacy tree dict: {legacy_retained / 2 ** 20:.1f} mb retained, {legacy_peak / 2 ** 20:.1f} mb peak')
+    print(f'node store: {store_retained / 2 ** 20:.1f} mb retained, {store_peak / 2 ** 20:.1f} mb peak')
+    print(f'reduction: {legacy_retained / store_retained:.1f}x retained, {legacy_peak / store_peak:.1f}x peak')
+
+######################################################################
+# running main function
+
+
+if __name__ == '__main__':
+    main()
+
+######################################################################
+# end of current module
@@ -0,0 +1,210 @@
+# render benchmark module
+
+# Code destined to comparing treelib based
+# rendering (treelib.Tree creation + show, as
+# PyTree used to) against streaming TreeRenderer,
+# for the same synthetic node store (requires
+# treelib, which pytree no longer depends on).
+
+######################################################################
+# imports
+
+# importing required libraries
+from os import devnull
+from tracemalloc import stop
+from tracemalloc import start
+from time import perf_counter
+from typing import TYPE_CHECKING
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from pytree.classes.PyTree import PyTree
+from tracemalloc import get_traced_memory
+from memory_benchmark import build_node_store
+from pytree.utils.global_vars import NO_PARENT
+from pytree.utils.global_vars import FOLDER_TYPE
+from memory_benchmark import get_synthetic_folders
+
+# importing type checking only libraries
+if TYPE_CHECKING:
+    from treelib import Tree
+
+######################################################################
+# defining auxiliary functions
+
+
+def get_args_dict() -> dict:
+    """
+    Parses the arguments and returns a dictionary of the arguments.
+    :return: Dictionary. Represents the parsed arguments.
+    """
+    # creating a parser instance
+    parser = ArgumentParser(description='benchmarks treelib against streaming tree rendering')
+
+    # files num param
+    parser.add_argument('-n', '--files-num',
+                        dest='files_num',
+                        type=int,
+                        help='number of file nodes in synthetic tree',
+                        default=200_000)
+
+    # creating arguments dictionary
+    args_dict = vars(parser.parse_args())
+
+    # returning the arguments dictionary
+    return args_dict
+
+
+def get_treelib_tree(pytree: PyTree) -> 'Tree':
+    """
+    Converts pytree node store into a
+    treelib.Tree object (the way PyTree
+    used to, before TreeRenderer).
+    """
+    # importing treelib (only required by this benchmark)
+    from treelib import Tree
+
+    # getting node store
+    tree_dict = pytree.tree_dict
+
+    # defining base tree
+    tree = Tree()
+
+    # iterating over node indices (top-down)
+    for node_index in tree_dict.get_ordered_indices():
+
+        # getting path tag
+        path_tag = pytree.get_path_tag(node_index=node_index,
+                                       path_is_file=tree_dict.is_file(node_index=node_index))
+
+        # getting parent index (root is created without parent)
+        parent_index = tree_dict.parents[node_index]
+
+        # creating current node
+        tree.create_node(tag=path_tag,
+                         identifier=node_index,
+                         parent=None if parent_index == NO_PARENT else parent_index)
+
+    # returning tree
+    return tree
+
+
+def treelib_show(pytree: PyTree) -> None:
+    """
+    Shows tree the way PyTree used to
+    (treelib.Tree creation + show).
+    """
+    # getting tree
+    tree = get_treelib_tree(pytree=pytree)
+
+    # showing tree
+    tree.show()
+
+
+def renderer_show(pytree: PyTree) -> None:
+    """
+    Shows tree with streaming renderer.
+    """
+    # getting tree renderer
+    tree_renderer = pytree.get_tree_renderer(tree_dict=pytree.tree_dict)
+
+    # showing tree
+    tree_renderer.show()
+
+
+def get_show_usage(show_function,
+                   pytree: PyTree
+                   ) -> tuple:
+    """
+    Given a show function, returns (time, peak memory)
+    used to show tree (output is discarded).
+    """
+    # opening null output
+    with open(devnull, 'w') as null_file, redirect_stdout(null_file):
+
+        # starting memory tracing
+        start()
+
+        # timing show function
+        start_time = perf_counter()
+        show_function(pytree=pytree)
+        show_time = perf_counter() - start_time
+
+        # getting traced memory
+        _, peak_memory = get_traced_memory()
+
+        # stopping memory tracing
+        stop()
+
+    # assembling usage tuple
+    usage_tuple = (show_time, peak_memory)
+
+    # returning usage tuple
+    return usage_tuple
+
+######################################################################
+# defining main function
+
+
+def main():
+    """Runs main code."""
+    # getting args dict
+    args_dict = get_args_dict()
+    files_num = args_dict['files_num']
+
+    # defining synthetic root path
+    root_path = '/synthetic/tree/root'
+
+    # getting pytree instance (only used for its rendering methods)
+    pytree = PyTree(start_path=root_path,
+                    dirs_only=False,
+                    include_counts=True,
+                    include_sizes=True,
+                    extension=None,
+                    keyword=None,
+                    level=-1,
+                    loc=True,
+                    output_path=None,
+                    quiet=True)
+
+    # getting node store
+    synthetic_folders = get_synthetic_folders(root_path=root_path,
+                                              files_num=files_num,
+                                              files_per_folder=100)
+    pytree.tree_dict = build_node_store(root_path=root_path,
+                                        synthetic_folders=synthetic_folders)
+
+    # adding synthetic root folder node (synthetic folders have no parent)
+    root_index = pytree.tree_dict.add_node(name='root',
+                                           level=0,
+                                           node_type=FOLDER_TYPE)
+
+    # iterating over synthetic nodes
+    for node_index in range(root_index):
+
+        # checking whether node is a synthetic folder
+        if pytree.tree_dict.levels[node_index] == 1:
+
+            # updating folder parent
+            pytree.tree_dict.set_parent(node_index=node_index,
+                                        parent_index=root_index)
+
+    # getting usages
+    treelib_time, treelib_peak = get_show_usage(show_function=treelib_show,
+                                                pytree=pytree)
+    renderer_time, renderer_peak = get_show_usage(show_function=renderer_show,
+                                                  pytree=pytree)
+
+    # printing results
+    print(f'{len(pytree.tree_dict)} nodes')
+    print(f'treelib: {treelib_time:.2f}s, {treelib_peak / 2 ** 20:.1f} mb peak')
+    print(f'renderer: {renderer_time:.2f}s, {renderer_peak / 2 ** 20:.1f} mb peak')
+
+######################################################################
+# running main function
+
+
+if __name__ == '__main__':
+    main()
+
+######################################################################
+# end of current module
@@ -0,0 +1,196 @@
+# startup benchmark module
+
+# Code destined to timing pytree cli startup
+# (interpreter start, imports and small tree
+# scans), checking it against a target time.
+
+######################################################################
+# imports
+
+# importing required libraries
+from os import read
+from os import close
+from os import openpty
+from os.path import join
+from sys import executable
+from threading import Thread
+from subprocess import Popen
+from statistics import median
+from time import perf_counter
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from tree_generators import create_flat_tree
+
+######################################################################
+# defining auxiliary functions
+
+
+def get_args_dict() -> dict:
+    """
+    Parses the arguments and returns a dictionary of the arguments.
+    :return: Dictionary. Represents the parsed arguments.
+    """
+    # creating a parser instance
+    parser = ArgumentParser(description='benchmarks pytree cli startup time on a small synthetic tree')
+
+    # files num param
+    parser.add_argument('-n', '--files-num',
+                        dest='files_num',
+                        type=int,
+                        help='number of files in synthetic tree',
+                        default=100)
+
+    # repeats param
+    parser.add_argument('-r', '--repeats',
+                        dest='repeats',
+                        type=int,
+                        help='number of timed runs per command',
+                        default=10)
+
+    # target param
+    parser.add_argument('-t', '--target',
+                        dest='target',
+                        type=float,
+                        help='target cli run time for small trees, in milliseconds',
+                        default=100.0)
+
+    # creating arguments dictionary
+    args_dict = vars(parser.parse_args())
+
+    # returning the arguments dictionary
+    return args_dict
+
+
+def drain_fd(fd: int) -> None:
+    """
+    Reads given file descriptor until
+    it is closed (so that child process
+    never blocks on a full terminal).
+    """
+    # reading until end of file (or error, once terminal is closed)
+    try:
+        while read(fd, 65536):
+            pass
+    except OSError:
+        pass
+
+
+def time_command(command: list,
+                 repeats: int
+                 ) -> list:
+    """
+    Given a command, runs it on a pseudo
+    terminal (cli progress requires a tty),
+    returning run times (in milliseconds).
+    """
+    # defining placeholder value for run times
+    run_times = []
+
+    # iterating over repeats
+    for _ in range(repeats):
+
+        # opening pseudo terminal
+        master_fd, slave_fd = openpty()
+
+        # starting drain thread
+        drain_thread = Thread(target=drain_fd,
+                              args=(master_fd,),
+                              daemon=True)
+        drain_thread.start()
+
+        # timing command
+        start_time = perf_counter()
+        process = Popen(command,
+                        stdin=slave_fd,
+                        stdout=slave_fd,
+                        stderr=slave_fd)
+        process.wait()
+        run_time = (perf_counter() - start_time) * 1000
+
+        # closing pseudo terminal
+        close(slave_fd)
+        drain_thread.join(timeout=1)
+        close(master_fd)
+
+        # checking return code
+        if process.returncode != 0:
+
+            # raising runtime error
+            raise RuntimeError(f'command failed: {" ".join(command)}')
+
+        # appending run time to list
+        run_times.append(run_time)
+
+    # returning run times
+    return run_times
+
+######################################################################
+# defining main function
+
+
+def main():
+    """Runs main code."""
+    # getting args dict
+    args_dict = get_args_dict()
+    files_num = args_dict['files_num']
+    repeats = args_dict['repeats']
+    target = args_dict['target']
+
+    # creating temporary folder
+    with TemporaryDirectory() as temp_path:
+
+        # creating synthetic tree
+        tree_path = join(temp_path, 'tree')
+        create_flat_tree(root_path=tree_path,
+                         files_num=files_num,
+                         files_per_folder=10)
+        output_path = join(temp_path, 'tree.csv')
+
+        # defining commands (pandas is only imported by output table run)
+        commands = {'python (baseline)': [executable, '-c', 'pass'],
+                    'import pytree.main': [executable, '-c', 'import pytree.main'],
+                    'pytree': [executable, '-m', 'pytree.main', tree_path],
+                    'pytree -s -c': [executable, '-m', 'pytree.main', tree_path, '-s', '-c'],
+                    'pytree -o (pandas)': [executable, '-m', 'pytree.main', tree_path, '-o', output_path]}
+
+        # defining placeholder value for small tree run times
+        tree_times = []
+
+        # iterating over commands
+        for command_name, command in commands.items():
+
+            # warming up (file system cache, compiled modules)
+            time_command(command=command,
+                         repeats=1)
+
+            # timing command
+            run_times = time_command(command=command,
+                                     repeats=repeats)
+            best_time = min(run_times)
+            median_time = median(run_times)
+
+            # printing results
+            print(f'{command_name}: best {best_time:.1f}ms, median {median_time:.1f}ms')
+
+            # checking whether command is a plain small tree run
+            if command_name in ('pytree', 'pytree -s -c'):
+
+                # appending median time to list
+                tree_times.append(median_time)
+
+    # checking target
+    worst_time = max(tree_times)
+    status = 'PASS' if worst_time < target else 'FAIL'
+
+    # printing target check
+    print(f'small tree ({files_num} files) runs: {worst_time:.1f}ms (target <{target:.0f}ms): {status}')
+
+######################################################################
+# running main function
+
+
+if __name__ == '__main__':
+    main()
+
+######################################################################
+# end of current module
@@ -0,0 +1,451 @@
+# suite benchmark module
+
+# Code destined to timing each phase of
+# PyTree.run (scan, tree, table, save, show)
+# on synthetic trees of different shapes,
+# recording results to a json history, so
+# that versions can be compared.
+
+######################################################################
+# imports
+
+# importing required libraries
+from json import load
+from json import dump
+from os import devnull
+from sys import version
+from os.path import join
+from os.path import exists
+from subprocess import run
+from os.path import dirname
+from os.path import abspath
+from platform import platform
+from datetime import datetime
+from tempfile import gettempdir
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from multiprocessing import get_context
+from tree_generators import create_deep_tree
+from tree_generators import create_flat_tree
+from tree_generators import create_wide_tree
+from tree_generators import create_sparse_tree
+from tree_generators import create_python_tree
+
+######################################################################
+# defining global variables
+
+# tree shapes (generator, generator kwargs, kwargs scaled by scale factor)
+SHAPES = {'wide': (create_wide_tree, {'folders_num': 20_000, 'files_per_folder': 5}, ['folders_num']),
+          'deep': (create_deep_tree, {'depth': 200, 'chains_num': 50, 'files_per_folder': 2}, ['chains_num']),
+          'tiny': (create_flat_tree, {'files_num': 200_000, 'files_per_folder': 100, 'file_size': 16}, ['files_num']),
+          'sparse': (create_sparse_tree, {'files_num': 100, 'file_size': 2 ** 30}, ['files_num']),
+          'python': (create_python_tree, {'files_num': 2_000, 'functions_per_file': 20}, ['files_num'])}
+
+# benchmark cases (tree shape, scan kwargs)
+CASES = {'wide': ('wide', {}),
+         'deep': ('deep', {}),
+         'tiny': ('tiny', {}),
+         'sparse': ('sparse', {}),
+         'sparse-allocated': ('sparse', {'size_mode': 'allocated'}),
+         'python-loc': ('python', {'loc': True})}
+
+# phases shown on results lines (in run order)
+PHASES = ['scan', 'tree', 'table', 'save', 'show']
+
+######################################################################
+# defining auxiliary functions
+
+
+def get_args_dict() -> dict:
+    """
+    Parses the arguments and returns a dictionary of the arguments.
+    :return: Dictionary. Represents the parsed arguments.
+    """
+    # creating a parser instance
+    parser = ArgumentParser(description='benchmarks pytree run phases on synthetic trees, recording results to a json history')
+
+    # cases param
+    parser.add_argument('-c', '--cases',
+                        dest='cases',
+                        type=str,
+                        nargs='+',
+                        choices=list(CASES),
+                        help='benchmark cases to run (all by default)',
+                        default=list(CASES))
+
+    # scale param
+    parser.add_argument('-x', '--scale',
+                        dest='scale',
+                        type=float,
+                        help='scale factor applied to synthetic trees sizes',
+                        default=1.0)
+
+    # repeats param
+    parser.add_argument('-r', '--repeats',
+                        dest='repeats',
+                        type=int,
+                        help='number of timed runs per case (fastest run is kept)',
+                        default=3)
+
+    # workers param
+    parser.add_argument('-w', '--workers',
+                        dest='workers',
+                        type=int,
+                        help='number of workers used by scans',
+                        default=1)
+
+    # trees path param
+    parser.add_argument('-t', '--trees-path',
+                        dest='trees_path',
+                        type=str,
+                        help='path to synthetic trees (created if non-existent, reused otherwise)',
+                        default=join(gettempdir(), 'pytree_benchmark_suite'))
+
+    # history path param
+    parser.add_argument('-hp', '--history-path',
+                        dest='history_path',
+                        type=str,
+                        help='path to json history file (results are appended to it)',
+                        default=join(dirname(abspath(__file__)), 'benchmark_history.json'))
+
+    # label param
+    parser.add_argument('-l', '--label',
+                        dest='label',
+                        type=str,
+                        help='label recorded along with results (e.g. branch or change name)',
+                        default=None)
+
+    # creating arguments dictionary
+    args_dict = vars(parser.parse_args())
+
+    # returning the arguments dictionary
+    return args_dict
+
+
+def get_tree_path(shape_name: str,
+                  scale: float,
+                  trees_path: str
+                  ) -> str:
+    """
+    Given a shape name and scale factor, returns
+    path to respective synthetic tree, creating
+    it if required (trees are deterministic,
+    so existing trees are reused).
+    """
+    # getting tree path
+    tree_path = join(trees_path, f'{shape_name}_{scale:g}')
+
+    # getting complete marker path (kept outside tree, so that it isn't scanned)
+    marker_path = f'{tree_path}.complete'
+
+    # checking whether tree was already created
+    if exists(marker_path):
+
+        # returning tree path
+        return tree_path
+
+    # getting shape generator/kwargs
+    generator, generator_kwargs, scaled_kwargs = SHAPES[shape_name]
+
+    # scaling generator kwargs
+    generator_kwargs = {kwarg: max(1, int(value * scale)) if kwarg in scaled_kwargs else value
+                        for kwarg, value
+                        in generator_kwargs.items()}
+
+    # creating synthetic tree
+    print(f'creating {shape_name} tree at "{tree_path}"...')
+    generator(root_path=tree_path,
+              **generator_kwargs)
+
+    # creating complete marker (interrupted trees are created again)
+    with open(marker_path, 'w') as open_file:
+        open_file.write('')
+
+    # returning tree path
+    return tree_path
+
+
+def run_case(tree_path: str,
+             scan_kwargs: dict,
+             workers: int
+             ) -> dict:
+    """
+    Given a tree path and scan kwargs, scans tree
+    (saving output table and rendering tree to
+    devnull), returning profile dict.
+    Runs in a fresh process (see time_case), so
+    that imports and peak rss are not shared
+    between cases.
+    """
+    # importing pytree (inside fresh process)
+    from pytree import scan
+
+    # creating temporary folder
+    with TemporaryDirectory() as temp_path:
+
+        # scanning tree (table/save phases are recorded since output path is given)
+        scan_result = scan(path=tree_path,
+                           workers=workers,
+                           output_path=join(temp_path, 'tree.csv'),
+                           profile=True,
+                           **scan_kwargs)
+
+    # getting profiler
+    profiler = scan_result.pytree.profiler
+
+    # recording show phase (tree is rendered as cli would print it)
+    with profiler.phase(phase_name='show'):
+        with open(devnull, 'w') as open_file:
+            scan_result.render(output_file=open_file)
+
+    # getting profile dict
+    profile_dict = profiler.get_profile_dict()
+
+    # returning profile dict
+    return profile_dict
+
+
+def time_case(tree_path: str,
+              scan_kwargs: dict,
+              workers: int,
+              repeats: int
+              ) -> dict:
+    """
+    Given a tree path and scan kwargs, runs case
+    on a fresh process per repeat, returning
+    fastest run results (phases, peak rss).
+    """
+    # defining placeholder value for profile dicts
+    profile_dicts = []
+
+    # getting spawn context (fresh interpreter per run)
+    spawn_context = get_context('spawn')
+
+    # iterating over repeats
+    for _ in range(repeats):
+
+        # running case on a fresh process
+        with spawn_context.Pool(processes=1) as pool:
+            profile_dict = pool.apply(run_case,
+                                      kwds={'tree_path': tree_path,
+                                            'scan_kwargs': scan_kwargs,
+                                            'workers': workers})
+
+        # appending profile dict to list
+        profile_dicts.append(profile_dict)
+
+    # getting fastest run
+    best_profile_dict = min(profile_dicts,
+                            key=lambda profile: profile['wall_time'])
+
+    # assembling case results
+    case_results = {'wall_time': best_profile_dict['wall_time'],
+                    'peak_rss': best_profile_dict['peak_rss'],
+                    'phases': {phase_profile['phase']: {'wall_time': phase_profile['wall_time'],
+                                                        'cpu_time': phase_profile['cpu_time'],
+                                                        'entries': phase_profile['entries'],
+                                                        'entries_per_second': phase_profile['entries_per_second'],
+                                                        'operations': phase_profile['operations']}
+                               for phase_profile
+                               in best_profile_dict['phases']}}
+
+    # returning case results
+    return case_results
+
+
+def get_commit() -> str | None:
+    """
+    Returns current git commit short
+    hash (or None, if not available).
+    """
+    # getting commit (git may not be installed, or tree may not be a repository)
+    try:
+        completed_process = run(['git', 'rev-parse', '--short', 'HEAD'],
+                                cwd=dirname(abspath(__file__)),
+                                capture_output=True,
+                                text=True)
+    except OSError:
+        return None
+
+    # getting commit (None if command failed)
+    commit = completed_process.stdout.strip() if completed_process.returncode == 0 else None
+
+    # returning commit
+    return commit
+
+
+def read_history(history_path: str) -> list:
+    """
+    Given a path to a json history
+    file, returns history runs list
+    (empty if file doesn't exist).
+    """
+    # checking whether history file exists
+    if not exists(history_path):
+
+        # returning empty history
+        return []
+
+    # reading history file
+    with open(history_path, 'r') as open_file:
+        history = load(open_file)
+
+    # returning history
+    return history
+
+
+def get_previous_run(history: list,
+                     scale: float,
+                     workers: int
+                     ) -> dict | None:
+    """
+    Given history runs list, returns latest
+    run with same scale/workers (or None,
+    if there is no comparable run).
+    """
+    # iterating over history runs (latest first)
+    for history_run in reversed(history):
+
+        # checking whether run is comparable
+        if history_run['scale'] == scale and history_run['workers'] == workers:
+
+            # returning previous run
+            return history_run
+
+    # returning None (no comparable run)
+    return None
+
+
+def get_case_line(case_name: str,
+                  case_results: dict,
+                  previous_run: dict | None
+                  ) -> str:
+    """
+    Given a case name and results, returns results
+    line (phases times, scan entries/s, peak rss,
+    and total time change against previous run).
+    """
+    # getting case phases
+    phases = case_results['phases']
+
+    # assembling case line
+    case_line = f'{case_name}:'
+
+    # iterating over phases
+    for phase_name in PHASES:
+
+        # checking whether phase was recorded
+        if phase_name in phases:
+
+            # updating case line
+            case_line += f' {phase_name} {phases[phase_name]["wall_time"]:.3f}s |'
+
+    # checking whether scan entries/s was obtained
+    if phases.get('scan', {}).get('entries_per_second') is not None:
+
+        # updating case line
+        case_line += f' {round(phases["scan"]["entries_per_second"])} entries/s |'
+
+    # updating case line
+    case_line += f' total {case_results["wall_time"]:.3f}s'
+
+    # checking whether peak rss was obtained
+    if case_results['peak_rss'] is not None:
+
+        # updating case line
+        case_line += f' | peak rss {case_results["peak_rss"] / 1024 ** 2:.0f} mb'
+
+    # getting previous case results
+    previous_results = None if previous_run is None else previous_run['cases'].get(case_name)
+
+    # checking whether previous results exist
+    if previous_results is not None:
+
+        # getting total time change
+        time_change = (case_results['wall_time'] / previous_results['wall_time'] - 1) * 100
+
+        # updating case line
+        case_line += f' ({time_change:+.1f}% vs {previous_run["commit"] or previous_run["timestamp"]})'
+
+    # returning case line
+    return case_line
+
+######################################################################
+# defining main function
+
+
+def main():
+    """Runs main code."""
+    # getting args dict
+    args_dict = get_args_dict()
+    cases = args_dict['cases']
+    scale = args_dict['scale']
+    repeats = args_dict['repeats']
+    workers = args_dict['workers']
+    trees_path = args_dict['trees_path']
+    history_path = args_dict['history_path']
+    label = args_dict['label']
+
+    # getting history and previous comparable run
+    history = read_history(history_path=history_path)
+    previous_run = get_previous_run(history=history,
+                                    scale=scale,
+                                    workers=workers)
+
+    # assembling current run
+    current_run = {'timestamp': datetime.now().isoformat(timespec='seconds'),
+                   'commit': get_commit(),
+                   'label': label,
+                   'python': version.split()[0],
+                   'platform': platform(),
+                   'scale': scale,
+                   'workers': workers,
+                   'repeats': repeats,
+                   'cases': {}}
+
+    # iterating over cases
+    for case_name in cases:
+
+        # getting case shape/scan kwargs
+        shape_name, scan_kwargs = CASES[case_name]
+
+        # getting tree path
+        tree_path = get_tree_path(shape_name=shape_name,
+                                  scale=scale,
+                                  trees_path=trees_path)
+
+        # timing case
+        case_results = time_case(tree_path=tree_path,
+                                 scan_kwargs=scan_kwargs,
+                                 workers=workers,
+                                 repeats=repeats)
+
+        # updating current run
+        current_run['cases'][case_name] = case_results
+
+        # printing results
+        print(get_case_line(case_name=case_name,
+                            case_results=case_results,
+                            previous_run=previous_run))
+
+    # updating history
+    history.append(current_run)
+
+    # saving history
+    with open(history_path, 'w') as open_file:
+        dump(history,
+             open_file,
+             indent=2)
+
+    # printing history message
+    print(f'Saved results to "{history_path}" ({len(history)} runs)')
+
+######################################################################
+# running main function
+
+
+if __name__ == '__main__':
+    main()
+
+######################################################################
+# end of current module
@@ -0,0 +1,222 @@
+# tree generators module
+
+# Code destined to generating synthetic
+# folder trees used by benchmarks.
+
+######################################################################
+# imports
+
+# importing required libraries
+from os import makedirs
+from os.path import join
+
+######################################################################
+# defining global variables
+
+PYTHON_MODULE_TEMPLATE = '''# generated module
+
+"""
+Generated module docstring.
+"""
+import os  # inline comment
+
+
+def function_{index}(first_arg,
+               second_arg):
+    """
+    Generated function docstring.
+    """
+    # standalone comment
+    values = [first_arg,
+              second_arg]
+    return {{'sum': sum(values),
+            'path': os.sep}}
+
+'''
+
+######################################################################
+# defining auxiliary functions
+
+
+def create_file(file_path: str,
+                file_size: int = 0
+                ) -> None:
+    """
+    Given a file path and size,
+    creates file filled with
+    given number of bytes.
+    """
+    # writing file
+    with open(file_path, 'wb') as open_file:
+
+        # writing file content
+        open_file.write(b'x' * file_size)
+
+
+def create_flat_tree(root_path: str,
+                     files_num: int,
+                     files_per_folder: int = 1000,
+                     file_size: int = 0
+                     ) -> None:
+    """
+    Given a root path, creates a two level tree
+    containing files_num files, split into
+    folders of files_per_folder files each.
+    """
+    # iterating over files
+    for file_index in range(files_num):
+
+        # getting current folder index
+        folder_index = file_index // files_per_folder
+
+        # getting current folder path
+        folder_path = join(root_path,
+                           f'folder_{folder_index:06d}')
+
+        # checking whether current file is first in folder
+        if file_index % files_per_folder == 0:
+
+            # creating folder
+            makedirs(folder_path,
+                     exist_ok=True)
+
+        # getting current file path
+        file_path = join(folder_path,
+                         f'file_{file_index:08d}.txt')
+
+        # creating file
+        create_file(file_path=file_path,
+                    file_size=file_size)
+
+
+def create_python_tree(root_path: str,
+                       files_num: int,
+                       files_per_folder: int = 100,
+                       functions_per_file: int = 20
+                       ) -> None:
+    """
+    Given a root path, creates a two level tree
+    containing files_num python modules, each
+    with functions_per_file generated functions.
+    """
+    # getting module text
+    functions = [PYTHON_MODULE_TEMPLATE.format(index=index) for index in range(functions_per_file)]
+    module_text = ''.join(functions)
+
+    # iterating over files
+    for file_index in range(files_num):
+
+        # getting current folder index
+        folder_index = file_index // files_per_folder
+
+        # getting current folder path
+        folder_path = join(root_path,
+                           f'package_{folder_index:06d}')
+
+        # checking whether current file is first in folder
+        if file_index % files_per_folder == 0:
+
+            # creating folder
+            makedirs(folder_path,
+                     exist_ok=True)
+
+        # getting current file path
+        file_path = join(folder_path,
+                         f'module_{file_index:08d}.py')
+
+        # writing module
+        with open(file_path, 'w') as open_file:
+            open_file.write(module_text)
+
+
+
+def create_wide_tree(root_path: str,
+                     folders_num: int,
+                     files_per_folder: int = 5
+                     ) -> None:
+    """
+    Given a root path, creates a wide (flat)
+    tree, containing folders_num folders right
+    under root, each with files_per_folder
+    empty files.
+    """
+    # iterating over folders
+    for folder_index in range(folders_num):
+
+        # getting current folder path
+        folder_path = join(root_path,
+                           f'folder_{folder_index:06d}')
+
+        # creating folder
+        makedirs(folder_path,
+                 exist_ok=True)
+
+        # iterating over files
+        for file_index in range(files_per_folder):
+
+            # creating file
+            create_file(file_path=join(folder_path, f'file_{file_index:04d}.txt'))
+
+
+def create_deep_tree(root_path: str,
+                     depth: int,
+                     chains_num: int = 1,
+                     files_per_folder: int = 1
+                     ) -> None:
+    """
+    Given a root path, creates a deep (narrow)
+    tree, containing chains_num chains of depth
+    nested folders, each folder holding
+    files_per_folder empty files.
+    """
+    # iterating over chains
+    for chain_index in range(chains_num):
+
+        # getting chain root path
+        folder_path = join(root_path,
+                           f'chain_{chain_index:04d}')
+
+        # iterating over levels
+        for _ in range(depth):
+
+            # getting current folder path (short names, so that deep paths stay below path length limits)
+            folder_path = join(folder_path, 'd')
+
+            # creating folder
+            makedirs(folder_path,
+                     exist_ok=True)
+
+            # iterating over files
+            for file_index in range(files_per_folder):
+
+                # creating file
+                create_file(file_path=join(folder_path, f'f{file_index}.txt'))
+
+
+def create_sparse_tree(root_path: str,
+                       files_num: int,
+                       file_size: int
+                       ) -> None:
+    """
+    Given a root path, creates a tree containing
+    files_num sparse files of file_size bytes
+    each (apparent size only, no blocks are
+    allocated on file systems supporting holes).
+    """
+    # creating root folder
+    makedirs(root_path,
+             exist_ok=True)
+
+    # iterating over files
+    for file_index in range(files_num):
+
+        # getting current file path
+        file_path = join(root_path,
+                         f'sparse_{file_index:04d}.bin')
+
+        # creating sparse file (truncating extends file with a hole)
+        with open(file_path, 'wb') as open_file:
+            open_file.truncate(file_size)
+
+######################################################################
+# end of current module
@@ -0,0 +1,217 @@
+# walk benchmark module
+
+# Code destined to comparing os.walk based
+# traversal (with per entry getsize/islink
+# calls) against scandir based walk_entries
+# (sequential and thread pool based).
+
+######################################################################
+# imports
+
+# importing required libraries
+from os import walk
+from os.path import join
+from os.path import exists
+from os.path import islink
+from os.path import getsize
+from time import perf_counter
+from functools import partial
+from tempfile import gettempdir
+from argparse import ArgumentParser
+from tree_generators import create_flat_tree
+from pytree.utils.aux_funcs import walk_entries
+from pytree.utils.aux_funcs import get_walk_executor
+
+######################################################################
+# defining auxiliary functions
+
+
+def get_args_dict() -> dict:
+    """
+    Parses the arguments and returns a dictionary of the arguments.
+    :return: Dictionary. Represents the parsed arguments.
+    """
+    # creating a parser instance
+    parser = ArgumentParser(description='benchmarks os.walk against pytree scandir walker')
+
+    # files num param
+    parser.add_argument('-n', '--files-num',
+                        dest='files_num',
+                        type=int,
+                        help='number of files in synthetic tree',
+                        default=1_000_000)
+
+    # tree path param
+    parser.add_argument('-t', '--tree-path',
+                        dest='tree_path',
+                        type=str,
+                        help='path to synthetic tree (created if non-existent)',
+                        default=None)
+
+    # workers param
+    parser.add_argument('-w', '--workers',
+                        dest='workers',
+                        type=int,
+                        help='number of threads used by parallel walk_entries run',
+                        default=8)
+
+    # repeats param
+    parser.add_argument('-r', '--repeats',
+                        dest='repeats',
+                        type=int,
+                        help='number of timed runs per walker',
+                        default=3)
+
+    # creating arguments dictionary
+    args_dict = vars(parser.parse_args())
+
+    # returning the arguments dictionary
+    return args_dict
+
+
+def os_walk_sizes(start_path: str) -> int:
+    """
+    Walks tree the way PyTree used to (os.walk +
+    islink per folder + getsize per file),
+    returning total size.
+    """
+    # defining placeholder value for total size
+    total_size = 0
+
+    # iterating over folders/subfolders/files
+    for folder_path, subfolders, files in walk(start_path, topdown=False):
+
+        # iterating over subfolders
+        for subfolder_name in subfolders:
+
+            # checking symlink (as get_skip_folder did)
+            islink(join(folder_path, subfolder_name))
+
+        # iterating over files
+        for file_name in files:
+
+            # updating total size
+            total_size += getsize(join(folder_path, file_name))
+
+    # returning total size
+    return total_size
+
+
+def walk_entries_sizes(start_path: str,
+                       workers: int = 1
+                       ) -> int:
+    """
+    Walks tree using walk_entries, reusing
+    DirEntry cached info, returning total size.
+    """
+    # defining placeholder value for total size
+    total_size = 0
+
+    # getting walk executor
+    with get_walk_executor(workers=workers) as executor:
+
+        # getting folders/subfolders/files in start path
+        folders_subfolders_files = walk_entries(start_path=start_path,
+                                                stat_files=True,
+                                                executor=executor)
+
+        # iterating over folders/subfolders/files
+        for _, _, files in folders_subfolders_files:
+
+            # iterating over files
+            for file_entry in files:
+
+                # updating total size
+                total_size += file_entry.stat().st_size
+
+    # returning total size
+    return total_size
+
+
+def time_function(function: callable,  # noqa
+                  start_path: str,
+                  repeats: int
+                  ) -> float:
+    """
+    Given a walk function, returns its
+    best run time over given repeats.
+    """
+    # defining placeholder value for run times
+    run_times = []
+
+    # iterating over repeats
+    for _ in range(repeats):
+
+        # timing function
+        start_time = perf_counter()
+        function(start_path)
+        run_time = perf_counter() - start_time
+
+        # appending run time to list
+        run_times.append(run_time)
+
+    # getting best run time
+    best_time = min(run_times)
+
+    # returning best run time
+    return best_time
+
+######################################################################
+# defining main function
+
+
+def main():
+    """Runs main code."""
+    # getting args dict
+    args_dict = get_args_dict()
+    files_num = args_dict['files_num']
+    tree_path = args_dict['tree_path']
+    repeats = args_dict['repeats']
+    workers = args_dict['workers']
+
+    # checking whether tree path was given
+    if tree_path is None:
+
+        # defining default tree path
+        tree_path = join(gettempdir(), f'pytree_walk_benchmark_{files_num}')
+
+    # checking whether tree already exists
+    if not exists(tree_path):
+
+        # creating synthetic tree
+        print(f'creating synthetic tree with {files_num} files at "{tree_path}"...')
+        create_flat_tree(root_path=tree_path,
+                         files_num=files_num)
+
+    # warming up file system cache
+    os_walk_sizes(tree_path)
+
+    # timing walkers
+    os_walk_time = time_function(function=os_walk_sizes,
+                                 start_path=tree_path,
+                                 repeats=repeats)
+    walk_entries_time = time_function(function=walk_entries_sizes,
+                                      start_path=tree_path,
+                                      repeats=repeats)
+    parallel_walk_function = partial(walk_entries_sizes,
+                                     workers=workers)
+    parallel_walk_time = time_function(function=parallel_walk_function,
+                                       start_path=tree_path,
+                                       repeats=repeats)
+
+    # printing results
+    print(f'os.walk + getsize/islink: {os_walk_time:.3f}s')
+    print(f'walk_entries (scandir):   {walk_entries_time:.3f}s')
+    print(f'walk_entries ({workers} threads): {parallel_walk_time:.3f}s')
+    print(f'speedup (scandir): {os_walk_time / walk_entries_time:.2f}x')
+    print(f'speedup (scandir + threads): {os_walk_time / parallel_walk_time:.2f}x')
+
+######################################################################
+# running main function
+
+
+if __name__ == '__main__':
+    main()
+
+######################################################################
+# end of current module
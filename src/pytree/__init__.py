@@ -1 +1,44 @@
-# pytree/__init__.py
\ No newline at end of file
+# pytree/__init__.py
+
+# Code destined to exposing library api
+# (pytree.scan, pytree.ScanResult), imported
+# on first access, so that cli startup (pytree.main)
+# does not import it through the package.
+
+######################################################################
+# defining library api attributes
+
+__all__ = ['scan', 'ScanResult']
+
+######################################################################
+# defining module attribute getter
+
+
+def __getattr__(name: str):
+    """
+    Given a library api attribute name,
+    imports and returns respective object.
+    """
+    # checking attribute name
+    if name == 'scan':
+
+        # importing scan function
+        from pytree.api import scan
+
+        # returning scan function
+        return scan
+
+    # checking attribute name
+    if name == 'ScanResult':
+
+        # importing scan result class
+        from pytree.classes.ScanResult import ScanResult
+
+        # returning scan result class
+        return ScanResult
+
+    # raising attribute error
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+######################################################################
+# end of current module
@@ -0,0 +1,121 @@
+# pytree api module
+
+# Code destined to scanning folder/subfolder/files
+# in-process (library usage), returning results
+# instead of printing them on the console.
+
+######################################################################
+# imports
+
+# importing required libraries
+from typing import Callable
+from pytree.classes.PyTree import PyTree
+from pytree.utils.global_vars import UPDATE_TIME
+from pytree.classes.ScanResult import ScanResult
+from pytree.utils.aux_funcs import get_size_bytes
+from pytree.utils.aux_funcs import get_start_paths
+from pytree.classes.ScanProgress import ScanProgress
+from pytree.classes.ScanProfiler import ScanProfiler
+
+######################################################################
+# defining api functions
+
+
+def scan(path: str | list = '.',
+         dirs_only: bool = False,
+         include_counts: bool = True,
+         include_sizes: bool = True,
+         extension: str | None = None,
+         keyword: str | None = None,
+         level: int = -1,
+         loc: bool = False,
+         workers: int = 1,
+         cache_dir: str | None = None,
+         truncate: bool = False,
+         ignore_patterns: list | None = None,
+         use_gitignore: bool = False,
+         size_mode: str = 'apparent',
+         dedupe_hardlinks: bool = False,
+         extra_sizes: bool = False,
+         top: int | None = None,
+         min_size: int | str | None = None,
+         diff_paths: list | None = None,
+         output_path: str | None = None,
+         output_format: str | None = None,
+         stream: bool = False,
+         keep_nodes: bool = True,
+         progress_callback: Callable | None = None,
+         callback_interval: float = UPDATE_TIME,
+         profile: bool = False,
+         profile_stats: str | None = None
+         ) -> ScanResult:
+    """
+    Scans given path(s) with given options (same
+    as cli options, see PyTree), and returns scan
+    result (totals, node store, tree/table getters).
+    No threads are started (other than workers), and
+    nothing is printed. If keep_nodes is False, only
+    totals are obtained (and saved/streamed table,
+    if output path is given), keeping memory bounded.
+    If a progress callback is given, it is called
+    with (folders_scanned, files_scanned), at most
+    once per callback interval (in seconds).
+    If profile is True (or a profile stats path is
+    given, to save cProfile stats of scan phase),
+    run phases are recorded (see ScanResult.profile).
+    """
+    # getting start paths (duplicate paths are only scanned once)
+    start_paths = get_start_paths(path)
+
+    # getting min size bytes (size strings, e.g. "10mb", are accepted, as in cli)
+    min_size = get_size_bytes(min_size) if isinstance(min_size, str) else min_size
+
+    # getting scan progress
+    scan_progress = ScanProgress(progress_callback=progress_callback,
+                                 callback_interval=callback_interval)
+
+    # getting profiler (only if profiling is on)
+    profiler = ScanProfiler(stats_path=profile_stats) if profile or profile_stats is not None else None
+
+    # initializing PyTree object (nodes are only kept if tree is "shown")
+    tree = PyTree(start_path=start_paths[0],
+                  dirs_only=dirs_only,
+                  include_counts=include_counts,
+                  include_sizes=include_sizes,
+                  extension=extension,
+                  keyword=keyword,
+                  level=level,
+                  loc=loc,
+                  output_path=output_path,
+                  quiet=(not keep_nodes),
+                  workers=workers,
+                  cache_dir=cache_dir,
+                  stream=stream,
+                  output_format=output_format,
+                  truncate=truncate,
+                  ignore_patterns=ignore_patterns,
+                  use_gitignore=use_gitignore,
+                  size_mode=size_mode,
+                  dedupe_hardlinks=dedupe_hardlinks,
+                  extra_sizes=extra_sizes,
+                  top=top,
+                  min_size=min_size,
+                  start_paths=start_paths,
+                  diff_paths=diff_paths,
+                  progress_tracker=scan_progress,
+                  profiler=profiler)
+
+    # running pytree main
+    tree.run()
+
+    # calling progress callback (final progress)
+    scan_progress.call_progress_callback()
+
+    # getting scan result
+    scan_result = ScanResult(pytree=tree)
+
+    # returning scan result
+    return scan_result
+
+######################################################################
+# end of current module
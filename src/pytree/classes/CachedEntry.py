@@ -0,0 +1,76 @@
+# CachedEntry module
+
+# Code destined to defining
+# CachedEntry class and
+# related attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from os import strerror
+from errno import ENOENT
+from os import stat_result
+
+#####################################################################
+# CachedEntry definition
+
+
+class CachedEntry:
+    """
+    Defines CachedEntry class
+    (an os.DirEntry stand-in, rebuilt
+    from a scan cache listing).
+    """
+    def __init__(self,
+                 name: str,
+                 path: str,
+                 entry_is_dir: bool,
+                 entry_is_symlink: bool,
+                 entry_stat: stat_result | None
+                 ) -> None:
+        """
+        Initializes a CachedEntry instance
+        and defines class attributes.
+        """
+        # creating attributes from input
+        self.name = name
+        self.path = path
+        self.entry_is_dir = entry_is_dir
+        self.entry_is_symlink = entry_is_symlink
+        self.entry_stat = entry_stat
+
+    def is_dir(self) -> bool:
+        """
+        Returns True if entry is
+        a folder, and False otherwise.
+        """
+        # returning entry is dir bool
+        return self.entry_is_dir
+
+    def is_symlink(self) -> bool:
+        """
+        Returns True if entry is a
+        symlink, and False otherwise.
+        """
+        # returning entry is symlink bool
+        return self.entry_is_symlink
+
+    def stat(self) -> stat_result:
+        """
+        Returns entry cached stat result
+        (raising same error os.DirEntry would
+        if entry could not be stat-ed when
+        listing was cached).
+        """
+        # checking whether stat result is available
+        if self.entry_stat is None:
+
+            # raising file not found error (e.g. broken symlink)
+            raise FileNotFoundError(ENOENT, strerror(ENOENT), self.path)
+
+        # returning stat result
+        return self.entry_stat
+
+######################################################################
+# end of current module
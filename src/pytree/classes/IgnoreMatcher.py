@@ -0,0 +1,190 @@
+# IgnoreMatcher module
+
+# Code destined to defining
+# IgnoreMatcher class and
+# related attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from re import Pattern
+from os.path import sep
+from os.path import join
+from re import compile as re_compile
+from pytree.utils.aux_funcs import get_ignore_rule
+
+#####################################################################
+# IgnoreMatcher definition
+
+
+class IgnoreMatcher:
+    """
+    Defines IgnoreMatcher class.
+    Compiles a list of gitignore style patterns
+    (from an ignore file, user globs or default
+    cache folders), relative to a base folder,
+    into combined regexes, so that each entry is
+    matched once per matcher (against its name,
+    or its relative path for anchored patterns).
+    If patterns contain negations ("!pattern"),
+    rules are matched in order instead (last
+    matching rule wins, as in git).
+    """
+    def __init__(self,
+                 patterns: list,
+                 base_path: str
+                 ) -> None:
+        """
+        Initializes an IgnoreMatcher instance
+        and defines class attributes.
+        """
+        # creating attributes from input
+        self.patterns = patterns
+        self.base_path = base_path
+
+        # getting base path prefix length (used to get entries relative paths)
+        self.base_prefix_length = len(join(self.base_path, ''))
+
+        # getting rules
+        rules = [get_ignore_rule(pattern=pattern) for pattern in self.patterns]
+        self.rules = [rule for rule in rules if rule is not None]
+
+        # getting rules info
+        self.has_negation = any(negate for _, negate, _, _ in self.rules)
+        self.has_anchored = any(anchored for _, _, _, anchored in self.rules)
+        self.has_file_rules = any(not dir_only for _, _, dir_only, _ in self.rules)
+
+        # getting ordered rules (only used if there are negations)
+        self.ordered_rules = [(re_compile(regex_str), negate, dir_only, anchored)
+                              for regex_str, negate, dir_only, anchored
+                              in self.rules]
+
+        # getting combined regexes ({(anchored, is_dir): regex}, None if no rules apply)
+        self.combined_regexes = {(anchored, is_dir): self.get_combined_regex(anchored=anchored,
+                                                                             is_dir=is_dir)
+                                 for anchored in (False, True)
+                                 for is_dir in (False, True)}
+
+    def get_combined_regex(self,
+                           anchored: bool,
+                           is_dir: bool
+                           ) -> Pattern | None:
+        """
+        Given an anchored bool and entry type,
+        returns single regex combining all rules
+        that apply (None if no rules apply).
+        """
+        # getting regex strings
+        regex_strs = [regex_str
+                      for regex_str, _, dir_only, rule_anchored
+                      in self.rules
+                      if rule_anchored == anchored and (is_dir or not dir_only)]
+
+        # checking whether any rules apply
+        if not regex_strs:
+
+            # returning None (no rules apply)
+            return None
+
+        # getting combined regex
+        combined_regex = re_compile('|'.join(f'(?:{regex_str})' for regex_str in regex_strs))
+
+        # returning combined regex
+        return combined_regex
+
+    def get_relative_path(self,
+                          path: str
+                          ) -> str:
+        """
+        Given an entry path, returns it relative
+        to matcher base path (with "/" separators).
+        """
+        # getting relative path
+        relative_path = path[self.base_prefix_length:]
+
+        # checking whether os separator differs from patterns separator
+        if sep != '/':
+
+            # normalizing separators
+            relative_path = relative_path.replace(sep, '/')
+
+        # returning relative path
+        return relative_path
+
+    def match(self,
+              name: str,
+              path: str,
+              is_dir: bool
+              ) -> bool | None:
+        """
+        Given an entry name, path and type, returns
+        True if entry is ignored by matcher rules,
+        False if it is explicitly re-included (by a
+        negation), or None if no rule matches it.
+        """
+        # checking whether rules contain negations
+        if self.has_negation:
+
+            # matching rules in order
+            return self.match_ordered(name=name,
+                                      path=path,
+                                      is_dir=is_dir)
+
+        # getting name regex
+        name_regex = self.combined_regexes[(False, is_dir)]
+
+        # checking whether name matches
+        if name_regex is not None and name_regex.fullmatch(name):
+
+            # returning True (entry ignored)
+            return True
+
+        # getting path regex
+        path_regex = self.combined_regexes[(True, is_dir)]
+
+        # checking whether relative path matches
+        if path_regex is not None and path_regex.fullmatch(self.get_relative_path(path=path)):
+
+            # returning True (entry ignored)
+            return True
+
+        # returning None (no rule matches)
+        return None
+
+    def match_ordered(self,
+                      name: str,
+                      path: str,
+                      is_dir: bool
+                      ) -> bool | None:
+        """
+        Given an entry name, path and type, matches
+        rules in order (last matching rule wins),
+        returning same values as match.
+        """
+        # defining placeholder value for decision
+        decision = None
+
+        # iterating over ordered rules
+        for regex, negate, dir_only, anchored in self.ordered_rules:
+
+            # checking whether rule applies to entry type
+            if dir_only and not is_dir:
+
+                # skipping rule
+                continue
+
+            # getting matched string
+            matched_str = self.get_relative_path(path=path) if anchored else name
+
+            # checking whether rule matches
+            if regex.fullmatch(matched_str):
+
+                # updating decision
+                decision = (not negate)
+
+        # returning decision
+        return decision
+
+######################################################################
+# end of current module
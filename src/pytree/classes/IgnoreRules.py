@@ -0,0 +1,152 @@
+# IgnoreRules module
+
+# Code destined to defining
+# IgnoreRules class and related
+# attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from os import DirEntry
+from pytree.utils.aux_funcs import get_path_split
+from pytree.utils.aux_funcs import read_ignore_file
+from pytree.classes.IgnoreMatcher import IgnoreMatcher
+from pytree.utils.global_vars import IGNORE_FILE_NAME
+from pytree.utils.global_vars import GITIGNORE_FILE_NAME
+
+#####################################################################
+# IgnoreRules definition
+
+
+class IgnoreRules:
+    """
+    Defines IgnoreRules class.
+    Decides which folders/files are excluded from
+    scan, based on default (cache folders) patterns,
+    user globs and ignore files (.pytreeignore, and
+    .gitignore if enabled) found while walking.
+    Each folder gets a chain of matchers (root
+    matchers plus those of ignore files in folder
+    and its ancestors), deeper matchers taking
+    precedence, as in git.
+    """
+    def __init__(self,
+                 start_path: str,
+                 default_patterns: list,
+                 user_patterns: list | None = None,
+                 use_gitignore: bool = False
+                 ) -> None:
+        """
+        Initializes an IgnoreRules instance
+        and defines class attributes.
+        """
+        # creating attributes from input
+        self.start_path = start_path
+        self.default_patterns = default_patterns
+        self.user_patterns = user_patterns
+        self.use_gitignore = use_gitignore
+
+        # getting ignore file names
+        self.ignore_file_names = (IGNORE_FILE_NAME, GITIGNORE_FILE_NAME) if self.use_gitignore else (IGNORE_FILE_NAME,)
+
+        # getting default matcher
+        default_matcher = IgnoreMatcher(patterns=self.default_patterns,
+                                        base_path=self.start_path)
+
+        # getting start is cache bool (if start path itself is a cache folder, default patterns are not applied)
+        self.start_is_cache = any(default_matcher.match(name=name, path=name, is_dir=True)
+                                  for name in get_path_split(path=self.start_path))
+
+        # defining placeholder value for root rules
+        root_rules = []
+
+        # checking whether start path is cache
+        if not self.start_is_cache:
+
+            # updating root rules
+            root_rules.append(default_matcher)
+
+        # checking whether user patterns were given
+        if self.user_patterns:
+
+            # updating root rules
+            root_rules.append(IgnoreMatcher(patterns=self.user_patterns,
+                                            base_path=self.start_path))
+
+        # getting root rules tuple
+        self.root_rules = tuple(root_rules)
+
+    def get_folder_rules(self,
+                         folder_path: str,
+                         files: list,
+                         parent_rules: tuple | None
+                         ) -> tuple:
+        """
+        Given a folder path, its files DirEntry list
+        and its parent folder rules (None for start
+        path), returns rules chain applied to folder
+        entries (adding matchers for ignore files
+        found in folder).
+        """
+        # getting base rules
+        folder_rules = self.root_rules if parent_rules is None else parent_rules
+
+        # iterating over folder files
+        for file_entry in files:
+
+            # checking whether file is an ignore file
+            if file_entry.name in self.ignore_file_names:
+
+                # getting ignore file patterns
+                patterns = read_ignore_file(ignore_file_path=file_entry.path)
+
+                # updating folder rules
+                folder_rules += (IgnoreMatcher(patterns=patterns,
+                                               base_path=folder_path),)
+
+        # returning folder rules
+        return folder_rules
+
+    @staticmethod
+    def has_file_rules(folder_rules: tuple) -> bool:
+        """
+        Given a folder rules chain, returns True
+        if any rule may match files (and not only
+        folders), and False otherwise.
+        """
+        # getting has file rules bool
+        has_file_rules = any(matcher.has_file_rules for matcher in folder_rules)
+
+        # returning has file rules bool
+        return has_file_rules
+
+    @staticmethod
+    def is_ignored(folder_rules: tuple,
+                   entry: DirEntry,
+                   is_dir: bool
+                   ) -> bool:
+        """
+        Given a folder rules chain and one of its
+        entries, returns True if entry should be
+        excluded from scan, and False otherwise.
+        """
+        # iterating over matchers (deeper matchers first)
+        for matcher in reversed(folder_rules):
+
+            # getting matcher decision
+            decision = matcher.match(name=entry.name,
+                                     path=entry.path,
+                                     is_dir=is_dir)
+
+            # checking whether matcher decided
+            if decision is not None:
+
+                # returning decision
+                return decision
+
+        # returning False (no rule matches entry)
+        return False
+
+######################################################################
+# end of current module
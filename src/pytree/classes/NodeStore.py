@@ -0,0 +1,368 @@
+# NodeStore module
+
+# Code destined to defining
+# NodeStore class and related
+# attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from sys import intern
+from array import array
+from os.path import join
+from os.path import dirname
+from pytree.utils.global_vars import FILE_TYPE
+from pytree.utils.global_vars import NO_PARENT
+from pytree.utils.global_vars import SUMMARY_TYPE
+from pytree.utils.global_vars import NODE_TYPE_NAMES
+
+#####################################################################
+# NodeStore definition
+
+
+class NodeStore:
+    """
+    Defines NodeStore class.
+    Stores tree nodes (folders/files) as parallel
+    arrays (names, levels, parent indices, types,
+    sizes, counts, loc/com, truncated flags, and
+    apparent/allocated sizes if required) instead
+    of one dict per path. Nodes are added bottom-up
+    (children before parents), and paths are only
+    rebuilt from names/parent indices when needed
+    (e.g. for saving). Stores of several roots may
+    be combined (extended) into one store, which
+    then has one root node per start path.
+    """
+    def __init__(self,
+                 root_path: str,
+                 include_sizes: bool,
+                 include_counts: bool,
+                 include_loc: bool,
+                 include_truncated: bool = False,
+                 include_extra_sizes: bool = False
+                 ) -> None:
+        """
+        Initializes a NodeStore instance
+        and defines class attributes.
+        """
+        # creating attributes from input
+        self.root_path = root_path
+
+        # defining base root paths dict ({node_index: root_path}, for roots of extended stores)
+        self.root_paths = {}
+
+        # base columns
+        self.names = []
+        self.levels = array('l')
+        self.parents = array('q')
+        self.types = array('b')
+
+        # optional columns (only allocated if required)
+        self.sizes = array('q') if include_sizes else None
+        self.counts = array('q') if include_counts else None
+        self.locs = array('q') if include_loc else None
+        self.coms = array('q') if include_loc else None
+        self.truncated = array('b') if include_truncated else None
+        self.apparent_sizes = array('q') if include_extra_sizes else None
+        self.allocated_sizes = array('q') if include_extra_sizes else None
+
+    def __len__(self) -> int:
+        """
+        Returns number of nodes in store.
+        """
+        # returning nodes num
+        return len(self.names)
+
+    def add_node(self,
+                 name: str,
+                 level: int,
+                 node_type: int,
+                 size: int = 0,
+                 count: int = -1,
+                 loc: int = 0,
+                 com: int = 0,
+                 truncated: bool = False,
+                 apparent_size: int = 0,
+                 allocated_size: int = 0
+                 ) -> int:
+        """
+        Given a node info, adds node to store
+        (without parent, which is only known once
+        parent folder is added) and returns its index.
+        """
+        # getting node index
+        node_index = len(self.names)
+
+        # appending base columns (names are interned, since many repeat, e.g. __init__.py)
+        self.names.append(intern(name))
+        self.levels.append(level)
+        self.parents.append(NO_PARENT)
+        self.types.append(node_type)
+
+        # appending optional columns
+        if self.sizes is not None:
+            self.sizes.append(size)
+        if self.counts is not None:
+            self.counts.append(count)
+        if self.locs is not None:
+            self.locs.append(loc)
+            self.coms.append(com)
+        if self.truncated is not None:
+            self.truncated.append(truncated)
+        if self.apparent_sizes is not None:
+            self.apparent_sizes.append(apparent_size)
+            self.allocated_sizes.append(allocated_size)
+
+        # returning node index
+        return node_index
+
+    def set_parent(self,
+                   node_index: int,
+                   parent_index: int
+                   ) -> None:
+        """
+        Given a node index and its parent
+        folder index, updates node parent.
+        """
+        # updating node parent
+        self.parents[node_index] = parent_index
+
+    def is_file(self,
+                node_index: int
+                ) -> bool:
+        """
+        Given a node index, returns True if
+        node is a file, and False otherwise.
+        """
+        # getting node is file bool
+        node_is_file = (self.types[node_index] == FILE_TYPE)
+
+        # returning node is file bool
+        return node_is_file
+
+    def is_summary(self,
+                   node_index: int
+                   ) -> bool:
+        """
+        Given a node index, returns True if node
+        is a small items summary, and False otherwise.
+        """
+        # getting node is summary bool
+        node_is_summary = (self.types[node_index] == SUMMARY_TYPE)
+
+        # returning node is summary bool
+        return node_is_summary
+
+    def is_root(self,
+                node_index: int
+                ) -> bool:
+        """
+        Given a node index, returns True if
+        node is root, and False otherwise.
+        """
+        # getting node is root bool
+        node_is_root = (self.parents[node_index] == NO_PARENT)
+
+        # returning node is root bool
+        return node_is_root
+
+    def get_root_path(self,
+                      node_index: int
+                      ) -> str:
+        """
+        Given a root node index,
+        returns its full path.
+        """
+        # getting root path
+        root_path = self.root_paths.get(node_index, self.root_path)
+
+        # returning root path
+        return root_path
+
+    def extend(self,
+               node_store: 'NodeStore'
+               ) -> None:
+        """
+        Given another node store (with same
+        columns), appends its nodes to current
+        store, offsetting parent indices and
+        keeping track of its root paths.
+        """
+        # getting index offset
+        index_offset = len(self.names)
+
+        # extending base columns
+        self.names.extend(node_store.names)
+        self.levels.extend(node_store.levels)
+        self.parents.extend(NO_PARENT if parent_index == NO_PARENT else parent_index + index_offset
+                            for parent_index
+                            in node_store.parents)
+        self.types.extend(node_store.types)
+
+        # extending optional columns
+        if self.sizes is not None:
+            self.sizes.extend(node_store.sizes)
+        if self.counts is not None:
+            self.counts.extend(node_store.counts)
+        if self.locs is not None:
+            self.locs.extend(node_store.locs)
+            self.coms.extend(node_store.coms)
+        if self.truncated is not None:
+            self.truncated.extend(node_store.truncated)
+        if self.apparent_sizes is not None:
+            self.apparent_sizes.extend(node_store.apparent_sizes)
+            self.allocated_sizes.extend(node_store.allocated_sizes)
+
+        # iterating over extended store nodes
+        for node_index in range(len(node_store)):
+
+            # checking whether node is root
+            if node_store.is_root(node_index=node_index):
+
+                # updating root paths dict
+                self.root_paths[node_index + index_offset] = node_store.get_root_path(node_index=node_index)
+
+    def get_ordered_indices(self) -> range:
+        """
+        Returns node indices in top-down order
+        (root first, each folder before its
+        contents), which is the reverse of
+        insertion order.
+        """
+        # getting ordered indices
+        ordered_indices = range(len(self.names) - 1, -1, -1)
+
+        # returning ordered indices
+        return ordered_indices
+
+    def get_children_offsets(self) -> tuple:
+        """
+        Returns (offsets, children) arrays, where
+        children of node i (roots, for i = -1) are
+        children[offsets[i + 1]:offsets[i + 2]],
+        in top-down order.
+        """
+        # getting nodes num
+        nodes_num = len(self.names)
+
+        # defining base offsets array (one slot per node, plus roots slot and end slot)
+        offsets = array('q', bytes(8 * (nodes_num + 2)))
+
+        # iterating over parent indices
+        for parent_index in self.parents:
+
+            # updating parent children count (stored in next slot, so that offsets are obtained by accumulating)
+            offsets[parent_index + 2] += 1
+
+        # iterating over slots
+        for slot in range(1, nodes_num + 2):
+
+            # accumulating children counts
+            offsets[slot] += offsets[slot - 1]
+
+        # getting fill positions (copy of offsets)
+        positions = array('q', offsets)
+
+        # defining base children array
+        children = array('q', bytes(8 * nodes_num))
+
+        # iterating over nodes top-down
+        for node_index in self.get_ordered_indices():
+
+            # getting node parent slot
+            parent_slot = self.parents[node_index] + 1
+
+            # updating children array
+            children[positions[parent_slot]] = node_index
+
+            # updating parent fill position
+            positions[parent_slot] += 1
+
+        # assembling children offsets
+        children_offsets = (offsets, children)
+
+        # returning children offsets
+        return children_offsets
+
+    def get_paths(self) -> list:
+        """
+        Returns list of nodes full paths
+        (indexed by node index), rebuilt
+        from names and parent indices.
+        """
+        # defining placeholder value for paths list
+        paths = [''] * len(self.names)
+
+        # iterating over nodes top-down (parents paths are always built before children's)
+        for node_index in self.get_ordered_indices():
+
+            # getting node parent index
+            parent_index = self.parents[node_index]
+
+            # checking whether node is root
+            if parent_index == NO_PARENT:
+
+                # updating paths list
+                paths[node_index] = self.get_root_path(node_index=node_index)
+
+            else:
+
+                # updating paths list
+                paths[node_index] = join(paths[parent_index], self.names[node_index])
+
+        # returning paths list
+        return paths
+
+    def get_columns_dict(self,
+                         node_indices: list
+                         ) -> dict:
+        """
+        Given a list of node indices, returns
+        dict of columns ({column_name: values})
+        for respective nodes, built in one pass
+        per column (files have no count).
+        """
+        # getting nodes paths
+        paths = self.get_paths()
+
+        # getting nodes parent paths (roots parent is their containing folder)
+        parent_paths = [dirname(paths[node_index]) if self.parents[node_index] == NO_PARENT
+                        else paths[self.parents[node_index]]
+                        for node_index
+                        in node_indices]
+
+        # getting nodes types
+        node_types = [NODE_TYPE_NAMES[self.types[node_index]]
+                      for node_index
+                      in node_indices]
+
+        # assembling columns dict
+        columns_dict = {'name': [self.names[node_index] for node_index in node_indices],
+                        'path': [paths[node_index] for node_index in node_indices],
+                        'level': [self.levels[node_index] for node_index in node_indices],
+                        'parent': parent_paths,
+                        'type': node_types}
+
+        # updating columns dict with optional columns
+        if self.sizes is not None:
+            columns_dict['size'] = [self.sizes[node_index] for node_index in node_indices]
+        if self.apparent_sizes is not None:
+            columns_dict['apparent_size'] = [self.apparent_sizes[node_index] for node_index in node_indices]
+            columns_dict['allocated_size'] = [self.allocated_sizes[node_index] for node_index in node_indices]
+        if self.counts is not None:
+            columns_dict['count'] = [None if self.types[node_index] == FILE_TYPE else self.counts[node_index]
+                                     for node_index
+                                     in node_indices]
+        if self.locs is not None:
+            columns_dict['loc'] = [self.locs[node_index] for node_index in node_indices]
+            columns_dict['com'] = [self.coms[node_index] for node_index in node_indices]
+        if self.truncated is not None:
+            columns_dict['truncated'] = [bool(self.truncated[node_index]) for node_index in node_indices]
+
+        # returning columns dict
+        return columns_dict
+
+######################################################################
+# end of current module
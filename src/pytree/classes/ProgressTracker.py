@@ -8,17 +8,24 @@
 # imports
 
 # importing required libraries
-from time import time
+from math import exp
 from time import sleep
 from sys import stdout
+from typing import Any
+from signal import signal
 from threading import Lock
+from signal import Signals
 from threading import Event
 from os import _exit  # noqa
 from threading import Thread
+from signal import getsignal
+from time import perf_counter
 from pytree.utils.aux_funcs import flush_string
 from pytree.utils.aux_funcs import get_time_str
 from pytree.utils.global_vars import UPDATE_TIME
+from pytree.utils.aux_funcs import get_console_width
 from pytree.utils.aux_funcs import get_number_string
+from pytree.utils.global_vars import RATE_SMOOTHING_TIME
 
 #####################################################################
 # ProgressTracker definition
@@ -35,10 +42,10 @@ class ProgressTracker:
         """
         # defining class attributes (shared by all subclasses)
 
-        # time
+        # time (in seconds, with sub-second resolution)
         self.start_time = self.get_current_time()
         self.current_time = self.get_current_time()
-        self.elapsed_time = 0
+        self.elapsed_time = 0.0
         self.elapsed_time_str = ''
         self.etc = 0
         self.etc_str = ''
@@ -48,6 +55,11 @@ class ProgressTracker:
         self.current_iteration = 0
         self.totals_updated = Event()
 
+        # rates (exponentially smoothed, per second, by counter name), and counters at last rates update
+        self.rates = {}
+        self.rates_counts = {}
+        self.rates_time = self.start_time
+
         # progress
         self.progress_percentage = 0
         self.progress_percentage_str = ''
@@ -69,6 +81,14 @@ class ProgressTracker:
         # totals
         self.totals_string = ''
 
+        # console (progress is only shown if stdout is a terminal, so piped runs pay no progress cost)
+        self.show_progress = stdout.isatty()
+        self.console_width = get_console_width() if self.show_progress else 0  # cached, refreshed on terminal resize
+        self.previous_resize_handler = None
+
+        # last flushed progress state (redraws are skipped while progress is unchanged)
+        self.last_progress_state = None
+
         # end string
         self.end_string = 'analysis complete!'
 
@@ -83,8 +103,15 @@ class ProgressTracker:
 
     def print_totals(self) -> None:
         """
-        Prints iterations totals.
+        Prints iterations totals
+        (if progress is shown).
         """
+        # checking whether progress is shown
+        if not self.show_progress:
+
+            # skipping totals
+            return
+
         # clearing console
         self.clear_progress()
 
@@ -96,14 +123,14 @@ class ProgressTracker:
         Sets threading.Event as set,
         signaling totals updated.
         """
-        # printing totals
-        self.print_totals()
+        # checking lock to avoid printing totals while progress is flushed
+        with self.lock:
 
-        # signaling the progress tracker to stop
-        self.totals_updated.set()
+            # printing totals
+            self.print_totals()
 
-        # waiting some time to ensure signal is perceived
-        self.wait(seconds=0.8)
+            # signaling totals updated (perceived on next progress update)
+            self.totals_updated.set()
 
     def update_totals(self,
                       args_dict: dict
@@ -143,18 +170,16 @@ class ProgressTracker:
             self.wheel_symbol = '\b'
 
     @staticmethod
-    def get_current_time() -> int:
+    def get_current_time() -> float:
         """
-        Gets current UTC time, in seconds.
+        Gets current time (monotonic
+        clock), in seconds.
         """
         # getting current time
-        current_time = time()
-
-        # getting seconds
-        current_seconds = int(current_time)
+        current_time = perf_counter()
 
         # returning current time in seconds
-        return current_seconds
+        return current_time
 
     def reset_timer(self) -> None:
         """
@@ -165,7 +190,12 @@ class ProgressTracker:
         # resetting start time
         self.start_time = self.get_current_time()
 
-    def get_elapsed_time(self) -> int:
+        # resetting rates (counters made while calculating totals are not rated)
+        self.rates = {}
+        self.rates_counts = self.get_rates_counts()
+        self.rates_time = self.start_time
+
+    def get_elapsed_time(self) -> float:
         """
         Returns time difference
         between start time and
@@ -177,29 +207,96 @@ class ProgressTracker:
         # returning elapsed time
         return elapsed_time
 
-    def get_etc(self) -> int:
+    def get_rates_counts(self) -> dict:
+        """
+        Returns current counters (by counter
+        name) whose rates are tracked.
+        !Can be overwritten to consider
+        module specific counters!
+        """
+        # getting rates counts
+        rates_counts = {'iterations': self.current_iteration}
+
+        # returning rates counts
+        return rates_counts
+
+    def update_rates(self) -> None:
+        """
+        Updates exponentially smoothed rates
+        (per second) of tracked counters, based
+        on counts made since last update.
+        """
+        # getting time since last update
+        time_delta = self.current_time - self.rates_time
+
+        # checking whether time has passed
+        if time_delta <= 0:
+
+            # skipping update
+            return
+
+        # getting smoothing factor (older rates decay with elapsed time, so irregular updates are weighted alike)
+        smoothing_factor = 1 - exp(-time_delta / RATE_SMOOTHING_TIME)
+
+        # getting current counts
+        rates_counts = self.get_rates_counts()
+
+        # iterating over counters
+        for counter_name, count in rates_counts.items():
+
+            # getting current rate
+            count_delta = count - self.rates_counts.get(counter_name, 0)
+            current_rate = count_delta / time_delta
+
+            # getting previous rate (first rate is taken as is)
+            previous_rate = self.rates.get(counter_name, current_rate)
+
+            # updating smoothed rate
+            self.rates[counter_name] = previous_rate + smoothing_factor * (current_rate - previous_rate)
+
+        # updating last counts/time
+        self.rates_counts = rates_counts
+        self.rates_time = self.current_time
+
+    def get_work(self) -> tuple:
+        """
+        Returns work done, work total and name
+        of counter measuring work (used to
+        obtain progress and ETC).
+        !Can be overwritten to weight work by
+        module specific counters!
         """
-        Based on iteration and time
-        attributes, returns estimated time
-        of completion (ETC).
+        # getting work
+        work = (self.current_iteration, self.iterations_num, 'iterations')
+
+        # returning work
+        return work
+
+    def get_etc(self) -> float:
+        """
+        Based on work to go and smoothed
+        work rate, returns estimated time
+        of completion (ETC), in seconds.
         """
         # defining base value for etc
         etc = 3600
 
-        # getting iterations to go
-        iterations_to_go = self.iterations_num - self.current_iteration
+        # getting work done/total and smoothed work rate
+        work_done, work_total, work_counter = self.get_work()
+        work_to_go = max(work_total - work_done, 0)
+        work_rate = self.rates.get(work_counter, 0)
 
-        # checking if first iteration is running
-        if self.current_iteration >= 1:
+        # checking if work is complete
+        if work_to_go == 0 and work_done > 0:
 
-            # calculating estimated time of completion
-            etc = iterations_to_go * self.elapsed_time / self.current_iteration
+            # updating etc
+            etc = 0
 
-            # rounding time
-            etc = round(etc)
+        # checking if any work was done recently
+        elif work_rate > 0:
 
-            # converting estimated time of completion to int
-            etc = int(etc)
+            # calculating estimated time of completion
+            etc = work_to_go / work_rate
 
         # returning estimated time of completion
         return etc
@@ -211,6 +308,7 @@ class ProgressTracker:
         # updating time attributes
         self.current_time = self.get_current_time()
         self.elapsed_time = self.get_elapsed_time()
+        self.update_rates()
         self.elapsed_time_str = get_time_str(time_in_seconds=self.elapsed_time)
         self.etc = self.get_etc()
         self.etc_str = get_time_str(time_in_seconds=self.etc)
@@ -244,9 +342,12 @@ class ProgressTracker:
         string based on current iteration
         and iterations num.
         """
+        # getting work done/total
+        work_done, work_total, _ = self.get_work()
+
         # getting percentage progress
         try:
-            progress_ratio = self.current_iteration / self.iterations_num
+            progress_ratio = work_done / work_total
         except ZeroDivisionError:
             progress_ratio = 0
         progress_percentage = progress_ratio * 100
@@ -300,25 +401,83 @@ class ProgressTracker:
         self.progress_percentage_str = self.get_percentage_string(percentage=self.progress_percentage)
         self.progress_string = self.get_progress_string()
 
+    def get_progress_state(self) -> tuple:
+        """
+        Returns current progress state (the
+        values shown by progress string), used
+        to skip redraws while it is unchanged.
+        """
+        # getting progress state
+        progress_state = (self.current_iteration,
+                          self.iterations_num,
+                          self.elapsed_time_str,
+                          self.totals_updated.is_set(),
+                          self.process_complete.is_set())
+
+        # returning progress state
+        return progress_state
+
     def flush_progress(self) -> None:
         """
         Gets updated progress string and
-        flushes it on the console.
+        flushes it on the console (only if
+        progress is shown and has changed
+        since last flush).
         """
-        # updating wheel symbol attributes
+        # checking whether progress is shown
+        if not self.show_progress:
+
+            # skipping flush
+            return
+
+        # getting progress state
+        progress_state = self.get_progress_state()
+
+        # checking whether progress changed since last flush
+        if progress_state == self.last_progress_state:
+
+            # skipping redraw
+            return
+
+        # updating last progress state
+        self.last_progress_state = progress_state
+
+        # updating wheel symbol attributes (wheel only spins while progress is made)
         self.update_wheel_symbol()
 
         # updating progress string
         self.update_progress_string()
 
         # showing progress message
-        flush_string(string=self.progress_string)
+        flush_string(string=self.progress_string,
+                     console_width=self.console_width)
+
+    def handle_resize(self,
+                      signal_num: int,
+                      frame: Any
+                      ) -> None:
+        """
+        Handles terminal resize signal,
+        refreshing cached console width
+        and forcing a redraw.
+        """
+        # updating console width
+        self.console_width = get_console_width()
+
+        # resetting last progress state (so that progress is redrawn with new width)
+        self.last_progress_state = None
 
     def clear_progress(self) -> None:
         """
         Given a string, writes empty space
         to cover string size in console.
         """
+        # checking whether progress is shown
+        if not self.show_progress:
+
+            # skipping clear
+            return
+
         # getting current progress string
         string = self.progress_string
 
@@ -349,8 +508,11 @@ class ProgressTracker:
         # signaling the progress tracker to stop
         self.process_complete.set()
 
-        # waiting some time to ensure signal is perceived
-        self.wait(seconds=0.8)
+        # checking whether progress thread is running
+        if self.progress_thread.is_alive():
+
+            # waiting for progress thread to finish (so that nothing is flushed after stop)
+            self.stop_thread()
 
     @staticmethod
     def force_quit() -> None:
@@ -395,13 +557,31 @@ class ProgressTracker:
                 # printing progress
                 self.flush_progress()
 
-            # sleeping for a short period of time to avoid too many prints
-            self.wait(seconds=UPDATE_TIME)
+            # sleeping for a short period of time to avoid too many prints (waking up as soon as stop is signaled)
+            self.process_complete.wait(timeout=UPDATE_TIME)
 
     def start_thread(self) -> None:
         """
-        Starts progress thread.
+        Starts progress thread (only if
+        progress is shown), handling
+        terminal resize signals.
         """
+        # checking whether progress is shown
+        if not self.show_progress:
+
+            # skipping progress thread
+            return
+
+        # getting resize signal (not available on every platform)
+        resize_signal = getattr(Signals, 'SIGWINCH', None)
+
+        # checking whether resize signal is available
+        if resize_signal is not None:
+
+            # handling resize signal (saving previous handler, restored on stop)
+            self.previous_resize_handler = getsignal(resize_signal)
+            signal(resize_signal, self.handle_resize)
+
         # starting progress tracker in a separate thread
         self.progress_thread.start()
 
@@ -410,9 +590,22 @@ class ProgressTracker:
         Stops progress bar monitoring
         and finished execution thread.
         """
+        # checking whether progress thread was started
+        if self.progress_thread.ident is None:
+
+            # skipping join
+            return
+
         # joining threads to ensure progress thread finished cleanly
         self.progress_thread.join()
 
+        # checking whether resize signal was handled
+        if self.previous_resize_handler is not None:
+
+            # restoring previous resize handler
+            signal(Signals.SIGWINCH, self.previous_resize_handler)
+            self.previous_resize_handler = None
+
     def normal_exit(self) -> None:
         """
         Prints process complete message
@@ -483,6 +676,9 @@ class ProgressTracker:
             # signaling stop
             self.signal_stop()
 
+            # updating time attributes (progress thread may have stopped before last counts)
+            self.update_time_attributes()
+
             # printing final progress string
             self.flush_progress()
 
@@ -8,29 +8,66 @@
 # imports
 
 # importing required libraries
-from os import walk
+from os import DirEntry
 from sys import platform
-from treelib import Tree
 from os.path import join
-from pandas import concat
-from os.path import abspath
+from os import stat_result
+from os.path import pathsep
+from itertools import chain
 from os.path import dirname
-from os.path import getsize
-from pandas import DataFrame
 from os import _exit  # noqa
+from time import perf_counter
+from typing import TYPE_CHECKING
+from pytree.utils.aux_funcs import read_df
 from pytree.utils.aux_funcs import get_loc
 from pytree.utils.aux_funcs import save_df
-from pytree.utils.aux_funcs import is_cache
-from pytree.utils.aux_funcs import reverse_dict
+from pytree.classes.RowWriter import RowWriter
+from pytree.classes.NodeStore import NodeStore
+from pytree.utils.global_vars import FILE_TYPE
+from pytree.utils.aux_funcs import save_totals
+from pytree.utils.aux_funcs import load_totals
+from pytree.classes.ScanCache import ScanCache
+from pytree.utils.aux_funcs import get_loc_dict
 from pytree.utils.aux_funcs import get_size_str
+from pytree.utils.aux_funcs import get_time_str
+from pytree.utils.aux_funcs import walk_entries
+from pytree.utils.aux_funcs import get_delta_str
+from pytree.utils.global_vars import FOLDER_TYPE
 from pytree.utils.aux_funcs import get_skip_file
 from pytree.utils.aux_funcs import get_path_name
+from pytree.utils.global_vars import TOTALS_FILE
+from pytree.classes.TopTracker import TopTracker
+from pytree.utils.global_vars import ADDED_STATUS
+from pytree.utils.global_vars import SUMMARY_TYPE
+from concurrent.futures import ThreadPoolExecutor
 from pytree.utils.aux_funcs import get_path_depth
-from pytree.utils.aux_funcs import get_start_path
+from pytree.utils.aux_funcs import get_entry_name
+from pytree.utils.aux_funcs import get_files_bytes
+from pytree.utils.aux_funcs import get_start_paths
+from pytree.classes.IgnoreRules import IgnoreRules
+from pytree.utils.aux_funcs import get_prune_depth
 from pytree.utils.aux_funcs import get_loc_com_str
-from pytree.utils.aux_funcs import get_skip_folder
 from pytree.utils.global_vars import CACHE_FOLDERS
+from pytree.utils.global_vars import REMOVED_STATUS
+from pytree.utils.global_vars import CHANGED_STATUS
+from pytree.classes.ScanProgress import ScanProgress
+from pytree.utils.global_vars import NODE_TYPE_NAMES
+from pytree.classes.TreeRenderer import TreeRenderer
+from pytree.utils.aux_funcs import get_output_format
+from pytree.utils.aux_funcs import get_table_columns
+from pytree.utils.aux_funcs import get_walk_executor
+from pytree.utils.aux_funcs import get_profile_phase
+from pytree.classes.ScanProfiler import ScanProfiler
+from pytree.utils.aux_funcs import get_allocated_size
+from pytree.utils.aux_funcs import get_other_root_ids
+from pytree.utils.aux_funcs import check_output_format
 from pytree.classes.ProgressTracker import ProgressTracker
+from pytree.utils.aux_funcs import get_folder_allocated_size
+
+# importing type checking only libraries (pandas is slow to import, so it's only imported when required)
+if TYPE_CHECKING:
+    from pandas import Series
+    from pandas import DataFrame
 
 #####################################################################
 # progress tracking related functions
@@ -59,10 +96,24 @@ class ModuleProgressTracker(ProgressTracker):
         self.files_num = 0
         self.current_file = 0
 
-        # tree
-        self.tree = Tree()
+        # bytes/loc (bytes are only counted ahead in loc mode, where work is weighted by bytes read)
+        self.bytes_num = 0
+        self.current_bytes = 0
+        self.current_loc = 0
+        self.weight_by_bytes = False
+
+        # profiler (ScanProfiler, set if profiling is on)
+        self.profiler = None
+
+        # tree (TreeRenderer, or anything with a show method, set once tree is created)
+        self.tree = None
         self.show_tree = False
 
+        # single pass
+        self.start_path = ''
+        self.single_pass = False
+        self.previous_totals = None
+
         # end string
         self.end_string = ''
         self.print_end_string = ''
@@ -91,6 +142,17 @@ class ModuleProgressTracker(ProgressTracker):
             progress_string += f' | scanned: {self.iterations_num}'
             progress_string += f' | elapsed time: {self.elapsed_time_str}'
 
+        # if single pass is running without previous totals (no estimate available)
+        elif self.single_pass and self.previous_totals is None:
+
+            # updating progress string based on attributes
+            progress_string += f'creating tree...'
+            progress_string += f' {self.wheel_symbol}'
+            progress_string += f' | folders: {self.current_folder}'
+            progress_string += f' | files: {self.current_iteration}'
+            progress_string += f' | rate: {self.get_work_rate_str()}'
+            progress_string += f' | elapsed time: {self.elapsed_time_str}'
+
         # if total iterations already obtained
         else:
 
@@ -100,12 +162,183 @@ class ModuleProgressTracker(ProgressTracker):
             progress_string += f' | folder: {self.current_folder}/{self.folders_num}'
             progress_string += f' | file: {self.current_file}/{self.files_num}'
             progress_string += f' | progress: {self.progress_percentage_str}'
+            progress_string += f' | rate: {self.get_work_rate_str()}'
             progress_string += f' | elapsed time: {self.elapsed_time_str}'
             progress_string += f' | ETC: {self.etc_str}'
 
         # returning progress string
         return progress_string
 
+    def get_rates_counts(self) -> dict:
+        """
+        Returns current folders/files/bytes/loc
+        counters, whose rates are tracked.
+        """
+        # getting rates counts
+        rates_counts = {'files': self.current_iteration,
+                        'dirs': self.current_folder,
+                        'bytes': self.current_bytes,
+                        'loc': self.current_loc}
+
+        # returning rates counts
+        return rates_counts
+
+    def get_work(self) -> tuple:
+        """
+        Returns work done, work total and name
+        of counter measuring work (bytes in loc
+        mode, since files are read, files
+        otherwise).
+        """
+        # checking weight by bytes toggle
+        if self.weight_by_bytes:
+
+            # getting bytes work
+            work = (self.current_bytes, self.bytes_num, 'bytes')
+
+        else:
+
+            # getting files work
+            work = (self.current_iteration, self.iterations_num, 'files')
+
+        # returning work
+        return work
+
+    def get_work_rate_str(self) -> str:
+        """
+        Returns smoothed work rate as
+        a string (e.g. "10 mb/s", or
+        "1200 files/s").
+        """
+        # checking weight by bytes toggle
+        if self.weight_by_bytes:
+
+            # getting bytes rate string
+            rate_str = f'{get_size_str(size_in_bytes=round(self.rates.get("bytes", 0)))}/s'
+
+        else:
+
+            # getting files rate string
+            rate_str = f'{round(self.rates.get("files", 0))} files/s'
+
+        # returning rate string
+        return rate_str
+
+    def get_progress_state(self) -> tuple:
+        """
+        Returns current progress state,
+        including folders/files counters.
+        """
+        # getting progress state
+        progress_state = super().get_progress_state()
+        progress_state += (self.current_folder,
+                           self.folders_num,
+                           self.current_file,
+                           self.files_num)
+
+        # returning progress state
+        return progress_state
+
+    def count_totals(self,
+                     start_paths: list,
+                     workers: int,
+                     cache_dir: str | None,
+                     prune_depth: int | None,
+                     ignore_patterns: list | None,
+                     use_gitignore: bool,
+                     skip_other_roots: bool = False,
+                     count_bytes: bool = False,
+                     keyword: str | None = None
+                     ) -> None:
+        """
+        Walks start paths counting folders/files
+        to obtain total iterations num (and bytes
+        of files read in loc mode, if count bytes
+        is on, i.e. python files matching keyword).
+        Start paths nested in other start paths are
+        only counted on their own if skip other
+        roots is on (as in tree scan).
+        """
+        # getting scan cache (listings obtained while counting are reused when creating tree)
+        scan_cache = None if cache_dir is None else ScanCache(cache_dir=cache_dir)
+
+        # getting walk executor
+        with get_walk_executor(workers=workers) as executor:
+
+            # iterating over start paths
+            for start_path in start_paths:
+
+                # getting ignore rules
+                ignore_rules = IgnoreRules(start_path=start_path,
+                                           default_patterns=CACHE_FOLDERS,
+                                           user_patterns=ignore_patterns,
+                                           use_gitignore=use_gitignore)
+
+                # getting skip folder ids (other roots are counted on their own, if skipped)
+                skip_folder_ids = get_other_root_ids(start_path=start_path,
+                                                     start_paths=start_paths) if skip_other_roots else None
+
+                # getting folders/subfolders/files in start path
+                folders_subfolders_files = walk_entries(start_path=start_path,
+                                                        ignore_rules=ignore_rules,
+                                                        executor=executor,
+                                                        scan_cache=scan_cache,
+                                                        max_depth=prune_depth,
+                                                        skip_folder_ids=skip_folder_ids,
+                                                        profiler=self.profiler)
+
+                # iterating over folders/subfolders/files
+                for item in folders_subfolders_files:
+
+                    # getting current folder files
+                    _, _, files = item
+
+                    # getting current files num
+                    files_num = len(files)
+
+                    # updating progress tracker attributes
+                    self.folders_num += 1
+                    self.files_num += files_num
+                    self.iterations_num += files_num
+
+                    # checking count bytes toggle
+                    if count_bytes:
+
+                        # updating progress tracker attributes
+                        self.bytes_num += get_files_bytes(files=files,
+                                                          extension='.py',
+                                                          keyword=keyword)
+
+        # checking whether scan cache was used
+        if scan_cache is not None:
+
+            # saving scan cache
+            scan_cache.close()
+
+    def load_previous_totals(self,
+                             start_path: str
+                             ) -> None:
+        """
+        Loads totals saved on previous single
+        pass run (if any), using them as
+        total iterations num estimate.
+        """
+        # getting previous totals
+        previous_totals = load_totals(start_path=start_path,
+                                      totals_path=TOTALS_FILE)
+
+        # updating progress tracker attributes
+        self.previous_totals = previous_totals
+
+        # checking whether previous totals exist
+        if previous_totals is not None:
+
+            # updating progress tracker attributes
+            self.folders_num = previous_totals['folders']
+            self.files_num = previous_totals['files']
+            self.iterations_num = previous_totals['files']
+            self.bytes_num = previous_totals.get('bytes', 0)
+
     def update_totals(self,
                       args_dict: dict
                       ) -> None:
@@ -113,84 +346,218 @@ class ModuleProgressTracker(ProgressTracker):
         Implements module specific method
         to update total iterations num.
         """
-        # getting start path
-        start_path = args_dict['start_path']
-        start_path = get_start_path(start_path)
+        # getting start paths
+        start_paths = args_dict['start_path']
+        start_paths = get_start_paths(start_paths)
+
+        # getting start path (totals of multi root scans are saved under joined paths)
+        start_path = pathsep.join(start_paths)
 
         # getting quiet bool
         quiet = args_dict['quiet']
 
+        # getting single pass bool
+        single_pass = args_dict['single_pass']
+
+        # getting workers num
+        workers = args_dict['workers']
+
+        # getting cache dir
+        cache_dir = args_dict['cache_dir']
+
+        # getting prune depth (same walk as tree scan, top mode/min size imply sizes)
+        prune_depth = get_prune_depth(level=args_dict['level'],
+                                      include_sizes=(args_dict['show_sizes']
+                                                     or args_dict['top'] is not None
+                                                     or args_dict['min_size'] is not None),
+                                      include_counts=args_dict['show_counts'],
+                                      loc=args_dict['loc'],
+                                      truncate=args_dict['truncate'])
+
+        # getting compare snapshots bool (two saved output tables are compared, so nothing is scanned)
+        compare_snapshots = (args_dict['diff_paths'] is not None and len(args_dict['diff_paths']) > 1)
+
+        # getting loc bool (files are read, so work is weighted by bytes)
+        loc = args_dict['loc']
+
         # getting show tree bool
         show_tree = (not quiet)
 
         # updating progress tracker attributes
         self.show_tree = show_tree
+        self.profiler = self.get_profiler(args_dict=args_dict)
+        self.start_path = start_path
+        self.single_pass = (single_pass and not compare_snapshots)
 
-        # getting start is cache bool
-        start_is_cache = is_cache(path=start_path,
-                                  cache_folders=CACHE_FOLDERS)
+        # checking whether progress is shown (totals are only used to estimate progress)
+        if not self.show_progress:
 
-        # getting folders/subfolders/files in start path
-        folders_subfolders_files = walk(start_path,
-                                        topdown=False)
+            # skipping totals (start paths are walked only once)
+            pass
 
-        # iterating over folders/subfolders/files
-        for item in folders_subfolders_files:
+        # checking single pass toggle
+        elif self.single_pass:
 
-            # getting current folder path/subfolders/files
-            folder_path, _, files = item
+            # loading previous run totals (avoids walking start path twice)
+            self.load_previous_totals(start_path=start_path)
 
-            # getting skip folder bool
-            skip_folder = get_skip_folder(folder_path=folder_path,
-                                          start_path=start_path,
-                                          start_is_cache=start_is_cache,
-                                          cache_folders=CACHE_FOLDERS)
+        # checking whether start paths are scanned (compared output tables are only read)
+        elif not compare_snapshots:
 
-            # checking whether to skip current folder
-            if skip_folder:
+            # recording count phase (if profiling)
+            with get_profile_phase(profiler=self.profiler,
+                                   phase_name='count') as count_phase:
 
-                # skipping current folder
-                continue
+                # counting folders/files in start path
+                self.count_totals(start_paths=start_paths,
+                                  workers=workers,
+                                  cache_dir=cache_dir,
+                                  prune_depth=prune_depth,
+                                  ignore_patterns=args_dict['ignore_patterns'],
+                                  use_gitignore=args_dict['use_gitignore'],
+                                  skip_other_roots=args_dict['dedupe_hardlinks'],
+                                  count_bytes=loc,
+                                  keyword=args_dict['keyword'])
 
-            # updating progress tracker attributes
-            self.folders_num += 1
-
-            # iterating over files in folder
-            for _ in files:
+                # updating count phase entries
+                count_phase['entries'] = self.folders_num + self.files_num
 
-                # updating progress tracker attributes
-                self.files_num += 1
-                self.iterations_num += 1
+        # updating progress tracker attributes (weighting by bytes requires bytes total)
+        self.weight_by_bytes = (loc and self.bytes_num > 0)
 
-        # updating totals string
+        # assembling totals string
         totals_string = f'totals...'
-        totals_string += f' | folders: {self.folders_num}'
-        totals_string += f' | files: {self.files_num}'
-        totals_string += f' | scanned: {self.iterations_num}'
+
+        # checking compare snapshots toggle
+        if compare_snapshots:
+
+            # updating totals string
+            totals_string += f' | comparing saved output tables'
+
+        # checking if single pass is running without previous totals
+        elif self.single_pass and self.previous_totals is None:
+
+            # updating totals string
+            totals_string += f' | single pass (no previous run to estimate progress from)'
+
+        # checking if single pass is running with previous totals
+        elif self.single_pass:
+
+            # updating totals string
+            totals_string += f' | estimated folders: {self.folders_num}'
+            totals_string += f' | estimated files: {self.files_num}'
+
+        else:
+
+            # updating totals string
+            totals_string += f' | folders: {self.folders_num}'
+            totals_string += f' | files: {self.files_num}'
+            totals_string += f' | scanned: {self.iterations_num}'
+
+        # updating progress tracker attributes
         self.totals_string = totals_string
 
         # signaling totals updated
         self.signal_totals_updated()
 
+    @staticmethod
+    def get_profiler(args_dict: dict) -> ScanProfiler | None:
+        """
+        Returns ScanProfiler based on profile
+        args (or None, if profiling is off).
+        Saving cProfile stats implies profiling.
+        """
+        # getting profile args
+        profile_format = args_dict['profile']
+        profile_output = args_dict['profile_output']
+        profile_stats = args_dict['profile_stats']
+
+        # checking whether profiling is off
+        if profile_format is None and profile_stats is None:
+
+            # returning None
+            return None
+
+        # getting profiler
+        profiler = ScanProfiler(profile_format=(profile_format or 'table'),
+                                output_path=profile_output,
+                                stats_path=profile_stats)
+
+        # returning profiler
+        return profiler
+
+    def update_estimates(self) -> None:
+        """
+        Updates estimated totals with
+        current progress, since tree may
+        have grown since previous run.
+        """
+        # updating estimated totals
+        self.folders_num = max(self.folders_num, self.current_folder)
+        self.iterations_num = max(self.iterations_num, self.current_iteration)
+        self.bytes_num = max(self.bytes_num, self.current_bytes)
+
+    def update_progress_string(self) -> None:
+        """
+        Updates progress string related attributes.
+        """
+        # checking single pass toggle
+        if self.single_pass:
+
+            # updating estimated totals
+            self.update_estimates()
+
+        # updating progress string related attributes
+        super().update_progress_string()
+
+    def save_current_totals(self) -> None:
+        """
+        Saves current run folders/files totals,
+        to be used as estimate on next single
+        pass run.
+        """
+        # saving totals
+        save_totals(start_path=self.start_path,
+                    totals_path=TOTALS_FILE,
+                    folders_num=self.current_folder,
+                    files_num=self.current_iteration,
+                    bytes_num=self.current_bytes)
+
     def normal_exit(self) -> None:
         """
         Implements module specific method
         to define what to print before
         terminating execution.
         """
+        # checking single pass toggle
+        if self.single_pass:
+
+            # saving current totals for next runs
+            self.save_current_totals()
+
         # printing spacer
         print('\n')
 
         # checking whether to show tree
         if self.show_tree:
 
-            # showing tree
-            self.tree.show()
+            # recording show phase (if profiling)
+            with get_profile_phase(profiler=self.profiler,
+                                   phase_name='show'):
+
+                # showing tree
+                self.tree.show()
 
         # printing end string
         print(self.end_string,
               end=self.print_end_string)
 
+        # checking whether profiling is on
+        if self.profiler is not None:
+
+            # printing/saving profile report
+            self.profiler.write_report()
+
 #####################################################################
 # PyTree definition
 
@@ -210,12 +577,32 @@ class PyTree:
                  loc: bool,
                  output_path: str | None,
                  quiet: bool,
+                 workers: int = 1,
+                 cache_dir: str | None = None,
+                 stream: bool = False,
+                 output_format: str | None = None,
+                 truncate: bool = False,
+                 ignore_patterns: list | None = None,
+                 use_gitignore: bool = False,
+                 size_mode: str = 'apparent',
+                 dedupe_hardlinks: bool = False,
+                 extra_sizes: bool = False,
+                 top: int | None = None,
+                 min_size: int | None = None,
+                 start_paths: list | None = None,
+                 diff_paths: list | None = None,
                  cache_folders: list = CACHE_FOLDERS,
-                 progress_tracker: ModuleProgressTracker = ModuleProgressTracker
+                 progress_tracker: ModuleProgressTracker | ScanProgress | None = None,
+                 profiler: ScanProfiler | None = None
                  ) -> None:
         """
         Initializes a PyTree instance
         and defines class attributes.
+        If no progress tracker is given, a silent
+        one (ScanProgress) is used, so that no
+        thread/console output is required.
+        If a ScanProfiler is given, run phases
+        and file system calls are recorded.
         """
         # creating attributes from input
         self.start_path = start_path
@@ -228,8 +615,23 @@ class PyTree:
         self.loc = loc
         self.output_path = output_path
         self.quiet = quiet
+        self.workers = workers
+        self.cache_dir = cache_dir
+        self.stream = stream
+        self.output_format = output_format
+        self.truncate = truncate
+        self.ignore_patterns = ignore_patterns
+        self.use_gitignore = use_gitignore
+        self.size_mode = size_mode
+        self.dedupe_hardlinks = dedupe_hardlinks
+        self.extra_sizes = extra_sizes
+        self.top = top
+        self.min_size = min_size
+        self.start_paths = start_paths
+        self.diff_paths = diff_paths
         self.cache_folders = cache_folders
-        self.progress_tracker = progress_tracker
+        self.progress_tracker = ScanProgress() if progress_tracker is None else progress_tracker
+        self.profiler = profiler
 
         # checking whether mode is loc
         if self.loc:
@@ -237,24 +639,146 @@ class PyTree:
             # updating valid extensions
             self.extension = '.py'
 
+        # getting top mode bool (only largest files/folders are kept and shown, instead of tree)
+        self.top_mode = (self.top is not None)
+
+        # getting fold small items bool (entries below min size are summarized per folder, instead of getting nodes)
+        self.fold_small_items = (self.min_size is not None)
+
+        # checking top mode/fold small items toggles
+        if self.top_mode or self.fold_small_items:
+
+            # updating include sizes (entries are ranked/folded by size)
+            self.include_sizes = True
+
+        # checking whether start paths were given
+        if self.start_paths is None:
+
+            # updating start paths
+            self.start_paths = [self.start_path]
+
+        # getting multi root bool (each start path is scanned concurrently as a root tree, and results are combined)
+        self.multi_root = (len(self.start_paths) > 1)
+
+        # defining placeholder value for skip folder ids (other roots ids, set on root trees of multi root scans)
+        self.skip_folder_ids = None
+
+        # getting diff mode bool (tree/table show changes against a saved output table)
+        self.diff_mode = (self.diff_paths is not None)
+
+        # getting compare snapshots bool (two saved output tables are compared, instead of one and current scan)
+        self.compare_snapshots = (self.diff_mode and len(self.diff_paths) > 1)
+
+        # checking diff mode toggle
+        if self.diff_mode:
+
+            # checking diff paths num
+            if len(self.diff_paths) > 2:
+
+                # raising value error
+                raise ValueError(f'diff takes one or two output tables (got {len(self.diff_paths)})')
+
+            # checking incompatible toggles
+            if self.top_mode or self.stream:
+
+                # raising value error
+                raise ValueError('diff can not be combined with top/stream modes')
+
+        # defining placeholder values for diff results (node deltas/statuses are indexed by node index)
+        self.snapshot_diff = None
+        self.diff_df = None
+        self.node_deltas = None
+        self.node_statuses = None
+        self.diff_totals = None
+
+        # getting use allocated size bool (st_blocks * 512, as du, instead of st_size)
+        self.use_allocated_size = (self.size_mode == 'allocated')
+
+        # getting include extra sizes bool (apparent/allocated sizes are both exported as extra columns)
+        self.include_extra_sizes = (self.include_sizes and self.extra_sizes)
+
+        # defining base seen inodes dict ({(st_dev, st_ino): file_path}, for hardlinked files,
+        # shared by root trees, so that hardlinked bytes are only counted once in total size)
+        self.seen_inodes = {}
+
         # getting show tree bool
         self.show_tree = (not self.quiet)
 
         # getting save output bool
         self.save_output = (self.output_path is not None)
 
-        # getting start is cache bool
-        self.start_is_cache = is_cache(path=self.start_path,
-                                       cache_folders=self.cache_folders)
+        # checking save output toggle
+        if self.save_output:
+
+            # getting output format (inferred from output path extension, if not given)
+            self.output_format = get_output_format(output_path=self.output_path,
+                                                   output_format=self.output_format)
+
+            # checking output format (fails before scanning, rather than after)
+            check_output_format(output_format=self.output_format,
+                                stream=self.stream)
+
+        # getting ignore rules (used by walker to avoid descending into ignored folders)
+        self.ignore_rules = IgnoreRules(start_path=self.start_path,
+                                        default_patterns=self.cache_folders,
+                                        user_patterns=self.ignore_patterns,
+                                        use_gitignore=self.use_gitignore)
 
         # getting start level
         self.start_level = get_path_depth(path=self.start_path)
 
+        # getting use cache bool
+        self.use_cache = (self.cache_dir is not None)
+
+        # defining placeholder value for scan cache (opened during scan)
+        self.scan_cache = None
+
+        # getting parallel loc bool (lines of code are counted on a process pool if workers > 1)
+        self.parallel_loc = (self.loc and self.workers > 1)
+
+        # defining base loc dict ({file_path: (loc, com)}, filled when parallel loc is on)
+        self.loc_dict = {}
+
         # getting apply level filter bool
         self.apply_level_filter = (self.level != -1)
 
-        # defining base tree dict
-        self.tree_dict = {}
+        # getting prune depth (walk stops descending below level, unless sizes/counts/loc are required)
+        self.prune_depth = get_prune_depth(level=self.level,
+                                           include_sizes=self.include_sizes,
+                                           include_counts=self.include_counts,
+                                           loc=self.loc,
+                                           truncate=self.truncate)
+
+        # getting count files only bool (dirs only runs without sizes/loc don't need to scan files)
+        self.count_files_only = (self.dirs_only and not self.include_sizes and not self.loc)
+
+        # getting mark truncated bool (sizes/loc of pruned folders, and total counts, are incomplete)
+        self.mark_truncated = (self.prune_depth is not None and (self.include_sizes or self.include_counts or self.loc))
+
+        # defining base tree dict (columnar node store)
+        self.tree_dict = NodeStore(root_path=self.start_path,
+                                   include_sizes=self.include_sizes,
+                                   include_counts=self.include_counts,
+                                   include_loc=self.loc,
+                                   include_truncated=self.mark_truncated,
+                                   include_extra_sizes=self.include_extra_sizes)
+
+        # defining base pending folders dict ({folder_path: (node_index, size, loc, com, truncated,
+        # apparent_size, allocated_size, link_size)},
+        # kept until parent folder is scanned, so its size is bounded by tree depth/width)
+        self.pending_folders = {}
+
+        # getting stream output bool (rows are written while scanning, in post-order)
+        self.stream_output = (self.stream and self.save_output)
+
+        # getting store nodes bool (nodes are only kept if required by tree/table/diff)
+        self.store_nodes = (self.show_tree or (self.save_output and not self.stream_output) or self.diff_mode) and not self.top_mode
+
+        # getting top tracker (largest files/folders heaps, shared by root trees of multi root scans)
+        self.top_tracker = TopTracker(top_num=self.top) if self.top_mode else None
+
+        # defining placeholder value for row writer (opened during scan)
+        self.row_writer = None
 
         # totals (keeping separate from ProgressTracker since it counts per subfolder)
         self.total_folders = 0
@@ -263,11 +787,23 @@ class PyTree:
         self.total_loc = 0
         self.total_com = 0
 
+        # defining placeholder value for scan time (in seconds, used to obtain average rates)
+        self.scan_time = 0.0
+
         # defining placeholder values for current folder size/count
         self.current_folder_size = 0
         self.current_items_count = 0
         self.current_folder_loc = 0
         self.current_folder_com = 0
+        self.current_folder_apparent_size = 0
+        self.current_folder_allocated_size = 0
+
+        # defining placeholder value for current folder link size (bytes of extra hardlinks skipped by dedupe,
+        # still used to decide whether folder is small, so that folders holding large links are never folded)
+        self.current_folder_link_size = 0
+
+        # defining placeholder values for current folder small items (summarized in one node)
+        self.reset_small_items()
 
         # valid files
         self.valid_files = 0
@@ -289,132 +825,261 @@ class PyTree:
         # returning path level
         return path_level
 
-    def get_path_dict(self,
-                      name: str,
-                      path: str
-                      ) -> dict:
+    def get_file_loc(self,
+                     file_entry: DirEntry
+                     ) -> tuple:
         """
-        Given a path, returns its
-        base description dict.
+        Given a file DirEntry, returns its lines
+        of code/comments counts, taking them from
+        loc dict (precomputed on process pool) or
+        scan cache, when available.
         """
-        # getting base path info
-        path_level = self.get_path_level(path=path)
-        path_id = abspath(path=path)
-        parent_folder = dirname(p=path)
-        parent_id = abspath(path=parent_folder)
+        # getting file path
+        file_path = file_entry.path
 
-        # assembling base path dict
-        path_dict = {'name': name,
-                     'path': path_id,
-                     'level': path_level,
-                     'parent': parent_id}
+        # getting precomputed lines of code (if parallel loc is on)
+        loc_com = self.loc_dict.get(file_path)
 
-        # returning base path dict
-        return path_dict
+        # checking whether lines of code were precomputed
+        if loc_com is not None:
 
-    def get_file_dict(self,
-                      file_name: str,
-                      file_path: str
-                      ) -> dict:
-        """
-        Given a file path, returns
-        its description dict.
-        """
-        # getting base path dict
-        base_dict = self.get_path_dict(name=file_name,
-                                       path=file_path)
+            # returning precomputed lines of code
+            return loc_com
 
-        # updating base dict
-        base_dict['type'] = 'file'
+        # checking use cache toggle
+        if self.use_cache:
 
-        # checking include sizes toggle
-        if self.include_sizes:
+            # getting cached lines of code
+            loc_com = self.scan_cache.get_loc(file_entry=file_entry)
 
-            # getting file size
-            file_size = getsize(filename=file_path)
+            # checking whether lines of code were cached
+            if loc_com is not None:
 
-            # updating base dict
-            base_dict['size'] = file_size
+                # returning cached lines of code
+                return loc_com
 
-        # checking mode
-        if self.loc:
+        # getting loc start time
+        loc_start_time = perf_counter()
 
-            # getting lines of code
-            loc, com = get_loc(file_path=file_path)
+        # getting lines of code
+        loc_com = get_loc(file_path=file_path)
 
-            # updating base dict
-            base_dict['loc'] = loc
-            base_dict['com'] = com
+        # checking whether profiler was given
+        if self.profiler is not None:
 
-        # returning base dict
-        return base_dict
+            # recording loc call
+            self.profiler.add_operation(operation_name='loc',
+                                        elapsed_time=perf_counter() - loc_start_time)
 
-    def get_folder_dict(self,
-                        folder_name: str,
-                        folder_path: str
-                        ) -> dict:
+        # checking use cache toggle
+        if self.use_cache:
+
+            # saving lines of code to cache
+            self.scan_cache.set_loc(file_entry=file_entry,
+                                    loc_com=loc_com)
+
+        # returning lines of code
+        return loc_com
+
+    def get_level_shown(self,
+                        path_level: int
+                        ) -> bool:
         """
-        Given a folder path, returns
-        its description dict.
+        Given a path level, returns True if
+        level is shown in tree/table (according
+        to level filter), and False otherwise.
         """
-        # getting base path dict
-        base_dict = self.get_path_dict(name=folder_name,
-                                       path=folder_path)
+        # getting level shown bool
+        level_shown = (not self.apply_level_filter or path_level <= self.level)
+
+        # returning level shown bool
+        return level_shown
+
+    def get_skip_path(self,
+                      path_level: int,
+                      path_is_file: bool
+                      ) -> bool:
+        """
+        Given a path level and type, returns
+        True if path should be left out of
+        tree/table (according to level/dirs
+        only filters), and False otherwise.
+        """
+        # checking whether level is shown
+        if not self.get_level_shown(path_level=path_level):
+
+            # returning True (skipping path)
+            return True
+
+        # checking dirs only bool
+        if self.dirs_only:
+
+            # checking if path is file
+            if path_is_file:
+
+                # returning True (skipping path)
+                return True
+
+        # returning False (keeping path)
+        return False
+
+    def write_row(self,
+                  name: str,
+                  path: str,
+                  level: int,
+                  parent: str,
+                  path_is_file: bool,
+                  size: int,
+                  count: int,
+                  loc: int,
+                  com: int,
+                  truncated: bool,
+                  apparent_size: int,
+                  allocated_size: int,
+                  summary: bool = False
+                  ) -> None:
+        """
+        Given a path info, writes respective
+        row to streamed output table (unless
+        filtered out by level/dirs only).
+        """
+        # getting skip path bool
+        skip_path = self.get_skip_path(path_level=level,
+                                       path_is_file=path_is_file)
+
+        # checking whether to skip path
+        if skip_path:
 
-        # updating base dict
-        base_dict['type'] = 'folder'
+            # skipping path
+            return
+
+        # assembling base row dict
+        row_dict = {'name': name,
+                    'path': path,
+                    'level': level,
+                    'parent': parent,
+                    'type': 'summary' if summary else ('file' if path_is_file else 'folder')}
 
         # checking include sizes toggle
         if self.include_sizes:
 
-            # updating base dict
-            base_dict['size'] = self.current_folder_size
+            # updating row dict
+            row_dict['size'] = size
 
-        # checking include counts toggle
-        if self.include_counts:
+        # checking include extra sizes toggle
+        if self.include_extra_sizes:
+
+            # updating row dict
+            row_dict['apparent_size'] = apparent_size
+            row_dict['allocated_size'] = allocated_size
 
-            # updating base dict
-            base_dict['count'] = self.current_items_count
+        # checking include counts toggle (files have no count)
+        if self.include_counts and not path_is_file:
+
+            # updating row dict
+            row_dict['count'] = count
 
         # checking mode
         if self.loc:
 
-            # updating base dict
-            base_dict['loc'] = self.current_folder_loc
-            base_dict['com'] = self.current_folder_com
+            # updating row dict
+            row_dict['loc'] = loc
+            row_dict['com'] = com
+
+        # checking mark truncated toggle
+        if self.mark_truncated:
+
+            # updating row dict
+            row_dict['truncated'] = truncated
+
+        # writing row
+        self.row_writer.write_row(row_dict=row_dict)
+
+    def is_first_link(self,
+                      file_path: str,
+                      file_stat: stat_result
+                      ) -> bool:
+        """
+        Given a file path and stat result, returns
+        True if file is not hardlinked, or is the
+        first scanned link to its (st_dev, st_ino)
+        inode, and False otherwise.
+        """
+        # checking whether file is hardlinked
+        if file_stat.st_nlink < 2:
+
+            # returning True (file bytes are not shared)
+            return True
+
+        # getting file id
+        file_id = (file_stat.st_dev, file_stat.st_ino)
+
+        # getting first link bool (dict.setdefault is atomic, so concurrent root trees agree on first link)
+        first_link = (self.seen_inodes.setdefault(file_id, file_path) is file_path)
 
-        # returning base dict
-        return base_dict
+        # returning first link bool
+        return first_link
 
     def scan_file(self,
-                  file_name: str,
-                  file_path: str
+                  file_entry: DirEntry,
+                  file_level: int,
+                  folder_path: str
                   ) -> None:
         """
-        Given a file name/path updates tree
-        dict accordingly.
+        Given a file DirEntry, its level and
+        parent folder path, adds file node to
+        tree dict (node store) and/or streamed
+        output, updating folder/total sizes/
+        counts/loc.
         """
-        # getting current file dict
-        file_dict = self.get_file_dict(file_name=file_name,
-                                       file_path=file_path)
+        # defining placeholder values for file size/loc/com
+        file_size = 0
+        file_loc = 0
+        file_com = 0
+        file_apparent_size = 0
+        file_allocated_size = 0
 
-        # assembling path dict
-        path_dict = {file_path: file_dict}
-
-        # updating tree dict
-        self.tree_dict.update(path_dict)
+        # defining placeholder value for file counted size (size added to folder size)
+        counted_size = 0
 
         # checking include sizes toggle
         if self.include_sizes:
 
-            # getting file size
-            file_size = file_dict['size']
+            # getting file stat result (cached in DirEntry)
+            file_stat = file_entry.stat()
+
+            # getting file size (according to size mode)
+            file_size = get_allocated_size(entry_stat=file_stat) if self.use_allocated_size else file_stat.st_size
+
+            # checking include extra sizes toggle
+            if self.include_extra_sizes:
+
+                # getting file apparent/allocated sizes
+                file_apparent_size = file_stat.st_size
+                file_allocated_size = get_allocated_size(entry_stat=file_stat)
 
-            # updating folder size
-            self.current_folder_size += file_size
+            # getting first link bool (every link counts unless dedupe is on)
+            first_link = self.is_first_link(file_path=file_entry.path,
+                                            file_stat=file_stat) if self.dedupe_hardlinks else True
 
-            # updating total size
-            self.total_size += file_size
+            # checking whether file bytes count towards folder/total sizes (other links to an inode are skipped if dedupe is on)
+            if first_link:
+
+                # updating folder sizes
+                self.current_folder_size += file_size
+                self.current_folder_apparent_size += file_apparent_size
+                self.current_folder_allocated_size += file_allocated_size
+
+                # updating total size
+                self.total_size += file_size
+
+                # updating file counted size
+                counted_size = file_size
+
+            else:
+
+                # updating folder link size
+                self.current_folder_link_size += file_size
 
         # checking include counts toggle
         if self.include_counts:
@@ -427,8 +1092,7 @@ class PyTree:
         if self.loc:
 
             # getting file loc/com
-            file_loc = file_dict['loc']
-            file_com = file_dict['com']
+            file_loc, file_com = self.get_file_loc(file_entry=file_entry)
 
             # updating folder loc
             self.current_folder_loc += file_loc
@@ -438,27 +1102,259 @@ class PyTree:
             self.total_loc += file_loc
             self.total_com += file_com
 
+            # updating progress tracker attributes
+            self.progress_tracker.current_loc += file_loc
+
+        # checking whether file bytes are tracked (stat result is cached in DirEntry, and files are read in loc mode)
+        if self.include_sizes or self.loc:
+
+            # updating progress tracker attributes
+            self.progress_tracker.current_bytes += file_entry.stat().st_size
+
+        # checking whether to track file size (files are not ranked in dirs only mode)
+        if self.top_mode and not self.dirs_only:
+
+            # adding file to top tracker
+            self.top_tracker.add_file(size=file_size,
+                                      path=file_entry.path)
+
+        # checking whether file is small (folded into folder small items summary, instead of getting its own node/row)
+        if self.get_size_is_small(size=file_size):
+
+            # checking dirs only toggle (files are never shown in dirs only mode, so they aren't summarized either)
+            if not self.dirs_only:
+
+                # adding file to small items (extra hardlinks add no bytes to summary, if dedupe is on)
+                self.add_small_item(size=counted_size,
+                                    loc=file_loc,
+                                    com=file_com,
+                                    apparent_size=file_apparent_size,
+                                    allocated_size=file_allocated_size)
+
+            # skipping file node/row
+            return
+
+        # checking whether to store file node (files below level are only aggregated, and never shown in dirs only mode)
+        if self.store_nodes and not self.dirs_only and self.get_level_shown(path_level=file_level):
+
+            # adding file node to tree dict
+            self.tree_dict.add_node(name=file_entry.name,
+                                    level=file_level,
+                                    node_type=FILE_TYPE,
+                                    size=file_size,
+                                    loc=file_loc,
+                                    com=file_com,
+                                    apparent_size=file_apparent_size,
+                                    allocated_size=file_allocated_size)
+
+        # checking stream output toggle
+        if self.stream_output:
+
+            # writing file row
+            self.write_row(name=file_entry.name,
+                           path=file_entry.path,
+                           level=file_level,
+                           parent=folder_path,
+                           path_is_file=True,
+                           size=file_size,
+                           count=0,
+                           loc=file_loc,
+                           com=file_com,
+                           truncated=False,
+                           apparent_size=file_apparent_size,
+                           allocated_size=file_allocated_size)
+
+    def reset_small_items(self) -> None:
+        """
+        Resets current folder small
+        items count/aggregates.
+        """
+        # resetting small items attributes
+        self.small_items_count = 0
+        self.small_items_size = 0
+        self.small_items_loc = 0
+        self.small_items_com = 0
+        self.small_items_apparent_size = 0
+        self.small_items_allocated_size = 0
+
+    def add_small_item(self,
+                       size: int,
+                       loc: int,
+                       com: int,
+                       apparent_size: int,
+                       allocated_size: int
+                       ) -> None:
+        """
+        Given a small file/subfolder aggregates,
+        adds it to current folder small items.
+        """
+        # updating small items attributes
+        self.small_items_count += 1
+        self.small_items_size += size
+        self.small_items_loc += loc
+        self.small_items_com += com
+        self.small_items_apparent_size += apparent_size
+        self.small_items_allocated_size += allocated_size
+
+    def get_size_is_small(self,
+                          size: int
+                          ) -> bool:
+        """
+        Given a file/folder size, returns True
+        if it is below min size (entry is folded
+        into its parent small items summary),
+        and False otherwise.
+        """
+        # getting size is small bool
+        size_is_small = (self.fold_small_items and size < self.min_size)
+
+        # returning size is small bool
+        return size_is_small
+
+    def get_folder_is_small(self,
+                            folder_level: int,
+                            folder_size: int
+                            ) -> bool:
+        """
+        Given a folder level and size, returns True
+        if folder is folded into its parent small
+        items summary, and False otherwise (start
+        paths are never folded).
+        """
+        # getting folder is small bool
+        folder_is_small = (folder_level > 0 and self.get_size_is_small(size=folder_size))
+
+        # returning folder is small bool
+        return folder_is_small
+
+    def add_folder_allocated_size(self,
+                                  folder_path: str
+                                  ) -> None:
+        """
+        Given a folder path, adds allocated size
+        of folder itself to current folder sizes
+        (and to total size, in allocated mode).
+        """
+        # getting stat start time
+        stat_start_time = perf_counter()
+
+        # getting folder allocated size
+        folder_allocated_size = get_folder_allocated_size(folder_path=folder_path)
+
+        # checking whether profiler was given
+        if self.profiler is not None:
+
+            # recording stat call
+            self.profiler.add_operation(operation_name='stat',
+                                        elapsed_time=perf_counter() - stat_start_time)
+
+        # checking use allocated size toggle
+        if self.use_allocated_size:
+
+            # updating folder/total sizes
+            self.current_folder_size += folder_allocated_size
+            self.total_size += folder_allocated_size
+
+        # checking include extra sizes toggle
+        if self.include_extra_sizes:
+
+            # updating folder allocated size
+            self.current_folder_allocated_size += folder_allocated_size
+
+    def count_files(self,
+                    files: list
+                    ) -> None:
+        """
+        Given a folder files DirEntry list,
+        updates files counts without scanning
+        files (used in dirs only mode, when no
+        file sizes/loc are required).
+        """
+        # getting current files num
+        files_num = len(files)
+
+        # updating progress tracker attributes
+        self.progress_tracker.current_iteration += files_num
+        self.progress_tracker.current_file += files_num
+
+        # updating totals
+        self.total_files += files_num
+
+        # checking include counts toggle
+        if self.include_counts:
+
+            # getting valid files num (no filter means all files are valid)
+            if self.extension is None and self.keyword is None:
+                valid_files_num = files_num
+            else:
+                valid_files_num = sum(not get_skip_file(file_name=file_entry.name,
+                                                        extension=self.extension,
+                                                        keyword=self.keyword)
+                                      for file_entry in files)
+
+            # updating items count
+            self.current_items_count += valid_files_num
+            self.valid_files += valid_files_num
+
     def scan_subfolder(self,
                        subfolder_path: str
-                       ) -> None:
+                       ) -> int | None:
         """
-        Given a folder path and respective
-        subfolder/files lists, updates tree
-        dict accordingly.
+        Given a subfolder path, updates current
+        folder sizes/counts/loc with subfolder
+        aggregates, returning subfolder node index
+        (None if subfolder has no node).
         """
-        # getting current subfolder dict
-        subfolder_dict = self.tree_dict.get(subfolder_path)  # this will never be None due to topdown=False!
-                                                             # The subfolder will always have already been a
-                                                             # folder in a previous iteration!
+        # getting subfolder info (subfolders are always scanned before their parent
+        # folder, since walk is bottom-up, unless walk was pruned at current level)
+        subfolder_info = self.pending_folders.pop(subfolder_path, None)
+
+        # checking whether subfolder was pruned
+        if subfolder_info is None:
+
+            # checking include counts toggle
+            if self.include_counts:
+
+                # updating items count
+                self.current_items_count += 1
+
+            # updating current folder truncated bool (subfolder contents were not scanned)
+            self.current_folder_truncated = True
+
+            # returning None (pruned subfolders have no node)
+            return None
+
+        # getting subfolder index/aggregates
+        (subfolder_index,
+         subfolder_size,
+         subfolder_loc,
+         subfolder_com,
+         subfolder_truncated,
+         subfolder_apparent_size,
+         subfolder_allocated_size,
+         subfolder_link_size) = subfolder_info
+
+        # checking whether subfolder is small (it has no node, and is summarized in current folder small items)
+        if self.get_size_is_small(size=subfolder_size + subfolder_link_size):
+
+            # adding subfolder to small items
+            self.add_small_item(size=subfolder_size,
+                                loc=subfolder_loc,
+                                com=subfolder_com,
+                                apparent_size=subfolder_apparent_size,
+                                allocated_size=subfolder_allocated_size)
+
+        # updating current folder truncated bool
+        self.current_folder_truncated |= subfolder_truncated
 
         # checking include sizes toggle
         if self.include_sizes:
 
-            # getting file size
-            subfolder_size = subfolder_dict['size']
-
-            # updating folder size
+            # updating folder sizes (hardlinks were already deduped when scanning files, if dedupe is on)
             self.current_folder_size += subfolder_size
+            self.current_folder_apparent_size += subfolder_apparent_size
+            self.current_folder_allocated_size += subfolder_allocated_size
+            self.current_folder_link_size += subfolder_link_size
 
         # checking include counts toggle
         if self.include_counts:
@@ -469,14 +1365,13 @@ class PyTree:
         # checking mode
         if self.loc:
 
-            # getting file loc/com
-            subfolder_loc = subfolder_dict['loc']
-            subfolder_com = subfolder_dict['com']
-
             # updating folder loc/com
             self.current_folder_loc += subfolder_loc
             self.current_folder_com += subfolder_com
 
+        # returning subfolder index
+        return subfolder_index
+
     def scan_folder(self,
                     folder_path: str,
                     subfolders: list,
@@ -484,15 +1379,16 @@ class PyTree:
                     ) -> None:
         """
         Given a folder path and respective
-        subfolder/files lists, updates tree
-        dict accordingly.
+        subfolder/files DirEntry lists, updates
+        tree dict accordingly.
         """
-        # sorting subfolders/files alphabetically
-        subfolders = sorted(subfolders)
-        files = sorted(files)
+        # sorting subfolders/files alphabetically (files order is irrelevant if they are only counted)
+        subfolders = sorted(subfolders, key=get_entry_name)
+        files = files if self.count_files_only else sorted(files, key=get_entry_name)
 
-        # getting current folder name
+        # getting current folder name/level
         folder_name = get_path_name(path=folder_path)
+        folder_level = self.get_path_level(path=folder_path)
 
         # getting current files num
         files_num = len(files)
@@ -504,9 +1400,31 @@ class PyTree:
         self.progress_tracker.current_file = 0
         self.current_folder_size = 0
         self.current_items_count = 0
+        self.current_folder_loc = 0
+        self.current_folder_com = 0
+        self.current_folder_truncated = False
+        self.current_folder_apparent_size = 0
+        self.current_folder_allocated_size = 0
+        self.current_folder_link_size = 0
+        self.reset_small_items()
+
+        # checking whether folder allocated size is required
+        if self.include_sizes and (self.use_allocated_size or self.include_extra_sizes):
+
+            # adding folder own allocated size (folders blocks are counted as well, as du)
+            self.add_folder_allocated_size(folder_path=folder_path)
 
-        # iterating over current files
-        for file_name in files:
+        # getting current folder first file index (files nodes are added contiguously)
+        first_file_index = len(self.tree_dict)
+
+        # checking count files only toggle
+        if self.count_files_only:
+
+            # counting current files (no file nodes are created in dirs only mode)
+            self.count_files(files=files)
+
+        # iterating over current files (skipped if files were only counted)
+        for file_entry in ([] if self.count_files_only else files):
 
             # updating progress tracker attributes
             self.progress_tracker.current_iteration += 1
@@ -516,7 +1434,7 @@ class PyTree:
             self.total_files += 1
 
             # getting skip file bool
-            skip_file = get_skip_file(file_name=file_name,
+            skip_file = get_skip_file(file_name=file_entry.name,
                                       extension=self.extension,
                                       keyword=self.keyword)
 
@@ -526,102 +1444,453 @@ class PyTree:
                 # skipping current file
                 continue
 
-            # getting current file path
-            file_path = join(folder_path,
-                             file_name)
-
             # scanning current file
-            self.scan_file(file_name=file_name,
-                           file_path=file_path)
+            self.scan_file(file_entry=file_entry,
+                           file_level=folder_level + 1,
+                           folder_path=folder_path)
+
+        # getting current folder files indices
+        file_indices = range(first_file_index, len(self.tree_dict))
+
+        # scanning current subfolders (skipped folders were already filtered by walker)
+        subfolder_indices = [self.scan_subfolder(subfolder_path=subfolder_entry.path)
+                             for subfolder_entry
+                             in subfolders]
+
+        # defining placeholder value for folder index
+        folder_index = None
+
+        # getting folder is small bool (small folders are summarized in parent folder, and so are their contents)
+        folder_is_small = self.get_folder_is_small(folder_level=folder_level,
+                                                   folder_size=self.current_folder_size + self.current_folder_link_size)
+
+        # getting small items summary name/level
+        summary_name = f'{self.small_items_count} small item{"" if self.small_items_count == 1 else "s"}'
+        summary_level = folder_level + 1
+
+        # getting add summary bool (small items summary is only added to folders that are not small themselves)
+        add_summary = (self.small_items_count > 0 and not folder_is_small)
+
+        # checking whether to store folder node (folders below level are only aggregated)
+        if self.store_nodes and self.get_level_shown(path_level=folder_level) and not folder_is_small:
+
+            # defining placeholder value for summary indices
+            summary_indices = []
+
+            # checking whether to add small items summary node
+            if add_summary and self.get_level_shown(path_level=summary_level):
+
+                # adding summary node to tree dict (as a contents node of current folder)
+                summary_indices.append(self.tree_dict.add_node(name=summary_name,
+                                                               level=summary_level,
+                                                               node_type=SUMMARY_TYPE,
+                                                               size=self.small_items_size,
+                                                               count=self.small_items_count,
+                                                               loc=self.small_items_loc,
+                                                               com=self.small_items_com,
+                                                               apparent_size=self.small_items_apparent_size,
+                                                               allocated_size=self.small_items_allocated_size))
+
+            # adding folder node to tree dict
+            folder_index = self.tree_dict.add_node(name=folder_name,
+                                                   level=folder_level,
+                                                   node_type=FOLDER_TYPE,
+                                                   size=self.current_folder_size,
+                                                   count=self.current_items_count,
+                                                   loc=self.current_folder_loc,
+                                                   com=self.current_folder_com,
+                                                   truncated=self.current_folder_truncated,
+                                                   apparent_size=self.current_folder_apparent_size,
+                                                   allocated_size=self.current_folder_allocated_size)
+
+            # getting stored subfolders indices
+            subfolder_indices = [subfolder_index
+                                 for subfolder_index
+                                 in subfolder_indices
+                                 if subfolder_index is not None]
+
+            # iterating over current folder files/subfolders/summary indices
+            for child_index in chain(file_indices, subfolder_indices, summary_indices):
+
+                # updating child parent
+                self.tree_dict.set_parent(node_index=child_index,
+                                          parent_index=folder_index)
+
+        # checking whether to stream small items summary row
+        if self.stream_output and add_summary:
+
+            # writing summary row
+            self.write_row(name=summary_name,
+                           path=join(folder_path, summary_name),
+                           level=summary_level,
+                           parent=folder_path,
+                           path_is_file=False,
+                           size=self.small_items_size,
+                           count=self.small_items_count,
+                           loc=self.small_items_loc,
+                           com=self.small_items_com,
+                           truncated=False,
+                           apparent_size=self.small_items_apparent_size,
+                           allocated_size=self.small_items_allocated_size,
+                           summary=True)
+
+        # checking stream output toggle (small folders rows are not written)
+        if self.stream_output and not folder_is_small:
+
+            # writing folder row (aggregates are final, since contents were already scanned)
+            self.write_row(name=folder_name,
+                           path=folder_path,
+                           level=folder_level,
+                           parent=dirname(folder_path),
+                           path_is_file=False,
+                           size=self.current_folder_size,
+                           count=self.current_items_count,
+                           loc=self.current_folder_loc,
+                           com=self.current_folder_com,
+                           truncated=self.current_folder_truncated,
+                           apparent_size=self.current_folder_apparent_size,
+                           allocated_size=self.current_folder_allocated_size)
+
+        # checking whether to track folder size (roots are left out, since their size is the total size)
+        if self.top_mode and folder_level > 0:
+
+            # adding folder to top tracker
+            self.top_tracker.add_folder(size=self.current_folder_size,
+                                        path=folder_path)
+
+        # updating pending folders (until parent folder is scanned)
+        self.pending_folders[folder_path] = (folder_index,
+                                             self.current_folder_size,
+                                             self.current_folder_loc,
+                                             self.current_folder_com,
+                                             self.current_folder_truncated,
+                                             self.current_folder_apparent_size,
+                                             self.current_folder_allocated_size,
+                                             self.current_folder_link_size)
+
+    def update_loc_dict(self,
+                        folders_subfolders_files: list
+                        ) -> None:
+        """
+        Given walked folders/subfolders/files,
+        counts lines of code of valid files
+        on a process pool, updating loc dict.
+        """
+        # defining placeholder value for file entries to count
+        file_entries = []
+
+        # iterating over folders/subfolders/files
+        for item in folders_subfolders_files:
 
-        # iterating over current subfolders
-        for subfolder_name in subfolders:
+            # getting current folder files
+            _, _, files = item
 
-            # getting current subfolder path
-            subfolder_path = join(folder_path,
-                                  subfolder_name)
+            # iterating over current files
+            for file_entry in files:
 
-            # getting skip folder bool
-            skip_folder = get_skip_folder(folder_path=subfolder_path,
-                                          start_path=self.start_path,
-                                          start_is_cache=self.start_is_cache,
-                                          cache_folders=self.cache_folders)
+                # getting skip file bool
+                skip_file = get_skip_file(file_name=file_entry.name,
+                                          extension=self.extension,
+                                          keyword=self.keyword)
 
-            # checking whether to skip current folder
-            if skip_folder:
+                # checking whether to skip current file
+                if skip_file:
 
-                # skipping current folder
-                continue
+                    # skipping current file
+                    continue
+
+                # checking use cache toggle
+                if self.use_cache:
+
+                    # getting cached lines of code
+                    loc_com = self.scan_cache.get_loc(file_entry=file_entry)
+
+                    # checking whether lines of code were cached
+                    if loc_com is not None:
+
+                        # updating loc dict
+                        self.loc_dict[file_entry.path] = loc_com
+
+                        # skipping current file
+                        continue
+
+                # appending file entry to file entries
+                file_entries.append(file_entry)
+
+        # getting file paths
+        file_paths = [file_entry.path for file_entry in file_entries]
+
+        # getting loc start time
+        loc_start_time = perf_counter()
+
+        # getting loc dict
+        loc_dict = get_loc_dict(file_paths=file_paths,
+                                workers=self.workers)
+
+        # checking whether profiler was given
+        if self.profiler is not None:
+
+            # recording loc calls (made on process pool)
+            self.profiler.add_operation(operation_name='loc',
+                                        elapsed_time=perf_counter() - loc_start_time,
+                                        calls=len(file_paths))
+
+        # updating attributes
+        self.loc_dict.update(loc_dict)
+
+        # checking use cache toggle
+        if self.use_cache:
+
+            # iterating over counted file entries
+            for file_entry in file_entries:
+
+                # saving lines of code to cache
+                self.scan_cache.set_loc(file_entry=file_entry,
+                                        loc_com=loc_dict[file_entry.path])
+
+    def scan_tree(self) -> None:
+        """
+        Walks start path, adding its folders/files
+        to tree dict (node store) and/or streamed
+        output, and updating totals.
+        """
+        # getting walk executor (folders are listed/stat-ed concurrently if workers > 1)
+        with get_walk_executor(workers=self.workers) as executor:
+
+            # getting folders/subfolders/files in start path (skipped folders are not descended into)
+            folders_subfolders_files = walk_entries(start_path=self.start_path,
+                                                    ignore_rules=self.ignore_rules,
+                                                    stat_files=self.include_sizes,
+                                                    executor=executor,
+                                                    scan_cache=self.scan_cache,
+                                                    max_depth=self.prune_depth,
+                                                    skip_folder_ids=self.skip_folder_ids,
+                                                    profiler=self.profiler)
+
+            # checking parallel loc toggle
+            if self.parallel_loc:
+
+                # walking whole tree first (files loc must be known before folder aggregation)
+                folders_subfolders_files = list(folders_subfolders_files)
+
+                # counting files loc on process pool
+                self.update_loc_dict(folders_subfolders_files=folders_subfolders_files)
+
+            # iterating over folders/subfolders/files (same order regardless of workers num)
+            for item in folders_subfolders_files:
+
+                # getting current folder path/subfolders/files
+                folder_path, subfolders, files = item
+
+                # updating progress tracker attributes
+                self.progress_tracker.current_folder += 1
+
+                # updating totals
+                self.total_folders += 1
+
+                # scanning current folder
+                self.scan_folder(folder_path=folder_path,
+                                 subfolders=subfolders,
+                                 files=files)
+
+    def get_root_tree(self,
+                      start_path: str
+                      ) -> 'PyTree':
+        """
+        Given one of multi root scan start paths,
+        returns PyTree instance scanning it with
+        same parameters, sharing progress tracker,
+        scan cache, row writer and seen inodes
+        (so that, with dedupe on, hardlinks and
+        nested roots are only counted once).
+        """
+        # getting root tree
+        root_tree = PyTree(start_path=start_path,
+                           dirs_only=self.dirs_only,
+                           include_counts=self.include_counts,
+                           include_sizes=self.include_sizes,
+                           extension=self.extension,
+                           keyword=self.keyword,
+                           level=self.level,
+                           loc=self.loc,
+                           output_path=self.output_path,
+                           quiet=self.quiet,
+                           workers=self.workers,
+                           cache_dir=self.cache_dir,
+                           stream=self.stream,
+                           output_format=self.output_format,
+                           truncate=self.truncate,
+                           ignore_patterns=self.ignore_patterns,
+                           use_gitignore=self.use_gitignore,
+                           size_mode=self.size_mode,
+                           dedupe_hardlinks=self.dedupe_hardlinks,
+                           extra_sizes=self.extra_sizes,
+                           top=self.top,
+                           min_size=self.min_size,
+                           cache_folders=self.cache_folders,
+                           progress_tracker=self.progress_tracker,
+                           profiler=self.profiler)
+
+        # updating root tree shared attributes
+        root_tree.scan_cache = self.scan_cache
+        root_tree.row_writer = self.row_writer
+        root_tree.seen_inodes = self.seen_inodes
+        root_tree.top_tracker = self.top_tracker
+
+        # checking dedupe hardlinks toggle
+        if self.dedupe_hardlinks:
+
+            # updating root tree skip folder ids (as du, nested roots are not descended into, but scanned on their own)
+            root_tree.skip_folder_ids = get_other_root_ids(start_path=start_path,
+                                                           start_paths=self.start_paths)
+
+        # returning root tree
+        return root_tree
+
+    def scan_roots(self) -> None:
+        """
+        Scans start paths concurrently (one root
+        tree per start path), combining root trees
+        nodes into tree dict and summing totals.
+        """
+        # getting root trees
+        root_trees = [self.get_root_tree(start_path=start_path)
+                      for start_path
+                      in self.start_paths]
 
-            # scanning current subfolder
-            self.scan_subfolder(subfolder_path=subfolder_path)
+        # scanning root trees concurrently (walks are io bound, so threads run concurrently)
+        with ThreadPoolExecutor(max_workers=len(root_trees)) as executor:
 
-        # getting current folder dict
-        folder_dict = self.get_folder_dict(folder_name=folder_name,
-                                           folder_path=folder_path)
+            # waiting for root trees scans (errors are raised again here)
+            list(executor.map(PyTree.scan_tree, root_trees))
 
-        # assembling path dict
-        path_dict = {folder_path: folder_dict}
+        # iterating over root trees (reversed, so that first root comes first in top-down order)
+        for root_tree in reversed(root_trees):
 
-        # updating tree dict
-        self.tree_dict.update(path_dict)
+            # updating tree dict
+            self.tree_dict.extend(node_store=root_tree.tree_dict)
 
-    def get_tree_dict(self) -> dict:
+            # updating totals (with dedupe, hardlinked bytes were only counted by first root tree to reach them)
+            self.total_folders += root_tree.total_folders
+            self.total_files += root_tree.total_files
+            self.total_size += root_tree.total_size
+            self.total_loc += root_tree.total_loc
+            self.total_com += root_tree.total_com
+            self.valid_files += root_tree.valid_files
+
+    def get_tree_dict(self) -> NodeStore:
         """
-        Scans start path for subfolders/files
-        and returns dictionary of tree structure,
+        Scans start path(s) for subfolders/files
+        and returns node store of tree structure,
         containing sizes/counts/loc info, according
         to specified parameters.
         """
-        # getting folders/subfolders/files in start path
-        folders_subfolders_files = walk(self.start_path,
-                                        topdown=False)
+        # checking use cache toggle
+        if self.use_cache:
 
-        # iterating over folders/subfolders/files
-        for item in folders_subfolders_files:
+            # opening scan cache
+            self.scan_cache = ScanCache(cache_dir=self.cache_dir)
 
-            # getting current folder path/subfolders/files
-            folder_path, subfolders, files = item
+        # checking stream output toggle
+        if self.stream_output:
 
-            # getting skip folder bool
-            skip_folder = get_skip_folder(folder_path=folder_path,
-                                          start_path=self.start_path,
-                                          start_is_cache=self.start_is_cache,
-                                          cache_folders=self.cache_folders)
+            # opening row writer
+            self.row_writer = RowWriter(output_path=self.output_path,
+                                        output_format=self.output_format,
+                                        columns=get_table_columns(include_sizes=self.include_sizes,
+                                                                  include_counts=self.include_counts,
+                                                                  include_loc=self.loc,
+                                                                  include_truncated=self.mark_truncated,
+                                                                  include_extra_sizes=self.include_extra_sizes))
 
-            # checking whether to skip current folder
-            if skip_folder:
+        # checking multi root toggle
+        if self.multi_root:
 
-                # skipping current folder
-                continue
+            # scanning start paths concurrently
+            self.scan_roots()
 
-            # updating progress tracker attributes
-            self.progress_tracker.current_folder += 1
+        else:
 
-            # updating totals
-            self.total_folders += 1
+            # scanning start path
+            self.scan_tree()
+
+        # checking use cache toggle
+        if self.use_cache:
+
+            # saving scan cache
+            self.scan_cache.close()
+
+        # checking stream output toggle
+        if self.stream_output:
 
-            # scanning current folder
-            self.scan_folder(folder_path=folder_path,
-                             subfolders=subfolders,
-                             files=files)
+            # closing row writer
+            self.row_writer.close()
 
-        # reversing dict (required since topdown was set to False in os.walk to enable size obtaining optimization)
-        tree_dict = reverse_dict(a_dict=self.tree_dict)
+        # getting tree dict (nodes are iterated top-down by node store, so no reversing is required)
+        tree_dict = self.tree_dict
 
         # returning tree dict
         return tree_dict
 
+    def get_delta_tag(self,
+                      node_index: int,
+                      column: str
+                      ) -> str:
+        """
+        Given a node index and a column (e.g. size),
+        returns its delta tag (e.g. ", +3 mb"), if
+        node changed since compared snapshot, or an
+        empty string otherwise (or if not in diff
+        mode, or column wasn't compared).
+        """
+        # checking whether node changed (added/removed nodes deltas are their own values)
+        if not self.diff_mode or self.node_statuses[node_index] != CHANGED_STATUS:
+
+            # returning empty tag
+            return ''
+
+        # getting column deltas
+        column_deltas = self.node_deltas.get(column)
+
+        # checking whether column was compared
+        if column_deltas is None:
+
+            # returning empty tag
+            return ''
+
+        # getting node delta
+        node_delta = column_deltas[node_index]
+
+        # checking whether column value changed
+        if node_delta == 0:
+
+            # returning empty tag
+            return ''
+
+        # getting absolute delta string
+        if column in ('loc', 'com'):
+            delta_str = f'{abs(node_delta)} {"lines of code" if column == "loc" else "comments"}'
+        elif column == 'count':
+            delta_str = f'{abs(node_delta)}'
+        else:
+            delta_str = get_size_str(abs(node_delta))
+
+        # getting delta tag
+        delta_tag = f', {get_delta_str(delta=node_delta, delta_str=delta_str)}'
+
+        # returning delta tag
+        return delta_tag
+
     def get_file_tag(self,
-                     path_dict: dict
+                     node_index: int
                      ) -> str:
         """
-        Given a file path dict,
+        Given a file node index,
         returns its tag, based on
         specified attributes.
         """
-        # getting base path dict info
-        path_name = path_dict['name']
+        # getting base node info
+        path_name = self.tree_dict.names[node_index]
 
         # defining placeholder for file tag
         file_tag = f'{path_name}'
@@ -629,26 +1898,36 @@ class PyTree:
         # checking include sizes toggle
         if self.include_sizes:
 
-            # getting additional path dict info
-            file_size = path_dict['size']
+            # getting additional node info
+            file_size = self.tree_dict.sizes[node_index]
 
             # getting size string
             size_str = get_size_str(file_size)
 
+            # updating size string with size delta (if any)
+            size_str += self.get_delta_tag(node_index=node_index,
+                                           column='size')
+
             # updating file tag
             file_tag += f' ({size_str})'
 
         # checking mode
         if self.loc:
 
-            # getting additional path dict info
-            file_loc = path_dict['loc']
-            file_com = path_dict['com']
+            # getting additional node info
+            file_loc = self.tree_dict.locs[node_index]
+            file_com = self.tree_dict.coms[node_index]
 
             # getting loc string
             loc_com_str = get_loc_com_str(loc=file_loc,
                                           com=file_com)
 
+            # updating loc string with loc/com deltas (if any)
+            loc_com_str += self.get_delta_tag(node_index=node_index,
+                                              column='loc')
+            loc_com_str += self.get_delta_tag(node_index=node_index,
+                                              column='com')
+
             # updating file tag
             file_tag += f' {{{loc_com_str}}}'
 
@@ -656,15 +1935,21 @@ class PyTree:
         return file_tag
 
     def get_folder_tag(self,
-                       path_dict: dict
+                       node_index: int
                        ) -> str:
         """
-        Given a folder path dict,
+        Given a folder node index,
         returns its tag, based on
         specified attributes.
         """
-        # getting base path dict info
-        path_name = path_dict['name']
+        # getting base node info
+        path_name = self.tree_dict.names[node_index]
+
+        # checking whether node is one of multi root scan roots
+        if self.multi_root and self.tree_dict.is_root(node_index=node_index):
+
+            # updating path name (roots are shown with full paths, since names may repeat)
+            path_name = self.tree_dict.get_root_path(node_index=node_index)
 
         # defining placeholder for folder tag
         folder_tag = f'{path_name}'
@@ -672,182 +1957,279 @@ class PyTree:
         # checking include counts toggle
         if self.include_counts:
 
-            # getting additional path dict info
-            items_count = path_dict['count']
+            # getting additional node info
+            items_count = self.tree_dict.counts[node_index]
+
+            # getting count string (with count delta, if any)
+            count_str = f'{items_count}'
+            count_str += self.get_delta_tag(node_index=node_index,
+                                            column='count')
 
             # updating folder tag
-            folder_tag += f' [{items_count}]'
+            folder_tag += f' [{count_str}]'
 
         # checking include sizes toggle
         if self.include_sizes:
 
-            # getting additional path dict info
-            folder_size = path_dict['size']
+            # getting additional node info
+            folder_size = self.tree_dict.sizes[node_index]
 
             # getting size string
             size_str = get_size_str(folder_size)
 
+            # checking whether folder size is truncated
+            if self.mark_truncated and self.tree_dict.truncated[node_index]:
+
+                # updating size string (size of scanned contents only)
+                size_str += '+'
+
+            # updating size string with size delta (if any)
+            size_str += self.get_delta_tag(node_index=node_index,
+                                           column='size')
+
             # updating folder tag
             folder_tag += f' ({size_str})'
 
         # returning folder tag
         return folder_tag
 
+    def get_summary_tag(self,
+                        node_index: int
+                        ) -> str:
+        """
+        Given a small items summary node
+        index, returns its tag (e.g.
+        "(12 small items, 3 mb)").
+        """
+        # getting base node info
+        summary_name = self.tree_dict.names[node_index]
+        summary_size = self.tree_dict.sizes[node_index]
+
+        # getting size string
+        size_str = get_size_str(summary_size)
+
+        # assembling summary tag
+        summary_tag = f'({summary_name}, {size_str})'
+
+        # returning summary tag
+        return summary_tag
+
+    def get_roots_tag(self) -> str:
+        """
+        Returns tag of multi root scan
+        tree top node (joining roots),
+        based on specified attributes.
+        """
+        # defining placeholder for roots tag
+        roots_tag = f'{len(self.start_paths)} roots'
+
+        # checking include sizes toggle
+        if self.include_sizes:
+
+            # getting total size string (hardlinked bytes counted once)
+            size_str = get_size_str(self.total_size)
+
+            # updating roots tag
+            roots_tag += f' ({size_str})'
+
+        # returning roots tag
+        return roots_tag
+
     def get_path_tag(self,
-                     path_dict: dict,
-                     path_type: str
+                     node_index: int,
+                     path_is_file: bool
                      ) -> str:
         """
-        Given a path dict, returns
+        Given a node index, returns
         respective tag, according
-        to path type.
+        to node type.
         """
-        # getting path is dir bool
-        path_is_dir = (path_type == 'folder')
+        # checking if path is file
+        if path_is_file:
 
-        # checking if path is dir
-        if path_is_dir:
+            # getting file tag
+            path_tag = self.get_file_tag(node_index=node_index)
 
-            # getting folder tag
-            path_tag = self.get_folder_tag(path_dict=path_dict)
+        # checking if path is small items summary
+        elif self.tree_dict.is_summary(node_index=node_index):
+
+            # getting summary tag
+            path_tag = self.get_summary_tag(node_index=node_index)
 
         else:
 
-            # getting file tag
-            path_tag = self.get_file_tag(path_dict=path_dict)
+            # getting folder tag
+            path_tag = self.get_folder_tag(node_index=node_index)
+
+        # checking diff mode toggle
+        if self.diff_mode:
+
+            # getting node status
+            node_status = self.node_statuses[node_index]
+
+            # checking whether node was added/removed
+            if node_status in (ADDED_STATUS, REMOVED_STATUS):
+
+                # updating path tag
+                path_tag += f' <{node_status}>'
 
         # returning path tag
         return path_tag
 
-    def dict_to_tree(self,
-                     tree_dict: dict,
-                     ) -> Tree:
+    def get_skip_node(self,
+                      node_index: int
+                      ) -> bool:
         """
-        Converts folder/file description
-        dict into a treelib.Tree object.
+        Given a node index, returns True if
+        node should be skipped (according to
+        level/dirs only filters), and False
+        otherwise.
         """
-        # defining base tree
-        tree = Tree()
+        # getting skip node bool
+        skip_node = self.get_skip_path(path_level=self.tree_dict.levels[node_index],
+                                       path_is_file=self.tree_dict.is_file(node_index=node_index))
 
-        # getting dict items
-        dict_items = tree_dict.items()
+        # returning skip node bool
+        return skip_node
 
-        # iterating over dict items
-        for item in dict_items:
-
-            # getting current path/dict
-            path, path_dict = item
-
-            # getting base path dict info
-            path_level = path_dict['level']
-            path_type = path_dict['type']
-
-            # getting path is file bool
-            path_is_file = (path_type == 'file')
+    def dict_to_df(self,
+                   tree_dict: NodeStore
+                   ) -> 'DataFrame':
+        """
+        Converts folder/file node store
+        into a pandas.DataFrame object
+        (built at once, from columns).
+        """
+        # importing pandas (only imported when tables are required)
+        from pandas import DataFrame
 
-            # checking apply level filter
-            if self.apply_level_filter:
+        # getting valid node indices (top-down)
+        node_indices = [node_index
+                        for node_index
+                        in tree_dict.get_ordered_indices()
+                        if not self.get_skip_node(node_index=node_index)]
 
-                # checking if current level is above max
-                if path_level > self.level:
+        # getting columns dict
+        columns_dict = tree_dict.get_columns_dict(node_indices=node_indices)
 
-                    # skipping path
-                    continue
+        # assembling final df
+        final_df = DataFrame(columns_dict)
 
-            # checking dirs only bool
-            if self.dirs_only:
+        # returning final df
+        return final_df
 
-                # checking if path is file
-                if path_is_file:
+    @staticmethod
+    def read_snapshot(snapshot_path: str) -> 'DataFrame':
+        """
+        Given a path to a saved output table
+        (format inferred from extension),
+        returns it as a df.
+        """
+        # getting snapshot format
+        snapshot_format = get_output_format(output_path=snapshot_path,
+                                            output_format=None)
 
-                    # skipping current node
-                    continue
+        # reading snapshot df
+        snapshot_df = read_df(load_path=snapshot_path,
+                              input_format=snapshot_format)
 
-            # getting current path id/parent
-            path_id = path_dict['path']
-            parent_id = path_dict['parent']
+        # returning snapshot df
+        return snapshot_df
 
-            # getting current path tag
-            path_tag = self.get_path_tag(path_dict=path_dict,
-                                         path_type=path_type)
+    def get_shown_mask(self,
+                       diff_df: 'DataFrame'
+                       ) -> 'Series':
+        """
+        Given a diff df, returns mask of rows shown
+        in tree/table (according to level/dirs only
+        filters, which must apply to both snapshots).
+        """
+        # importing pandas (only imported when tables are required)
+        from pandas import Series
 
-            # getting path is root bool
-            path_is_root = (path_id == self.start_path)
+        # defining base shown mask
+        shown_mask = Series(True, index=diff_df.index)
 
-            # checking if current path is root (first item)
-            if path_is_root:
+        # checking level filter toggle
+        if self.apply_level_filter:
 
-                # creating current node without specifying parent node (since it's root)
-                tree.create_node(tag=path_tag,
-                                 identifier=path_id)
+            # updating shown mask
+            shown_mask &= (diff_df['level'] <= self.level)
 
-            else:
+        # checking dirs only toggle
+        if self.dirs_only:
 
-                # creating current node inside parent node
-                tree.create_node(tag=path_tag,
-                                 identifier=path_id,
-                                 parent=parent_id)
+            # updating shown mask
+            shown_mask &= (diff_df['type'] != NODE_TYPE_NAMES[FILE_TYPE])
 
-        # returning tree
-        return tree
+        # returning shown mask
+        return shown_mask
 
-    def dict_to_df(self,
-                   tree_dict: dict
-                   ) -> DataFrame:
+    def update_diff(self) -> None:
         """
-        Converts folder/file description
-        dict into a pandas.DataFrame object.
+        Compares saved output table with a second
+        one (or with current scan, if only one is
+        given), updating tree dict with changed
+        nodes, and diff df with respective rows.
         """
-        # defining placeholder value for dfs list
-        dfs_list = []
+        # importing snapshot diff (only imported in diff mode, since it requires pandas/numpy)
+        from pytree.classes.SnapshotDiff import SnapshotDiff
 
-        # getting dict items
-        dict_items = tree_dict.items()
+        # getting old/new snapshot paths
+        old_path, *new_path = self.diff_paths
 
-        # iterating over dict items
-        for item in dict_items:
+        # reading old snapshot
+        old_df = self.read_snapshot(snapshot_path=old_path)
 
-            # getting current path/dict
-            path, path_dict = item
+        # checking compare snapshots toggle
+        if self.compare_snapshots:
 
-            # getting base path dict info
-            path_level = path_dict['level']
-            path_type = path_dict['type']
+            # reading new snapshot
+            new_df = self.read_snapshot(snapshot_path=new_path[0])
 
-            # getting path is file bool
-            path_is_file = (path_type == 'file')
+        else:
 
-            # checking apply level filter
-            if self.apply_level_filter:
+            # scanning start path(s)
+            self.update_tree_dict()
 
-                # checking if current level is above max
-                if path_level > self.level:
+            # getting new snapshot (current scan)
+            new_df = self.dict_to_df(tree_dict=self.tree_dict)
 
-                    # skipping path
-                    continue
+        # getting snapshot diff
+        self.snapshot_diff = SnapshotDiff(old_df=old_df,
+                                          new_df=new_df)
 
-            # checking dirs only bool
-            if self.dirs_only:
+        # getting diff df
+        diff_df = self.snapshot_diff.get_diff_df()
 
-                # checking if path is file
-                if path_is_file:
+        # filtering diff df (old snapshot may contain levels/files that are not shown)
+        diff_df = diff_df[self.get_shown_mask(diff_df=diff_df)]
 
-                    # skipping current node
-                    continue
+        # getting changed rows (along with their ancestor folders, sorted top-down)
+        self.diff_df = self.snapshot_diff.get_changed_df(diff_df=diff_df)
 
-            # assembling current df
-            current_df = DataFrame(path_dict,
-                                   index=[0])
+        # getting diff node store (tree dict holds changed nodes, so tree is rendered with usual tags)
+        self.tree_dict, self.node_deltas, self.node_statuses = self.snapshot_diff.get_diff_store(changed_df=self.diff_df)
 
-            # appending current df to dfs list
-            dfs_list.append(current_df)
+        # updating shown columns (only columns saved in both snapshots are compared)
+        diff_columns = self.snapshot_diff.diff_columns
+        self.include_sizes = ('size' in diff_columns)
+        self.include_counts = ('count' in diff_columns)
+        self.loc = ('loc' in diff_columns)
+        self.mark_truncated = False
 
-        # concatenating dfs in dfs list
-        final_df = concat(dfs_list,
-                          ignore_index=True)
+        # updating start paths (changed roots)
+        self.start_paths = list(self.tree_dict.root_paths.values())
+        self.multi_root = (len(self.start_paths) > 1)
 
-        # returning final df
-        return final_df
+        # getting snapshots totals
+        self.diff_totals = self.snapshot_diff.get_totals_dict()
+
+        # checking include sizes toggle
+        if self.include_sizes:
+
+            # updating total size (new snapshot total, shown on multi root top node)
+            _, self.total_size = self.diff_totals['size']
 
     def update_tree_dict(self) -> None:
         """
@@ -859,27 +2241,91 @@ class PyTree:
         # updating attributes
         self.tree_dict = tree_dict
 
+    def get_tree_renderer(self,
+                          tree_dict: NodeStore
+                          ) -> TreeRenderer:
+        """
+        Given folder/file node store, returns
+        renderer printing it as a tree (same
+        output as treelib.Tree.show, without
+        creating treelib nodes).
+        """
+        # getting top tag (multi root scans roots are shown inside a top node)
+        top_tag = self.get_roots_tag() if self.multi_root else None
+
+        # getting tree renderer
+        tree_renderer = TreeRenderer(node_store=tree_dict,
+                                     get_path_tag=self.get_path_tag,
+                                     get_skip_node=self.get_skip_node,
+                                     top_tag=top_tag)
+
+        # returning tree renderer
+        return tree_renderer
+
     def update_tree(self) -> None:
         """
         Updates tree based on tree dict.
         """
-        # getting updated tree
-        tree = self.dict_to_tree(tree_dict=self.tree_dict)
+        # checking top mode toggle
+        if self.top_mode:
+
+            # getting largest files/folders report (shown instead of tree)
+            tree = self.top_tracker
+
+        else:
+
+            # getting updated tree (rendered straight from node store, so no treelib nodes are created)
+            tree = self.get_tree_renderer(tree_dict=self.tree_dict)
 
         # updating progress tracker attributes
         self.progress_tracker.tree = tree
 
+    def get_tree_df(self) -> 'DataFrame':
+        """
+        Returns tree table (changed rows in diff
+        mode, and largest files/folders in top
+        mode), as saved to output path.
+        """
+        # checking diff mode toggle
+        if self.diff_mode:
+
+            # getting tree df (changed rows, along with their ancestor folders)
+            tree_df = self.diff_df
+
+        else:
+
+            # getting tree df (largest files/folders only, in top mode)
+            tree_df = self.top_tracker.get_top_df() if self.top_mode else self.dict_to_df(tree_dict=self.tree_dict)
+
+        # returning tree df
+        return tree_df
+
     def save_tree(self) -> None:
         """
         Saves tree as a table in
         given output folder.
         """
-        # getting tree df
-        tree_df = self.dict_to_df(tree_dict=self.tree_dict)
+        # recording table phase (if profiling)
+        with get_profile_phase(profiler=self.profiler,
+                               phase_name='table') as table_phase:
+
+            # getting tree df
+            tree_df = self.get_tree_df()
+
+            # updating table phase entries
+            table_phase['entries'] = len(tree_df)
 
-        # saving df
-        save_df(save_path=self.output_path,
-                df=tree_df)
+        # recording save phase (if profiling)
+        with get_profile_phase(profiler=self.profiler,
+                               phase_name='save') as save_phase:
+
+            # saving df
+            save_df(save_path=self.output_path,
+                    df=tree_df,
+                    output_format=self.output_format)
+
+            # updating save phase entries
+            save_phase['entries'] = len(tree_df)
 
     def update_end_string(self) -> None:
         """
@@ -917,6 +2363,12 @@ class PyTree:
             # updating end string
             end_string += f', {total_size_str}'
 
+            # checking use allocated size toggle
+            if self.use_allocated_size:
+
+                # updating end string
+                end_string += f' allocated'
+
         # checking mode
         if self.loc:
 
@@ -927,6 +2379,16 @@ class PyTree:
             # updating end string
             end_string += f', {total_loc_str}'
 
+        # checking mark truncated toggle
+        if self.mark_truncated:
+
+            # updating end string
+            end_string += f' (truncated below level {self.level})'
+
+        # updating end string (scan time and average rates)
+        end_string += f'\n'
+        end_string += f'{self.get_rates_str()}'
+
         # checking save output toggle
         if self.save_output:
 
@@ -937,6 +2399,115 @@ class PyTree:
         # updating progress tracker attributes
         self.progress_tracker.end_string = end_string
 
+    def get_rates_dict(self) -> dict:
+        """
+        Returns scan average rates (per second),
+        by counter name: files/dirs, and bytes/
+        loc (if files were stat-ed/read).
+        """
+        # getting scan time (avoiding division by zero on instant scans)
+        scan_time = max(self.scan_time, 1e-9)
+
+        # getting files/dirs rates
+        rates_dict = {'files': self.total_files / scan_time,
+                      'dirs': self.total_folders / scan_time}
+
+        # checking whether bytes were tracked
+        if self.include_sizes or self.loc:
+
+            # getting bytes rate
+            rates_dict['bytes'] = self.progress_tracker.current_bytes / scan_time
+
+        # checking mode
+        if self.loc:
+
+            # getting loc rate
+            rates_dict['loc'] = self.total_loc / scan_time
+
+        # returning rates dict
+        return rates_dict
+
+    def get_rates_str(self) -> str:
+        """
+        Returns scan time and average
+        rates as a string.
+        """
+        # getting rates dict
+        rates_dict = self.get_rates_dict()
+
+        # getting scan time string (sub-second resolution on short scans)
+        scan_time_str = get_time_str(time_in_seconds=self.scan_time) if self.scan_time >= 60 else f'{self.scan_time:.3f}s'
+
+        # assembling rates string
+        rates_str = f'scanned in {scan_time_str}'
+        rates_str += f' | {round(rates_dict["files"])} files/s'
+        rates_str += f' | {round(rates_dict["dirs"])} dirs/s'
+
+        # checking whether bytes rate was obtained
+        if 'bytes' in rates_dict:
+
+            # updating rates string
+            rates_str += f' | {get_size_str(size_in_bytes=round(rates_dict["bytes"]))}/s'
+
+        # checking whether loc rate was obtained
+        if 'loc' in rates_dict:
+
+            # updating rates string
+            rates_str += f' | {round(rates_dict["loc"])} loc/s'
+
+        # returning rates string
+        return rates_str
+
+    def update_diff_end_string(self) -> None:
+        """
+        Updates end string with changes
+        summary (added/removed/changed
+        counts, and totals deltas).
+        """
+        # getting statuses counts
+        status_counts = self.diff_df['status'].value_counts()
+
+        # assembling end string
+        end_string = f'{status_counts.get(ADDED_STATUS, 0)} added'
+        end_string += f', {status_counts.get(REMOVED_STATUS, 0)} removed'
+        end_string += f', {status_counts.get(CHANGED_STATUS, 0)} changed'
+
+        # checking include sizes toggle
+        if self.include_sizes:
+
+            # getting old/new total sizes
+            old_total_size, new_total_size = self.diff_totals['size']
+
+            # getting total size delta
+            size_delta = new_total_size - old_total_size
+
+            # updating end string
+            end_string += f', {get_size_str(size_in_bytes=new_total_size)}'
+            end_string += f' ({get_delta_str(delta=size_delta, delta_str=get_size_str(abs(size_delta)))})'
+
+        # checking mode
+        if self.loc:
+
+            # getting old/new total loc
+            old_total_loc, new_total_loc = self.diff_totals['loc']
+
+            # getting total loc delta
+            loc_delta = new_total_loc - old_total_loc
+
+            # updating end string
+            end_string += f', {new_total_loc} lines of code'
+            end_string += f' ({get_delta_str(delta=loc_delta, delta_str=str(abs(loc_delta)))})'
+
+        # checking save output toggle
+        if self.save_output:
+
+            # updating end string
+            end_string += f'\n'
+            end_string += f'Saved diff table to "{self.output_path}"'
+
+        # updating progress tracker attributes
+        self.progress_tracker.end_string = end_string
+
     def update_print_end_string(self) -> None:
         """
         Updates end string with folder/files
@@ -963,23 +2534,56 @@ class PyTree:
         scan folder/subfolder/files
         with specified parameters.
         """
-        # updating tree dict
-        self.update_tree_dict()
+        # getting scan start time
+        scan_start_time = perf_counter()
+
+        # recording scan phase (if profiling)
+        with get_profile_phase(profiler=self.profiler,
+                               phase_name='scan') as scan_phase:
+
+            # checking diff mode toggle
+            if self.diff_mode:
+
+                # updating tree dict with changes against saved output table(s)
+                self.update_diff()
+
+            else:
+
+                # updating tree dict
+                self.update_tree_dict()
+
+            # updating scan phase entries
+            scan_phase['entries'] = self.total_folders + self.total_files
+
+        # updating scan time
+        self.scan_time = perf_counter() - scan_start_time
 
         # checking whether to show tree
         if self.show_tree:
 
-            # updating tree
-            self.update_tree()
+            # recording tree phase (if profiling)
+            with get_profile_phase(profiler=self.profiler,
+                                   phase_name='tree'):
 
-        # checking whether to save tree
-        if self.save_output:
+                # updating tree
+                self.update_tree()
+
+        # checking whether to save tree (streamed output is already saved)
+        if self.save_output and not self.stream_output:
 
             # saving tree
             self.save_tree()
 
-        # updating end string
-        self.update_end_string()
+        # checking diff mode toggle
+        if self.diff_mode:
+
+            # updating end string with changes summary
+            self.update_diff_end_string()
+
+        else:
+
+            # updating end string
+            self.update_end_string()
 
         # updating print end string
         self.update_print_end_string()
@@ -0,0 +1,137 @@
+# RowWriter module
+
+# Code destined to defining
+# RowWriter class and related
+# attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from json import dumps
+from csv import writer
+from typing import TextIO
+from threading import Lock
+from bz2 import open as bz2_open
+from gzip import open as gzip_open
+from lzma import open as lzma_open
+
+#####################################################################
+# RowWriter definition
+
+
+class RowWriter:
+    """
+    Defines RowWriter class.
+    Writes output table rows one at a time
+    (as soon as they are scanned), either as
+    (optionally compressed) csv or as newline
+    delimited json, so that rows don't need to
+    be kept in memory. Rows may be written from
+    several threads (e.g. multi root scans).
+    """
+    def __init__(self,
+                 output_path: str,
+                 output_format: str,
+                 columns: list
+                 ) -> None:
+        """
+        Initializes a RowWriter instance
+        and defines class attributes.
+        """
+        # creating attributes from input
+        self.output_path = output_path
+        self.output_format = output_format
+        self.columns = columns
+
+        # getting output is ndjson bool
+        self.output_is_ndjson = (self.output_format == 'ndjson')
+
+        # opening output file
+        self.output_file = self.open_output_file()
+
+        # defining placeholder value for csv writer
+        self.csv_writer = None
+
+        # checking whether output is csv
+        if not self.output_is_ndjson:
+
+            # getting csv writer
+            self.csv_writer = writer(self.output_file)
+
+            # writing header
+            self.csv_writer.writerow(self.columns)
+
+        # rows count
+        self.rows_num = 0
+
+        # defining write lock (rows of concurrently scanned roots share output file)
+        self.lock = Lock()
+
+    def open_output_file(self) -> TextIO:
+        """
+        Opens output file for text writing,
+        compressing it according to output
+        format/path extension.
+        """
+        # getting lower output path
+        lower_output_path = self.output_path.lower()
+
+        # checking compression
+        if self.output_format == 'csv.gz' or lower_output_path.endswith('.gz'):
+
+            # opening gzip file
+            output_file = gzip_open(self.output_path, 'wt', newline='')
+
+        elif lower_output_path.endswith('.bz2'):
+
+            # opening bz2 file
+            output_file = bz2_open(self.output_path, 'wt', newline='')
+
+        elif lower_output_path.endswith('.xz'):
+
+            # opening lzma file
+            output_file = lzma_open(self.output_path, 'wt', newline='')
+
+        else:
+
+            # opening plain file
+            output_file = open(self.output_path, 'w', newline='')
+
+        # returning output file
+        return output_file
+
+    def write_row(self,
+                  row_dict: dict
+                  ) -> None:
+        """
+        Given a row dict ({column: value},
+        missing columns are left empty),
+        writes it to output file.
+        """
+        # acquiring write lock
+        with self.lock:
+
+            # checking whether output is ndjson
+            if self.output_is_ndjson:
+
+                # writing json line
+                self.output_file.write(dumps(row_dict) + '\n')
+
+            else:
+
+                # writing csv row
+                self.csv_writer.writerow([row_dict.get(column, '') for column in self.columns])
+
+            # updating rows count
+            self.rows_num += 1
+
+    def close(self) -> None:
+        """
+        Closes output file.
+        """
+        # closing output file
+        self.output_file.close()
+
+######################################################################
+# end of current module
@@ -0,0 +1,381 @@
+# ScanCache module
+
+# Code destined to defining
+# ScanCache class and related
+# attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from os import stat
+from time import time
+from json import dumps
+from json import loads
+from os import DirEntry
+from os import makedirs
+from os.path import join
+from threading import Lock
+from os import stat_result
+from sqlite3 import connect
+from pytree.utils.aux_funcs import scan_dir
+from pytree.classes.CachedEntry import CachedEntry
+from pytree.utils.global_vars import SCAN_CACHE_NAME
+from pytree.utils.global_vars import RACY_MTIME_SECONDS
+
+#####################################################################
+# ScanCache definition
+
+
+class ScanCache:
+    """
+    Defines ScanCache class.
+    Stores folders listings (subfolders/files
+    names and files stat results) and python
+    files lines of code in a sqlite file, so
+    that folders whose modification time (and
+    inode) didn't change since previous run
+    are not listed/stat-ed again.
+    !Files modified in place (without creating,
+    removing or renaming folder entries) don't
+    change folder mtime, and won't be detected!
+    """
+    def __init__(self,
+                 cache_dir: str
+                 ) -> None:
+        """
+        Initializes a ScanCache instance
+        and defines class attributes.
+        """
+        # creating attributes from input
+        self.cache_dir = cache_dir
+
+        # getting cache path
+        self.cache_path = join(self.cache_dir, SCAN_CACHE_NAME)
+
+        # creating cache folder (if non-existent)
+        makedirs(self.cache_dir,
+                 exist_ok=True)
+
+        # connecting to cache (shared by walker threads, so access is guarded by lock)
+        self.connection = connect(self.cache_path,
+                                  check_same_thread=False)
+        self.lock = Lock()
+
+        # creating cache tables (if non-existent)
+        self.create_tables()
+
+        # hits/misses counts
+        self.folder_hits = 0
+        self.folder_misses = 0
+
+    def create_tables(self) -> None:
+        """
+        Creates folders/loc cache tables.
+        """
+        # creating tables
+        with self.lock:
+            self.connection.execute('PRAGMA synchronous = OFF')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS folders ('
+                                    'path TEXT PRIMARY KEY, '
+                                    'mtime_ns INTEGER, '
+                                    'inode INTEGER, '
+                                    'listing TEXT)')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS files_loc ('
+                                    'path TEXT PRIMARY KEY, '
+                                    'size INTEGER, '
+                                    'mtime_ns INTEGER, '
+                                    'loc INTEGER, '
+                                    'com INTEGER)')
+
+    @staticmethod
+    def stat_to_list(entry_stat: stat_result) -> list:
+        """
+        Given a stat result, returns list
+        of fields stored in cache.
+        """
+        # getting stat fields (st_blocks is not available on every platform)
+        stat_list = [entry_stat.st_mode,
+                     entry_stat.st_ino,
+                     entry_stat.st_dev,
+                     entry_stat.st_nlink,
+                     entry_stat.st_size,
+                     entry_stat.st_mtime_ns,
+                     getattr(entry_stat, 'st_blocks', None)]
+
+        # returning stat list
+        return stat_list
+
+    @staticmethod
+    def list_to_stat(stat_list: list) -> stat_result:
+        """
+        Given a list of stored stat fields,
+        returns respective stat result.
+        """
+        # getting stat fields
+        mode, ino, dev, nlink, size, mtime_ns, blocks = stat_list
+
+        # getting mtime in seconds
+        mtime = mtime_ns / 1e9
+
+        # assembling stat result (fields which are not stored are zeroed)
+        entry_stat = stat_result((mode, ino, dev, nlink, 0, 0, size, mtime, mtime, mtime),
+                                 {'st_mtime_ns': mtime_ns,
+                                  'st_blocks': blocks})
+
+        # returning stat result
+        return entry_stat
+
+    def entry_to_list(self,
+                      entry: DirEntry,
+                      entry_is_dir: bool
+                      ) -> list:
+        """
+        Given a DirEntry, returns list
+        of entry info stored in cache.
+        """
+        # getting entry is symlink bool
+        try:
+            entry_is_symlink = entry.is_symlink()
+        except OSError:
+            entry_is_symlink = False
+
+        # defining placeholder value for stat list (folders stats are not needed)
+        stat_list = None
+
+        # checking whether entry is file
+        if not entry_is_dir:
+
+            # getting entry stat list (None if file can't be stat-ed, e.g. broken symlink)
+            try:
+                stat_list = self.stat_to_list(entry_stat=entry.stat())
+            except OSError:
+                stat_list = None
+
+        # assembling entry list
+        entry_list = [entry.name, entry_is_symlink, stat_list]
+
+        # returning entry list
+        return entry_list
+
+    def list_to_entry(self,
+                      folder_path: str,
+                      entry_list: list,
+                      entry_is_dir: bool
+                      ) -> CachedEntry:
+        """
+        Given a folder path and a cached entry
+        list, returns respective CachedEntry.
+        """
+        # getting entry info
+        name, entry_is_symlink, stat_list = entry_list
+
+        # getting entry stat
+        entry_stat = None if stat_list is None else self.list_to_stat(stat_list=stat_list)
+
+        # assembling cached entry
+        cached_entry = CachedEntry(name=name,
+                                   path=join(folder_path, name),
+                                   entry_is_dir=entry_is_dir,
+                                   entry_is_symlink=entry_is_symlink,
+                                   entry_stat=entry_stat)
+
+        # returning cached entry
+        return cached_entry
+
+    def get_listing(self,
+                    folder_path: str,
+                    folder_stat: stat_result
+                    ) -> tuple | None:
+        """
+        Given a folder path and its current stat,
+        returns cached (subfolders, files) listing,
+        or None if folder isn't cached or changed.
+        """
+        # getting cached row
+        with self.lock:
+            cursor = self.connection.execute('SELECT mtime_ns, inode, listing FROM folders WHERE path = ?',
+                                             (folder_path,))
+            row = cursor.fetchone()
+
+        # checking whether folder is cached
+        if row is None:
+
+            # returning None (folder not cached)
+            return None
+
+        # getting cached row info
+        mtime_ns, inode, listing = row
+
+        # checking whether folder changed since cached
+        if (mtime_ns, inode) != (folder_stat.st_mtime_ns, folder_stat.st_ino):
+
+            # returning None (folder changed)
+            return None
+
+        # getting listing dict
+        listing_dict = loads(listing)
+
+        # rebuilding entries
+        subfolders = [self.list_to_entry(folder_path=folder_path,
+                                         entry_list=entry_list,
+                                         entry_is_dir=True)
+                      for entry_list in listing_dict['subfolders']]
+        files = [self.list_to_entry(folder_path=folder_path,
+                                    entry_list=entry_list,
+                                    entry_is_dir=False)
+                 for entry_list in listing_dict['files']]
+
+        # assembling folder listing
+        folder_listing = (subfolders, files)
+
+        # returning folder listing
+        return folder_listing
+
+    def set_listing(self,
+                    folder_path: str,
+                    folder_stat: stat_result,
+                    folder_listing: tuple
+                    ) -> None:
+        """
+        Given a folder path, its stat (taken before
+        listing) and listing, saves listing to cache.
+        """
+        # getting folder age
+        folder_age = time() - folder_stat.st_mtime_ns / 1e9
+
+        # checking whether folder was modified too recently (a change within the same
+        # mtime tick would go unnoticed, so racy folders are rescanned next time)
+        if folder_age < RACY_MTIME_SECONDS:
+
+            # not caching folder
+            return
+
+        # getting folder subfolders/files
+        subfolders, files = folder_listing
+
+        # assembling listing dict
+        listing_dict = {'subfolders': [self.entry_to_list(entry=entry, entry_is_dir=True) for entry in subfolders],
+                        'files': [self.entry_to_list(entry=entry, entry_is_dir=False) for entry in files]}
+
+        # getting listing string
+        listing = dumps(listing_dict)
+
+        # saving listing
+        with self.lock:
+            self.connection.execute('INSERT OR REPLACE INTO folders VALUES (?, ?, ?, ?)',
+                                    (folder_path, folder_stat.st_mtime_ns, folder_stat.st_ino, listing))
+
+    def scan_dir(self,
+                 folder_path: str
+                 ) -> tuple | None:
+        """
+        Given a path to a folder, returns its subfolders/
+        files entries lists (same as aux_funcs.scan_dir),
+        reusing cached listing if folder didn't change.
+        """
+        # getting folder stat (taken before listing, so that changes during listing invalidate it)
+        try:
+            folder_stat = stat(folder_path)
+        except OSError:
+            return None
+
+        # getting cached listing
+        folder_listing = self.get_listing(folder_path=folder_path,
+                                          folder_stat=folder_stat)
+
+        # checking whether cached listing is valid
+        if folder_listing is not None:
+
+            # updating hits count
+            self.folder_hits += 1
+
+            # returning cached listing
+            return folder_listing
+
+        # updating misses count
+        self.folder_misses += 1
+
+        # listing folder
+        folder_listing = scan_dir(folder_path=folder_path)
+
+        # checking whether folder could be listed
+        if folder_listing is not None:
+
+            # saving listing to cache
+            self.set_listing(folder_path=folder_path,
+                             folder_stat=folder_stat,
+                             folder_listing=folder_listing)
+
+        # returning folder listing
+        return folder_listing
+
+    def get_loc(self,
+                file_entry: DirEntry | CachedEntry
+                ) -> tuple | None:
+        """
+        Given a file entry, returns its cached
+        (loc, com) counts, or None if file isn't
+        cached or changed (size/mtime).
+        """
+        # getting cached row
+        with self.lock:
+            cursor = self.connection.execute('SELECT size, mtime_ns, loc, com FROM files_loc WHERE path = ?',
+                                             (file_entry.path,))
+            row = cursor.fetchone()
+
+        # checking whether file is cached
+        if row is None:
+
+            # returning None (file not cached)
+            return None
+
+        # getting cached row info
+        size, mtime_ns, loc, com = row
+
+        # getting file stat
+        file_stat = file_entry.stat()
+
+        # checking whether file changed since cached
+        if (size, mtime_ns) != (file_stat.st_size, file_stat.st_mtime_ns):
+
+            # returning None (file changed)
+            return None
+
+        # assembling loc/com tuple
+        loc_com = (loc, com)
+
+        # returning loc/com tuple
+        return loc_com
+
+    def set_loc(self,
+                file_entry: DirEntry | CachedEntry,
+                loc_com: tuple
+                ) -> None:
+        """
+        Given a file entry and its (loc, com)
+        counts, saves them to cache.
+        """
+        # getting file stat
+        file_stat = file_entry.stat()
+
+        # getting loc/com
+        loc, com = loc_com
+
+        # saving loc/com
+        with self.lock:
+            self.connection.execute('INSERT OR REPLACE INTO files_loc VALUES (?, ?, ?, ?, ?)',
+                                    (file_entry.path, file_stat.st_size, file_stat.st_mtime_ns, loc, com))
+
+    def close(self) -> None:
+        """
+        Commits cache changes and
+        closes cache connection.
+        """
+        # committing and closing connection
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
+
+######################################################################
+# end of current module
@@ -0,0 +1,344 @@
+# ScanProfiler module
+
+# Code destined to defining
+# ScanProfiler class and related
+# attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from json import dumps
+from typing import Any
+from typing import Iterator
+from threading import Lock
+from time import process_time
+from time import perf_counter
+from contextlib import contextmanager
+from pytree.utils.aux_funcs import get_peak_rss
+from pytree.utils.aux_funcs import get_size_str
+from pytree.utils.global_vars import PROFILE_OPERATIONS
+
+#####################################################################
+# ScanProfiler definition
+
+
+class ScanProfiler:
+    """
+    Defines ScanProfiler class.
+    Records wall/cpu time, entries processed and
+    peak memory (rss) of each run phase (count,
+    scan, tree, table, save, show), along with file
+    system calls (scandir/stat) and loc counts made
+    during each phase (including worker threads).
+    If a stats path is given, stats phase (scan, by
+    default) is also profiled with cProfile, and
+    respective pstats dump is saved to stats path.
+    """
+    def __init__(self,
+                 profile_format: str = 'table',
+                 output_path: str | None = None,
+                 stats_path: str | None = None,
+                 stats_phase: str = 'scan'
+                 ) -> None:
+        """
+        Initializes a ScanProfiler instance
+        and defines class attributes.
+        """
+        # creating attributes from input
+        self.profile_format = profile_format
+        self.output_path = output_path
+        self.stats_path = stats_path
+        self.stats_phase = stats_phase
+
+        # phases (phase dicts by phase name, in run order) and current phase (operations are recorded under it)
+        self.phases = {}
+        self.current_phase = None
+
+        # lock (operations are recorded by worker threads as well)
+        self.lock = Lock()
+
+    def get_phase_dict(self,
+                       phase_name: str
+                       ) -> dict:
+        """
+        Given a phase name, returns respective
+        phase dict (created on first use).
+        """
+        # checking whether phase dict exists
+        if phase_name not in self.phases:
+
+            # creating phase dict
+            self.phases[phase_name] = {'wall_time': 0.0,
+                                       'cpu_time': 0.0,
+                                       'entries': None,
+                                       'peak_rss': None,
+                                       'operations': {}}
+
+        # getting phase dict
+        phase_dict = self.phases[phase_name]
+
+        # returning phase dict
+        return phase_dict
+
+    @contextmanager
+    def phase(self,
+              phase_name: str
+              ) -> Iterator[dict]:
+        """
+        Given a phase name, returns context
+        manager recording phase wall/cpu times
+        and peak rss. Yielded dict entries key
+        can be set to number of processed
+        entries (used to obtain entries/s).
+        """
+        # defining placeholder value for phase entries
+        phase_entries = {'entries': None}
+
+        # getting previous phase (phases may be nested, e.g. show inside exit)
+        previous_phase = self.current_phase
+
+        # updating current phase
+        self.current_phase = phase_name
+
+        # getting cprofile profile (only stats phase is profiled, cProfile is only imported if required)
+        profile = None
+        if self.stats_path is not None and phase_name == self.stats_phase:
+            from cProfile import Profile
+            profile = Profile()
+
+        # getting start times
+        start_wall_time = perf_counter()
+        start_cpu_time = process_time()
+
+        # checking whether phase is profiled
+        if profile is not None:
+
+            # enabling profile
+            profile.enable()
+
+        # running phase
+        try:
+            yield phase_entries
+
+        # recording phase (even if it was interrupted)
+        finally:
+
+            # checking whether phase is profiled
+            if profile is not None:
+
+                # disabling profile and saving stats
+                profile.disable()
+                profile.dump_stats(self.stats_path)
+
+            # getting phase times
+            wall_time = perf_counter() - start_wall_time
+            cpu_time = process_time() - start_cpu_time
+
+            # resetting current phase
+            self.current_phase = previous_phase
+
+            # checking lock to avoid race conditions with operations recorded by worker threads
+            with self.lock:
+
+                # getting phase dict
+                phase_dict = self.get_phase_dict(phase_name=phase_name)
+
+                # updating phase dict
+                phase_dict['wall_time'] += wall_time
+                phase_dict['cpu_time'] += cpu_time
+                phase_dict['peak_rss'] = get_peak_rss()
+
+                # checking whether phase entries were given
+                if phase_entries['entries'] is not None:
+
+                    # updating phase entries
+                    phase_dict['entries'] = (phase_dict['entries'] or 0) + phase_entries['entries']
+
+    def add_operation(self,
+                      operation_name: str,
+                      elapsed_time: float,
+                      calls: int = 1
+                      ) -> None:
+        """
+        Given an operation name (e.g. scandir,
+        stat, loc), its elapsed time and number
+        of calls, adds them to current phase.
+        """
+        # checking lock to avoid race conditions (operations are recorded by worker threads as well)
+        with self.lock:
+
+            # getting current phase dict (operations outside phases are recorded as other)
+            phase_dict = self.get_phase_dict(phase_name=(self.current_phase or 'other'))
+
+            # getting operation dict
+            operation_dict = phase_dict['operations'].setdefault(operation_name, {'calls': 0,
+                                                                                  'time': 0.0})
+
+            # updating operation dict
+            operation_dict['calls'] += calls
+            operation_dict['time'] += elapsed_time
+
+    def get_profile_dict(self) -> dict:
+        """
+        Returns profile as a dict (phases
+        times, entries, entries/s, operations
+        and peak rss, plus totals).
+        """
+        # defining placeholder value for phases list
+        phases_list = []
+
+        # iterating over phases
+        for phase_name, phase_dict in self.phases.items():
+
+            # getting phase entries/wall time
+            entries = phase_dict['entries']
+            wall_time = phase_dict['wall_time']
+
+            # getting entries per second (None if phase entries weren't given)
+            entries_per_second = None if entries is None or wall_time <= 0 else entries / wall_time
+
+            # assembling phase profile
+            phase_profile = {'phase': phase_name,
+                             'wall_time': wall_time,
+                             'cpu_time': phase_dict['cpu_time'],
+                             'entries': entries,
+                             'entries_per_second': entries_per_second,
+                             'operations': phase_dict['operations'],
+                             'peak_rss': phase_dict['peak_rss']}
+
+            # appending phase profile to list
+            phases_list.append(phase_profile)
+
+        # assembling profile dict
+        profile_dict = {'phases': phases_list,
+                        'wall_time': sum(phase_dict['wall_time'] for phase_dict in self.phases.values()),
+                        'cpu_time': sum(phase_dict['cpu_time'] for phase_dict in self.phases.values()),
+                        'peak_rss': get_peak_rss(),
+                        'stats_path': self.stats_path}
+
+        # returning profile dict
+        return profile_dict
+
+    def get_profile_lines(self) -> list:
+        """
+        Returns profile as table lines
+        (one row per phase, operations
+        shown as "calls (time)").
+        """
+        # getting profile dict
+        profile_dict = self.get_profile_dict()
+
+        # getting operations names (known operations first, in fixed order)
+        operations_names = [operation_name
+                            for operation_name
+                            in PROFILE_OPERATIONS
+                            if any(operation_name in phase_profile['operations']
+                                   for phase_profile
+                                   in profile_dict['phases'])]
+
+        # assembling header row
+        header_row = ['phase', 'wall time', 'cpu time', 'entries', 'entries/s', *operations_names, 'peak rss']
+
+        # defining placeholder value for table rows
+        table_rows = [header_row]
+
+        # iterating over phase profiles
+        for phase_profile in profile_dict['phases']:
+
+            # getting phase row
+            phase_row = [phase_profile['phase'],
+                         f'{phase_profile["wall_time"]:.3f}s',
+                         f'{phase_profile["cpu_time"]:.3f}s',
+                         '-' if phase_profile['entries'] is None else str(phase_profile['entries']),
+                         '-' if phase_profile['entries_per_second'] is None else str(round(phase_profile['entries_per_second']))]
+
+            # iterating over operations names
+            for operation_name in operations_names:
+
+                # getting operation dict
+                operation_dict = phase_profile['operations'].get(operation_name)
+
+                # appending operation cell
+                phase_row.append('-' if operation_dict is None else f'{operation_dict["calls"]} ({operation_dict["time"]:.3f}s)')
+
+            # appending peak rss cell
+            phase_row.append('-' if phase_profile['peak_rss'] is None else get_size_str(size_in_bytes=phase_profile['peak_rss']))
+
+            # appending phase row to table rows
+            table_rows.append(phase_row)
+
+        # appending total row
+        table_rows.append(['total',
+                           f'{profile_dict["wall_time"]:.3f}s',
+                           f'{profile_dict["cpu_time"]:.3f}s',
+                           *(['-'] * (len(header_row) - 4)),
+                           '-' if profile_dict['peak_rss'] is None else get_size_str(size_in_bytes=profile_dict['peak_rss'])])
+
+        # getting columns widths
+        columns_widths = [max(len(table_row[column_index]) for table_row in table_rows)
+                          for column_index
+                          in range(len(header_row))]
+
+        # getting profile lines (phase names left aligned, values right aligned)
+        profile_lines = ['  '.join(cell.ljust(width) if column_index == 0 else cell.rjust(width)
+                                   for column_index, (cell, width)
+                                   in enumerate(zip(table_row, columns_widths)))
+                         for table_row
+                         in table_rows]
+
+        # checking whether stats were saved
+        if self.stats_path is not None:
+
+            # appending stats line
+            profile_lines.append(f'Saved {self.stats_phase} phase cProfile stats to "{self.stats_path}"')
+
+        # returning profile lines
+        return profile_lines
+
+    def get_report(self) -> str:
+        """
+        Returns profile report
+        (in profile format).
+        """
+        # checking profile format
+        if self.profile_format == 'json':
+
+            # getting json report
+            report = dumps(self.get_profile_dict(),
+                           indent=2)
+
+        else:
+
+            # getting table report
+            report = '\n'.join(self.get_profile_lines())
+
+        # returning report
+        return report
+
+    def write_report(self,
+                     output_file: Any = None
+                     ) -> None:
+        """
+        Writes profile report to output path
+        (if given), or to given output file
+        (current stdout if no file is given).
+        """
+        # getting report
+        report = self.get_report()
+
+        # checking whether output path was given
+        if self.output_path is not None:
+
+            # writing report to output path
+            with open(self.output_path, 'w') as open_file:
+                open_file.write(f'{report}\n')
+
+        else:
+
+            # printing report
+            print(report,
+                  file=output_file)
+
+######################################################################
+# end of current module
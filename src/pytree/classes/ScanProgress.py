@@ -0,0 +1,123 @@
+# ScanProgress module
+
+# Code destined to defining
+# ScanProgress class and related
+# attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from typing import Any
+from typing import Callable
+from time import perf_counter
+from pytree.utils.global_vars import UPDATE_TIME
+
+#####################################################################
+# ScanProgress definition
+
+
+class ScanProgress:
+    """
+    Defines ScanProgress class.
+    Silent progress tracker used by library scans
+    (pytree.scan), holding progress attributes
+    updated by PyTree (same as ModuleProgressTracker),
+    without progress thread or console output.
+    If a progress callback is given, it is called
+    with folders/files scanned so far as folders
+    are scanned (at most once per callback interval),
+    and once scan is over.
+    """
+    def __init__(self,
+                 progress_callback: Callable | None = None,
+                 callback_interval: float = UPDATE_TIME
+                 ) -> None:
+        """
+        Initializes a ScanProgress instance
+        and defines class attributes.
+        """
+        # creating attributes from input
+        self.progress_callback = progress_callback
+        self.callback_interval = callback_interval
+
+        # folders (current folder is a property, so that callback is checked on each scanned folder)
+        self.folders_scanned = 0
+
+        # files
+        self.files_num = 0
+        self.current_file = 0
+        self.current_iteration = 0
+
+        # bytes/loc
+        self.current_bytes = 0
+        self.current_loc = 0
+
+        # tree (TreeRenderer/TopTracker, set if nodes are kept) and end strings
+        self.tree = None
+        self.end_string = ''
+        self.print_end_string = ''
+
+        # getting last callback time
+        self.last_callback_time = perf_counter()
+
+    @property
+    def current_folder(self) -> int:
+        """
+        Returns number of folders
+        scanned so far.
+        """
+        # returning folders scanned
+        return self.folders_scanned
+
+    @current_folder.setter
+    def current_folder(self,
+                       folders_scanned: int
+                       ) -> None:
+        """
+        Updates number of folders scanned
+        so far, calling progress callback
+        if callback interval has elapsed.
+        """
+        # updating folders scanned
+        self.folders_scanned = folders_scanned
+
+        # checking whether progress callback was given
+        if self.progress_callback is None:
+
+            # skipping callback
+            return
+
+        # getting current time
+        current_time = perf_counter()
+
+        # checking whether callback interval has elapsed
+        if current_time - self.last_callback_time >= self.callback_interval:
+
+            # updating last callback time
+            self.last_callback_time = current_time
+
+            # calling progress callback
+            self.call_progress_callback()
+
+    def call_progress_callback(self) -> Any:
+        """
+        Calls progress callback (if any) with
+        folders/files scanned so far, returning
+        its result.
+        """
+        # checking whether progress callback was given
+        if self.progress_callback is None:
+
+            # returning None
+            return None
+
+        # calling progress callback
+        callback_result = self.progress_callback(self.folders_scanned,
+                                                 self.current_iteration)
+
+        # returning callback result
+        return callback_result
+
+######################################################################
+# end of current module
@@ -0,0 +1,187 @@
+# ScanResult module
+
+# Code destined to defining
+# ScanResult class and related
+# attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from typing import Any
+from typing import TextIO
+from typing import TYPE_CHECKING
+from pytree.utils.aux_funcs import save_df
+from pytree.utils.aux_funcs import get_output_format
+from pytree.utils.aux_funcs import check_output_format
+
+# importing type checking only libraries (pandas is slow to import, so it's only imported when tables are required)
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+#####################################################################
+# ScanResult definition
+
+
+class ScanResult:
+    """
+    Defines ScanResult class.
+    Holds results of a library scan (pytree.scan):
+    totals, node store (if nodes were kept), and
+    tree/table getters, so that results can be
+    used in-process, without console output.
+    """
+    def __init__(self,
+                 pytree: Any
+                 ) -> None:
+        """
+        Initializes a ScanResult instance
+        and defines class attributes, given
+        a PyTree instance that already ran.
+        """
+        # creating attributes from input
+        self.pytree = pytree
+
+        # getting start paths
+        self.start_paths = pytree.start_paths
+
+        # getting totals
+        self.total_folders = pytree.total_folders
+        self.total_files = pytree.total_files
+        self.valid_files = pytree.valid_files
+        self.total_size = pytree.total_size
+        self.total_loc = pytree.total_loc
+        self.total_com = pytree.total_com
+
+        # getting scan time (in seconds) and average rates (per second, by counter name)
+        self.scan_time = pytree.scan_time
+        self.rates = pytree.get_rates_dict()
+
+        # getting profile (phases times/entries/calls, if profiling was on)
+        self.profile = None if pytree.profiler is None else pytree.profiler.get_profile_dict()
+
+        # getting summary (same as end string printed by cli)
+        self.summary = pytree.progress_tracker.end_string
+
+        # getting node store (only kept if required, e.g. not kept in top mode)
+        self.node_store = pytree.tree_dict if pytree.store_nodes else None
+
+        # getting tree (largest files/folders report in top mode, None if no nodes were kept)
+        self.tree = self.get_tree()
+
+    def get_tree(self) -> Any:
+        """
+        Returns scan result tree (TreeRenderer,
+        or TopTracker in top mode), or None if
+        no nodes were kept.
+        """
+        # checking top mode toggle
+        if self.pytree.top_mode:
+
+            # returning top tracker
+            return self.pytree.top_tracker
+
+        # checking whether nodes were kept
+        if self.node_store is None:
+
+            # returning None
+            return None
+
+        # getting tree renderer
+        tree_renderer = self.pytree.get_tree_renderer(tree_dict=self.node_store)
+
+        # returning tree renderer
+        return tree_renderer
+
+    def get_df(self) -> 'DataFrame':
+        """
+        Returns scan result as a table (same
+        as saved by cli, e.g. changed rows
+        in diff mode).
+        """
+        # checking whether table can be obtained (nodes were kept, or summarized by top tracker)
+        if self.tree is None:
+
+            # raising value error
+            raise ValueError('scan nodes were not kept (scan with keep_nodes=True)')
+
+        # getting tree df
+        tree_df = self.pytree.get_tree_df()
+
+        # returning tree df
+        return tree_df
+
+    def get_lines(self) -> list:
+        """
+        Returns scan result tree lines (or
+        largest folders/files report lines,
+        in top mode), as shown by cli.
+        """
+        # checking whether tree can be obtained
+        if self.tree is None:
+
+            # raising value error
+            raise ValueError('scan nodes were not kept (scan with keep_nodes=True)')
+
+        # getting tree lines
+        tree_lines = list(self.tree.get_lines())
+
+        # returning tree lines
+        return tree_lines
+
+    def get_tree_str(self) -> str:
+        """
+        Returns scan result tree as a
+        string, as shown by cli.
+        """
+        # getting tree string
+        tree_str = '\n'.join(self.get_lines())
+
+        # returning tree string
+        return tree_str
+
+    def render(self,
+               output_file: TextIO | None = None
+               ) -> None:
+        """
+        Writes scan result tree to output
+        file (current stdout if no file is
+        given), as shown by cli.
+        """
+        # checking whether tree can be obtained
+        if self.tree is None:
+
+            # raising value error
+            raise ValueError('scan nodes were not kept (scan with keep_nodes=True)')
+
+        # iterating over tree lines (rendered lazily, so whole tree string is never built)
+        for line in self.tree.get_lines():
+
+            # writing line
+            print(line,
+                  file=output_file)
+
+    def save(self,
+             output_path: str,
+             output_format: str | None = None
+             ) -> None:
+        """
+        Saves scan result table to given
+        output path (format inferred from
+        output path extension, if not given).
+        """
+        # getting output format
+        output_format = get_output_format(output_path=output_path,
+                                          output_format=output_format)
+
+        # checking output format
+        check_output_format(output_format=output_format,
+                            stream=False)
+
+        # saving df
+        save_df(save_path=output_path,
+                df=self.get_df(),
+                output_format=output_format)
+
+######################################################################
+# end of current module
@@ -0,0 +1,395 @@
+# SnapshotDiff module
+
+# Code destined to defining
+# SnapshotDiff class and related
+# attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from numpy import ones
+from numpy import isin
+from numpy import full
+from numpy import array
+from numpy import zeros
+from pandas import Index
+from numpy import ndarray
+from pandas import concat
+from os.path import dirname
+from pandas import DataFrame
+from numpy import concatenate
+from pandas.util import hash_array
+from pytree.classes.NodeStore import NodeStore
+from pytree.utils.global_vars import NO_PARENT
+from pytree.utils.global_vars import FILE_TYPE
+from pytree.utils.global_vars import SAME_STATUS
+from pytree.utils.global_vars import DIFF_COLUMNS
+from pytree.utils.global_vars import ADDED_STATUS
+from pytree.utils.global_vars import REMOVED_STATUS
+from pytree.utils.global_vars import CHANGED_STATUS
+from pytree.utils.global_vars import NODE_TYPE_NAMES
+from pytree.utils.global_vars import SNAPSHOT_COLUMNS
+
+#####################################################################
+# SnapshotDiff definition
+
+
+class SnapshotDiff:
+    """
+    Defines SnapshotDiff class.
+    Compares two saved output tables (snapshots
+    of same start path(s), e.g. from nightly runs),
+    matching rows by path through a path hash index
+    (64 bit hashes of paths, looked up at once), so
+    that per folder/file size/count/loc deltas of
+    large snapshots are obtained with vectorized
+    operations only, instead of per row lookups.
+    """
+    def __init__(self,
+                 old_df: DataFrame,
+                 new_df: DataFrame
+                 ) -> None:
+        """
+        Initializes a SnapshotDiff instance
+        and defines class attributes.
+        """
+        # checking snapshots columns
+        self.check_columns(df=old_df)
+        self.check_columns(df=new_df)
+
+        # creating attributes from input (keeping first row of repeated paths, and path hash indices)
+        self.old_df, self.old_index = self.get_unique_df(df=old_df)
+        self.new_df, self.new_index = self.get_unique_df(df=new_df)
+
+        # defining placeholder value for diff hashes (set when diff df is obtained)
+        self.diff_hashes = None
+
+        # getting compared columns (metrics saved in both snapshots)
+        self.diff_columns = [column
+                             for column
+                             in DIFF_COLUMNS
+                             if column in self.old_df.columns
+                             and column in self.new_df.columns]
+
+    @staticmethod
+    def check_columns(df: DataFrame) -> None:
+        """
+        Given a snapshot df, raises an error
+        if it isn't a tree table (e.g. a
+        largest files/folders table).
+        """
+        # getting missing columns
+        missing_columns = [column for column in SNAPSHOT_COLUMNS if column not in df.columns]
+
+        # checking whether any columns are missing
+        if missing_columns:
+
+            # raising value error
+            raise ValueError(f'diff requires tree output tables (missing columns: {", ".join(missing_columns)})')
+
+    @staticmethod
+    def get_path_hashes(df: DataFrame) -> ndarray:
+        """
+        Given a snapshot df, returns
+        array of its paths 64 bit hashes.
+        """
+        # getting path hashes
+        path_hashes = hash_array(df['path'].to_numpy(dtype=object),
+                                 categorize=False)
+
+        # returning path hashes
+        return path_hashes
+
+    def get_unique_df(self,
+                      df: DataFrame
+                      ) -> tuple:
+        """
+        Given a snapshot df, returns (df, path hash
+        index) tuple, leaving out repeated paths (so
+        that index is unique, and its hash table, built
+        once, can be used for lookups).
+        """
+        # getting path hash index
+        path_index = Index(self.get_path_hashes(df=df))
+
+        # getting repeated paths mask
+        repeated_mask = path_index.duplicated()
+
+        # checking whether any path is repeated
+        if repeated_mask.any():
+
+            # updating df/index
+            df = df[~repeated_mask].reset_index(drop=True)
+            path_index = path_index[~repeated_mask]
+
+        # assembling unique df tuple
+        unique_df = (df, path_index)
+
+        # returning unique df tuple
+        return unique_df
+
+    @staticmethod
+    def get_column_values(df: DataFrame,
+                          column: str
+                          ) -> ndarray:
+        """
+        Given a snapshot df and a metric column,
+        returns its values as an int array
+        (missing values, e.g. files counts, as 0).
+        """
+        # getting column values
+        column_values = df[column].fillna(0).to_numpy(dtype='int64')
+
+        # returning column values
+        return column_values
+
+    def get_diff_df(self) -> DataFrame:
+        """
+        Returns diff df, with one row per path found
+        in any snapshot (new snapshot rows first, then
+        removed rows), holding new/old values, deltas
+        and status (same/changed/added/removed).
+        """
+        # getting old snapshot positions of new snapshot paths (-1 for added paths), using path hash index
+        old_positions = self.old_index.get_indexer(self.new_index)
+
+        # getting matched mask (new snapshot rows found in old snapshot)
+        matched_mask = (old_positions != -1)
+
+        # getting matched old positions
+        matched_positions = old_positions[matched_mask]
+
+        # getting removed mask (old snapshot rows not found in new snapshot)
+        removed_mask = ones(len(self.old_df), dtype=bool)
+        removed_mask[matched_positions] = False
+
+        # getting removed df
+        removed_df = self.old_df[removed_mask].reset_index(drop=True)
+
+        # defining base changed mask
+        changed_mask = zeros(len(self.new_df), dtype=bool)
+
+        # defining base columns dicts
+        new_columns = {column: self.new_df[column] for column in SNAPSHOT_COLUMNS}
+        removed_columns = {column: removed_df[column] for column in SNAPSHOT_COLUMNS}
+
+        # iterating over compared columns
+        for column in self.diff_columns:
+
+            # getting new/old values
+            new_values = self.get_column_values(df=self.new_df,
+                                                column=column)
+            old_values = self.get_column_values(df=self.old_df,
+                                                column=column)
+
+            # getting matched rows old values (added rows have no old value)
+            matched_old_values = zeros(len(self.new_df), dtype='int64')
+            matched_old_values[matched_mask] = old_values[matched_positions]
+
+            # getting deltas
+            deltas = new_values - matched_old_values
+
+            # updating changed mask
+            changed_mask |= (matched_mask & (deltas != 0))
+
+            # getting removed rows old values
+            removed_old_values = old_values[removed_mask]
+
+            # updating columns dicts (removed rows have no new values)
+            new_columns[column] = new_values
+            new_columns[f'old_{column}'] = matched_old_values
+            new_columns[f'{column}_delta'] = deltas
+            removed_columns[column] = zeros(len(removed_df), dtype='int64')
+            removed_columns[f'old_{column}'] = removed_old_values
+            removed_columns[f'{column}_delta'] = -removed_old_values
+
+        # getting new rows statuses
+        new_statuses = full(len(self.new_df), ADDED_STATUS, dtype=object)
+        new_statuses[matched_mask] = SAME_STATUS
+        new_statuses[changed_mask] = CHANGED_STATUS
+
+        # updating columns dicts
+        new_columns['status'] = new_statuses
+        removed_columns['status'] = full(len(removed_df), REMOVED_STATUS, dtype=object)
+
+        # updating diff hashes (diff df path hashes, indexed by diff df row)
+        self.diff_hashes = concatenate([self.new_index.to_numpy(),
+                                        self.old_index.to_numpy()[removed_mask]])
+
+        # assembling diff df
+        diff_df = concat([DataFrame(new_columns),
+                          DataFrame(removed_columns)],
+                         ignore_index=True)
+
+        # checking whether counts were compared
+        if 'count' in self.diff_columns:
+
+            # updating files counts (files have no count, as in saved tables)
+            diff_df.loc[diff_df['type'] == NODE_TYPE_NAMES[FILE_TYPE], ['count', 'old_count', 'count_delta']] = None
+
+        # returning diff df
+        return diff_df
+
+    def get_changed_df(self,
+                       diff_df: DataFrame
+                       ) -> DataFrame:
+        """
+        Given a diff df (or a filtered part of it),
+        returns its changed (changed/added/removed)
+        rows, along with their ancestor folders (so
+        that changed rows can be shown as a tree),
+        sorted by path (each folder before its
+        contents). Rows are selected through path
+        hashes, so only changed paths are handled
+        one by one.
+        """
+        # getting changed mask
+        changed_mask = (diff_df['status'] != SAME_STATUS).to_numpy()
+
+        # getting changed paths
+        changed_paths = diff_df['path'][changed_mask].tolist()
+
+        # defining base ancestor paths set
+        ancestor_paths = set()
+
+        # iterating over changed paths
+        for path in changed_paths:
+
+            # getting parent path
+            parent_path = dirname(path)
+
+            # climbing up until an already visited folder (or file system root) is reached
+            while parent_path not in ancestor_paths and parent_path != path:
+
+                # updating ancestor paths
+                ancestor_paths.add(parent_path)
+
+                # updating paths
+                path, parent_path = parent_path, dirname(parent_path)
+
+        # getting kept paths hashes (ancestors above start paths are not in table, so they aren't matched)
+        kept_hashes = hash_array(array([*changed_paths, *ancestor_paths], dtype=object),
+                                 categorize=False)
+
+        # getting kept mask
+        kept_mask = isin(self.diff_hashes[diff_df.index], kept_hashes)
+
+        # getting changed df (parents paths are prefixes of children's, so they're sorted first)
+        changed_df = diff_df[kept_mask].sort_values(by='path',
+                                                    ignore_index=True)
+
+        # returning changed df
+        return changed_df
+
+    def get_diff_store(self,
+                       changed_df: DataFrame
+                       ) -> tuple:
+        """
+        Given a changed df (sorted by path), returns
+        (node_store, deltas_dict, statuses) tuple, where
+        node store holds changed df rows values (old
+        values, for removed rows), and deltas dict
+        ({column: deltas}) and statuses list are
+        indexed by node index.
+        """
+        # getting removed mask
+        removed_mask = (changed_df['status'] == REMOVED_STATUS)
+
+        # getting changed df roots (rows whose parent isn't in table)
+        root_mask = ~changed_df['parent'].isin(changed_df['path'])
+
+        # getting root paths
+        root_paths = changed_df['path'][root_mask].tolist()
+
+        # getting diff store
+        diff_store = NodeStore(root_path=root_paths[0] if root_paths else '',
+                               include_sizes=('size' in self.diff_columns),
+                               include_counts=('count' in self.diff_columns),
+                               include_loc=('loc' in self.diff_columns),
+                               include_extra_sizes=('apparent_size' in self.diff_columns))
+
+        # getting node columns values (nodes are added bottom-up, so rows are reversed)
+        names = changed_df['name'].tolist()[::-1]
+        paths = changed_df['path'].tolist()[::-1]
+        parents = changed_df['parent'].tolist()[::-1]
+        levels = changed_df['level'].tolist()[::-1]
+        node_types = [NODE_TYPE_NAMES.index(node_type) for node_type in changed_df['type'].tolist()[::-1]]
+        columns_values = {column: changed_df[column].where(~removed_mask,
+                                                           changed_df[f'old_{column}']).fillna(0).astype('int64').tolist()[::-1]
+                          for column
+                          in self.diff_columns}
+
+        # iterating over rows
+        for row_index, name in enumerate(names):
+
+            # getting node values
+            node_values = {column: column_values[row_index] for column, column_values in columns_values.items()}
+
+            # adding node to store
+            diff_store.add_node(name=name,
+                                level=levels[row_index],
+                                node_type=node_types[row_index],
+                                size=node_values.get('size', 0),
+                                count=node_values.get('count', -1),
+                                loc=node_values.get('loc', 0),
+                                com=node_values.get('com', 0),
+                                apparent_size=node_values.get('apparent_size', 0),
+                                allocated_size=node_values.get('allocated_size', 0))
+
+        # getting path indices dict ({path: node_index})
+        path_indices = {path: node_index for node_index, path in enumerate(paths)}
+
+        # iterating over nodes parents
+        for node_index, parent_path in enumerate(parents):
+
+            # getting parent index
+            parent_index = path_indices.get(parent_path, NO_PARENT)
+
+            # checking whether node is root
+            if parent_index == NO_PARENT:
+
+                # updating root paths
+                diff_store.root_paths[node_index] = paths[node_index]
+
+            else:
+
+                # updating node parent
+                diff_store.set_parent(node_index=node_index,
+                                      parent_index=parent_index)
+
+        # getting deltas dict
+        deltas_dict = {column: changed_df[f'{column}_delta'].fillna(0).astype('int64').tolist()[::-1]
+                       for column
+                       in self.diff_columns}
+
+        # getting statuses
+        statuses = changed_df['status'].tolist()[::-1]
+
+        # assembling diff store tuple
+        diff_store_tuple = (diff_store, deltas_dict, statuses)
+
+        # returning diff store tuple
+        return diff_store_tuple
+
+    def get_totals_dict(self) -> dict:
+        """
+        Returns dict of old/new snapshots totals
+        ({column: (old_total, new_total)}), summed
+        over roots (level 0 rows).
+        """
+        # getting roots dfs
+        old_roots_df = self.old_df[self.old_df['level'] == 0]
+        new_roots_df = self.new_df[self.new_df['level'] == 0]
+
+        # getting totals dict
+        totals_dict = {column: (int(self.get_column_values(df=old_roots_df, column=column).sum()),
+                                int(self.get_column_values(df=new_roots_df, column=column).sum()))
+                       for column
+                       in self.diff_columns}
+
+        # returning totals dict
+        return totals_dict
+
+######################################################################
+# end of current module
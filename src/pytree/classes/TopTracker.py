@@ -0,0 +1,201 @@
+# TopTracker module
+
+# Code destined to defining
+# TopTracker class and related
+# attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from heapq import heappush
+from threading import Lock
+from heapq import heappushpop
+from typing import TYPE_CHECKING
+from pytree.utils.aux_funcs import get_size_str
+
+# importing type checking only libraries (pandas is slow to import, so it's only imported when tables are required)
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+#####################################################################
+# TopTracker definition
+
+
+class TopTracker:
+    """
+    Defines TopTracker class.
+    Keeps largest files/folders found during
+    scan in bounded min heaps of (size, path)
+    tuples, so that top N report is obtained
+    in O(N) memory, without keeping tree nodes.
+    Entries may be added from several threads
+    (e.g. multi root scans).
+    """
+    def __init__(self,
+                 top_num: int
+                 ) -> None:
+        """
+        Initializes a TopTracker instance
+        and defines class attributes.
+        """
+        # creating attributes from input
+        self.top_num = top_num
+
+        # defining base heaps (smallest kept entry on top)
+        self.files_heap = []
+        self.folders_heap = []
+
+        # defining heaps lock
+        self.lock = Lock()
+
+    def add_entry(self,
+                  heap: list,
+                  size: int,
+                  path: str
+                  ) -> None:
+        """
+        Given a heap and an entry size/path,
+        adds entry to heap if it is among
+        largest top num entries.
+        """
+        # checking whether entry can't make it into full heap (checked without lock, since most entries don't)
+        if len(heap) >= self.top_num and size <= heap[0][0]:
+
+            # skipping entry
+            return
+
+        # acquiring heaps lock
+        with self.lock:
+
+            # checking whether heap is full
+            if len(heap) < self.top_num:
+
+                # adding entry to heap
+                heappush(heap, (size, path))
+
+            else:
+
+                # replacing smallest entry (kept out if it's still the smallest)
+                heappushpop(heap, (size, path))
+
+    def add_file(self,
+                 size: int,
+                 path: str
+                 ) -> None:
+        """
+        Given a file size/path, adds
+        it to largest files heap.
+        """
+        # adding entry to files heap
+        self.add_entry(heap=self.files_heap,
+                       size=size,
+                       path=path)
+
+    def add_folder(self,
+                   size: int,
+                   path: str
+                   ) -> None:
+        """
+        Given a folder size/path, adds
+        it to largest folders heap.
+        """
+        # adding entry to folders heap
+        self.add_entry(heap=self.folders_heap,
+                       size=size,
+                       path=path)
+
+    @staticmethod
+    def get_sorted_entries(heap: list) -> list:
+        """
+        Given a heap, returns its (size, path)
+        entries sorted by size (largest first).
+        """
+        # getting sorted entries
+        sorted_entries = sorted(heap,
+                                reverse=True)
+
+        # returning sorted entries
+        return sorted_entries
+
+    def get_report_lines(self,
+                         title: str,
+                         heap: list
+                         ) -> list:
+        """
+        Given a report section title and
+        heap, returns section lines.
+        """
+        # getting sorted entries
+        sorted_entries = self.get_sorted_entries(heap=heap)
+
+        # defining base report lines
+        report_lines = [f'{title} ({len(sorted_entries)}):']
+
+        # getting sizes strings
+        size_strs = [get_size_str(size_in_bytes=size) for size, _ in sorted_entries]
+
+        # getting columns widths
+        rank_width = len(str(len(sorted_entries)))
+        size_width = max((len(size_str) for size_str in size_strs), default=0)
+
+        # iterating over sorted entries
+        for rank, (size_str, (_, path)) in enumerate(zip(size_strs, sorted_entries), start=1):
+
+            # updating report lines
+            report_lines.append(f'{rank:>{rank_width}}. {size_str:>{size_width}}  {path}')
+
+        # returning report lines
+        return report_lines
+
+    def get_lines(self) -> list:
+        """
+        Returns largest folders/files
+        report lines (folders first).
+        """
+        # getting report lines
+        report_lines = self.get_report_lines(title='largest folders',
+                                             heap=self.folders_heap)
+        report_lines.append('')
+        report_lines += self.get_report_lines(title='largest files',
+                                              heap=self.files_heap)
+
+        # returning report lines
+        return report_lines
+
+    def show(self) -> None:
+        """
+        Prints largest folders/files
+        report on console.
+        """
+        # getting report lines
+        report_lines = self.get_lines()
+
+        # printing report
+        print('\n'.join(report_lines))
+        print()
+
+    def get_top_df(self) -> 'DataFrame':
+        """
+        Returns largest folders/files
+        as a DataFrame (folders first,
+        each sorted by size).
+        """
+        # importing pandas (only imported when tables are required)
+        from pandas import DataFrame
+
+        # getting sorted entries
+        sorted_folders = self.get_sorted_entries(heap=self.folders_heap)
+        sorted_files = self.get_sorted_entries(heap=self.files_heap)
+
+        # assembling top df
+        top_df = DataFrame({'rank': [*range(1, len(sorted_folders) + 1), *range(1, len(sorted_files) + 1)],
+                            'type': ['folder'] * len(sorted_folders) + ['file'] * len(sorted_files),
+                            'path': [path for _, path in sorted_folders + sorted_files],
+                            'size': [size for size, _ in sorted_folders + sorted_files]})
+
+        # returning top df
+        return top_df
+
+######################################################################
+# end of current module
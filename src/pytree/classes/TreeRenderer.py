@@ -0,0 +1,236 @@
+# TreeRenderer module
+
+# Code destined to defining
+# TreeRenderer class and related
+# attributes/methods.
+
+######################################################################
+# imports
+
+# importing required libraries
+from typing import TextIO
+from typing import Callable
+from typing import Iterator
+from operator import itemgetter
+from pytree.classes.NodeStore import NodeStore
+from pytree.utils.global_vars import NO_PARENT
+from pytree.utils.global_vars import EMPTY_PREFIX
+from pytree.utils.global_vars import BOX_LINE_PREFIX
+from pytree.utils.global_vars import RENDER_CHUNK_SIZE
+from pytree.utils.global_vars import CORNER_LINE_PREFIX
+from pytree.utils.global_vars import VERTICAL_LINE_PREFIX
+
+#####################################################################
+# TreeRenderer definition
+
+
+class TreeRenderer:
+    """
+    Defines TreeRenderer class.
+    Renders node store as box-drawing lines
+    (same output as treelib.Tree.show, with
+    children sorted by tag), writing lines to
+    output file in chunks, as nodes are visited
+    depth first. Only sorted children of nodes
+    in current path are kept in memory, so no
+    per node objects (nor whole tree string)
+    are created.
+    """
+    def __init__(self,
+                 node_store: NodeStore,
+                 get_path_tag: Callable,
+                 get_skip_node: Callable,
+                 top_tag: str | None = None
+                 ) -> None:
+        """
+        Initializes a TreeRenderer instance
+        and defines class attributes.
+        get_path_tag is called with node_index and
+        path_is_file, get_skip_node with node_index.
+        If a top tag is given (e.g. multi root scans),
+        root nodes are rendered inside a top node.
+        """
+        # creating attributes from input
+        self.node_store = node_store
+        self.get_path_tag = get_path_tag
+        self.get_skip_node = get_skip_node
+        self.top_tag = top_tag
+
+    def get_sorted_children(self,
+                            children_offsets: tuple,
+                            node_index: int
+                            ) -> list:
+        """
+        Given children offsets and a node index
+        (NO_PARENT for roots), returns list of
+        (node_index, tag, is_last) tuples of node
+        children that are not skipped, sorted by tag.
+        """
+        # getting offsets/children arrays
+        offsets, children = children_offsets
+
+        # getting node slot (roots are stored in first slot)
+        node_slot = node_index + 1
+
+        # getting node children tags (children are stored top-down, as treelib insertion order)
+        children_tags = [(self.get_path_tag(node_index=child_index,
+                                            path_is_file=self.node_store.is_file(node_index=child_index)),
+                          child_index)
+                         for child_index
+                         in children[offsets[node_slot]:offsets[node_slot + 1]]
+                         if not self.get_skip_node(node_index=child_index)]
+
+        # sorting children by tag (stable, as treelib sorting)
+        children_tags.sort(key=itemgetter(0))
+
+        # getting last child index
+        last_index = len(children_tags) - 1
+
+        # assembling sorted children list
+        sorted_children = [(child_index, child_tag, index == last_index)
+                           for index, (child_tag, child_index)
+                           in enumerate(children_tags)]
+
+        # returning sorted children list
+        return sorted_children
+
+    def get_lines(self) -> Iterator[str]:
+        """
+        Yields tree lines (without line
+        breaks) in depth first order.
+        """
+        # getting children offsets
+        children_offsets = self.node_store.get_children_offsets()
+
+        # getting top level nodes (roots)
+        top_children = self.get_sorted_children(children_offsets=children_offsets,
+                                                node_index=NO_PARENT)
+
+        # checking whether top tag was given
+        if self.top_tag is not None:
+
+            # yielding top line
+            yield self.top_tag
+
+            # defining walk stack (children iterator, children lines prefix)
+            walk_stack = [(iter(top_children), '')]
+
+        else:
+
+            # checking whether there is a root node
+            if not top_children:
+
+                # ending lines
+                return
+
+            # getting root node (single root)
+            root_index, root_tag, _ = top_children[0]
+
+            # yielding root line
+            yield root_tag
+
+            # getting root children
+            root_children = self.get_sorted_children(children_offsets=children_offsets,
+                                                     node_index=root_index)
+
+            # defining walk stack (children iterator, children lines prefix)
+            walk_stack = [(iter(root_children), '')]
+
+        # running walk until stack is empty
+        while walk_stack:
+
+            # getting current stack top
+            children_iterator, prefix = walk_stack[-1]
+
+            # getting next child
+            child = next(children_iterator, None)
+
+            # checking whether all children were already rendered
+            if child is None:
+
+                # removing level from stack
+                walk_stack.pop()
+
+                # skipping to next stack item
+                continue
+
+            # getting child info
+            child_index, child_tag, child_is_last = child
+
+            # yielding child line
+            yield prefix + (CORNER_LINE_PREFIX if child_is_last else BOX_LINE_PREFIX) + child_tag
+
+            # getting child children
+            child_children = self.get_sorted_children(children_offsets=children_offsets,
+                                                      node_index=child_index)
+
+            # checking whether child has children
+            if child_children:
+
+                # adding child level to stack
+                walk_stack.append((iter(child_children),
+                                   prefix + (EMPTY_PREFIX if child_is_last else VERTICAL_LINE_PREFIX)))
+
+    def render(self,
+               output_file: TextIO | None = None
+               ) -> bool:
+        """
+        Writes tree lines to output file (in
+        chunks, current stdout if no file is
+        given), returning True if any line was
+        written, and False otherwise.
+        """
+        # defining placeholder value for lines chunk
+        lines_chunk = []
+
+        # defining placeholder value for any lines bool
+        any_lines = False
+
+        # iterating over tree lines
+        for line in self.get_lines():
+
+            # updating lines chunk
+            lines_chunk.append(line)
+
+            # checking chunk size
+            if len(lines_chunk) >= RENDER_CHUNK_SIZE:
+
+                # writing lines chunk
+                print('\n'.join(lines_chunk),
+                      file=output_file)
+
+                # resetting lines chunk
+                lines_chunk = []
+
+            # updating any lines bool
+            any_lines = True
+
+        # checking whether there are lines left
+        if lines_chunk:
+
+            # writing lines chunk
+            print('\n'.join(lines_chunk),
+                  file=output_file)
+
+        # returning any lines bool
+        return any_lines
+
+    def show(self) -> None:
+        """
+        Prints tree on console (same
+        as treelib.Tree.show).
+        """
+        # rendering tree
+        any_lines = self.render()
+
+        # checking whether any lines were written
+        if not any_lines:
+
+            # printing empty tree message
+            print('Tree is empty')
+
+        # printing spacer (treelib prints tree string with trailing line break)
+        print()
+
+######################################################################
+# end of current module
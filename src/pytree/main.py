@@ -12,7 +12,11 @@ print('initializing...')  # noqa
 print('importing required libraries...')  # noqa
 from argparse import ArgumentParser
 from pytree.classes.PyTree import PyTree
-from pytree.utils.aux_funcs import get_start_path
+from pytree.utils.aux_funcs import get_size_bytes
+from pytree.utils.aux_funcs import get_start_paths
+from pytree.utils.global_vars import SIZE_MODES
+from pytree.utils.global_vars import OUTPUT_FORMATS
+from pytree.utils.global_vars import PROFILE_FORMATS
 from pytree.classes.PyTree import ModuleProgressTracker
 print('all required libraries successfully imported.')  # noqa
 
@@ -35,7 +39,7 @@ def get_args_dict() -> dict:
     parser.add_argument('start_path',
                         nargs='*',
                         type=str or list,
-                        help='defines path to directory to start building the tree',
+                        help='defines path to directory to start building the tree (several paths are scanned concurrently, and combined in one tree)',
                         default='.')
 
     # dirs only param
@@ -100,7 +104,7 @@ def get_args_dict() -> dict:
                         type=str,
                         required=False,
                         default=None,
-                        help='saves tree as a table in given output path [.csv]')
+                        help='saves tree as a table in given output path [.csv/.csv.gz/.ndjson/.parquet/.feather]')
 
     # quiet param
     parser.add_argument('-q', '--quiet',
@@ -110,9 +114,179 @@ def get_args_dict() -> dict:
                         help='only saves tree to output path (does not print tree on terminal)',
                         default=False)
 
+    # single pass param
+    parser.add_argument('-sp', '--single-pass',
+                        dest='single_pass',
+                        required=False,
+                        action='store_true',
+                        help='scans tree in a single pass, estimating progress from previous run (skips initial count)',
+                        default=False)
+
+    # workers param
+    parser.add_argument('-w', '--workers',
+                        dest='workers',
+                        required=False,
+                        type=int,
+                        help='number of threads used to list/stat folders (and of processes used to count lines of code) concurrently',
+                        default=1)
+
+    # cache dir param
+    parser.add_argument('-cd', '--cache-dir',
+                        dest='cache_dir',
+                        required=False,
+                        type=str,
+                        help='caches folders listings/sizes/loc in given folder, so that later runs only rescan changed folders',
+                        default=None)
+
+    # stream param
+    parser.add_argument('-st', '--stream',
+                        dest='stream',
+                        required=False,
+                        action='store_true',
+                        help='writes output table rows while scanning (folders after their contents), keeping memory bounded by tree depth [.csv/.ndjson]',
+                        default=False)
+
+    # output format param
+    parser.add_argument('-of', '--output-format',
+                        dest='output_format',
+                        required=False,
+                        type=str,
+                        choices=OUTPUT_FORMATS,
+                        help='output table format (inferred from output path extension by default) [parquet/feather require pyarrow]',
+                        default=None)
+
+    # truncate param
+    parser.add_argument('-t', '--truncate',
+                        dest='truncate',
+                        required=False,
+                        action='store_true',
+                        help='with -l, never scans below given level (sizes/loc/total counts then only include scanned contents, and sizes are marked with "+")',
+                        default=False)
+
+    # ignore param
+    parser.add_argument('-i', '--ignore',
+                        dest='ignore_patterns',
+                        required=False,
+                        type=str,
+                        metavar='PATTERN',
+                        action='append',
+                        help='excludes folders/files matching given gitignore style pattern (e.g. "*.log", "build/") [can be repeated]',
+                        default=None)
+
+    # gitignore param
+    parser.add_argument('-gi', '--gitignore',
+                        dest='use_gitignore',
+                        required=False,
+                        action='store_true',
+                        help='excludes folders/files listed in .gitignore files found in tree (.pytreeignore files are always used)',
+                        default=False)
+
+    # size mode param
+    parser.add_argument('-sm', '--size-mode',
+                        dest='size_mode',
+                        required=False,
+                        type=str,
+                        choices=SIZE_MODES,
+                        help='with -s, size shown/saved: apparent (file length) or allocated (disk usage, as du)',
+                        default='apparent')
+
+    # dedupe hardlinks param
+    parser.add_argument('-dh', '--dedupe-hardlinks',
+                        dest='dedupe_hardlinks',
+                        required=False,
+                        action='store_true',
+                        help='counts hardlinked files only once in sizes, and scans start paths nested in other start paths only as roots of their own (as du)',
+                        default=False)
+
+    # extra sizes param
+    parser.add_argument('-xs', '--extra-sizes',
+                        dest='extra_sizes',
+                        required=False,
+                        action='store_true',
+                        help='with -s, adds apparent_size/allocated_size columns to output table',
+                        default=False)
+
+    # top param
+    parser.add_argument('-tp', '--top',
+                        dest='top',
+                        required=False,
+                        type=int,
+                        metavar='N',
+                        help='shows (and saves) only N largest files and folders, instead of tree (implies -s)',
+                        default=None)
+
+    # min size param
+    parser.add_argument('-ms', '--min-size',
+                        dest='min_size',
+                        required=False,
+                        type=get_size_bytes,
+                        metavar='SIZE',
+                        help='folds files/folders smaller than SIZE (e.g. 500kb, 10mb) into one "(N small items, X mb)" node per folder (implies -s)',
+                        default=None)
+
+    # diff param
+    parser.add_argument('-df', '--diff',
+                        dest='diff_path',
+                        required=False,
+                        type=str,
+                        metavar='TABLE',
+                        help='shows changes (sizes/counts/loc deltas, added/removed paths) between saved output table and current scan of start path(s), or table given by -dt [-o saves diff table]',
+                        default=None)
+
+    # diff to param
+    parser.add_argument('-dt', '--diff-to',
+                        dest='diff_to_path',
+                        required=False,
+                        type=str,
+                        metavar='TABLE',
+                        help='with -df, compares against given saved output table, instead of current scan (e.g. -df old.csv -dt new.csv)',
+                        default=None)
+
+    # profile param
+    parser.add_argument('-pf', '--profile',
+                        dest='profile',
+                        required=False,
+                        type=str,
+                        nargs='?',
+                        const='table',
+                        choices=PROFILE_FORMATS,
+                        help='prints per phase (count/scan/tree/table/save/show) wall/cpu times, entries/s, scandir/stat/loc calls and peak rss, as a table (default) or json',
+                        default=None)
+
+    # profile output param
+    parser.add_argument('-pfo', '--profile-output',
+                        dest='profile_output',
+                        required=False,
+                        type=str,
+                        help='with -pf, saves profile report to given path, instead of printing it',
+                        default=None)
+
+    # profile stats param
+    parser.add_argument('-pfs', '--profile-stats',
+                        dest='profile_stats',
+                        required=False,
+                        type=str,
+                        help='saves cProfile stats (pstats format) of scan phase to given path (implies -pf)',
+                        default=None)
+
     # creating arguments dictionary
     args_dict = vars(parser.parse_args())
 
+    # checking whether diff to table was given without diff table
+    if args_dict['diff_to_path'] is not None and args_dict['diff_path'] is None:
+
+        # quitting with usage error
+        parser.error('-dt/--diff-to requires -df/--diff')
+
+    # getting diff paths (old table, and new table if current scan isn't compared)
+    diff_paths = [diff_path
+                  for diff_path
+                  in (args_dict['diff_path'], args_dict['diff_to_path'])
+                  if diff_path is not None]
+
+    # updating arguments dictionary (None if not in diff mode)
+    args_dict['diff_paths'] = diff_paths or None
+
     # returning the arguments dictionary
     return args_dict
 
@@ -130,6 +304,20 @@ def pytree(start_path: str,
            loc: bool,
            output_path: str | None,
            quiet: bool,
+           workers: int,
+           cache_dir: str | None,
+           stream: bool,
+           output_format: str | None,
+           truncate: bool,
+           ignore_patterns: list | None,
+           use_gitignore: bool,
+           size_mode: str,
+           dedupe_hardlinks: bool,
+           extra_sizes: bool,
+           top: int | None,
+           min_size: int | None,
+           start_paths: list,
+           diff_paths: list | None,
            progress_tracker: ModuleProgressTracker
            ) -> None:
     """
@@ -147,7 +335,22 @@ def pytree(start_path: str,
                   loc=loc,
                   output_path=output_path,
                   quiet=quiet,
-                  progress_tracker=progress_tracker)
+                  workers=workers,
+                  cache_dir=cache_dir,
+                  stream=stream,
+                  output_format=output_format,
+                  truncate=truncate,
+                  ignore_patterns=ignore_patterns,
+                  use_gitignore=use_gitignore,
+                  size_mode=size_mode,
+                  dedupe_hardlinks=dedupe_hardlinks,
+                  extra_sizes=extra_sizes,
+                  top=top,
+                  min_size=min_size,
+                  start_paths=start_paths,
+                  diff_paths=diff_paths,
+                  progress_tracker=progress_tracker,
+                  profiler=progress_tracker.profiler)
 
     # running pytree main
     tree.run()
@@ -160,9 +363,12 @@ def parse_and_run(args_dict: dict,
     Extracts args from args_dict
     and runs module function.
     """
-    # getting start path
-    start_path = args_dict['start_path']
-    start_path = get_start_path(start_path)
+    # getting start paths (duplicate paths, e.g. bind mounts of same folder, are only scanned once)
+    start_paths = args_dict['start_path']
+    start_paths = get_start_paths(start_paths)
+
+    # getting start path (first start path)
+    start_path = start_paths[0]
 
     # getting dirs only bool
     dirs_only = args_dict['dirs_only']
@@ -191,6 +397,45 @@ def parse_and_run(args_dict: dict,
     # getting quiet bool
     quiet = args_dict['quiet']
 
+    # getting workers num
+    workers = args_dict['workers']
+
+    # getting cache dir
+    cache_dir = args_dict['cache_dir']
+
+    # getting stream bool
+    stream = args_dict['stream']
+
+    # getting output format
+    output_format = args_dict['output_format']
+
+    # getting truncate bool
+    truncate = args_dict['truncate']
+
+    # getting ignore patterns
+    ignore_patterns = args_dict['ignore_patterns']
+
+    # getting use gitignore bool
+    use_gitignore = args_dict['use_gitignore']
+
+    # getting size mode
+    size_mode = args_dict['size_mode']
+
+    # getting dedupe hardlinks bool
+    dedupe_hardlinks = args_dict['dedupe_hardlinks']
+
+    # getting extra sizes bool
+    extra_sizes = args_dict['extra_sizes']
+
+    # getting top num
+    top = args_dict['top']
+
+    # getting min size
+    min_size = args_dict['min_size']
+
+    # getting diff paths
+    diff_paths = args_dict['diff_paths']
+
     # running pytree function
     pytree(start_path=start_path,
            dirs_only=dirs_only,
@@ -202,6 +447,20 @@ def parse_and_run(args_dict: dict,
            loc=loc,
            output_path=output_path,
            quiet=quiet,
+           workers=workers,
+           cache_dir=cache_dir,
+           stream=stream,
+           output_format=output_format,
+           truncate=truncate,
+           ignore_patterns=ignore_patterns,
+           use_gitignore=use_gitignore,
+           size_mode=size_mode,
+           dedupe_hardlinks=dedupe_hardlinks,
+           extra_sizes=extra_sizes,
+           top=top,
+           min_size=min_size,
+           start_paths=start_paths,
+           diff_paths=diff_paths,
            progress_tracker=progress_tracker)
 
 ######################################################################
@@ -7,19 +7,51 @@
 # imports
 
 # importing required libraries
-from re import sub
+from os import stat
 from re import escape
-from re import DOTALL
+from json import load
+from json import dump
+from os import scandir
 from sys import stdout
+from typing import Any
+from os import DirEntry
 from os.path import sep
-from os.path import islink
+from os import makedirs
+from sys import platform
+from os import stat_result
+from os.path import exists
 from os.path import abspath
-from pandas import DataFrame
+from os.path import dirname
+from typing import Callable
+from typing import Iterator
+from typing import Iterable
+from time import perf_counter
+from functools import partial
+from typing import TYPE_CHECKING
 from os import get_terminal_size
+from contextlib import nullcontext
+from importlib.util import find_spec
+from concurrent.futures import Executor
 from pytree.utils.global_vars import ONE_KB
 from pytree.utils.global_vars import ONE_MB
 from pytree.utils.global_vars import ONE_GB
 from pytree.utils.global_vars import ONE_TB
+from pytree.utils.global_vars import SIZE_UNITS
+from pytree.utils.global_vars import BLOCK_SIZE
+from concurrent.futures import ThreadPoolExecutor
+from pytree.utils.global_vars import BRACKET_LIKES
+from pytree.utils.global_vars import ARROW_FORMATS
+from pytree.utils.global_vars import ROW_GROUP_SIZE
+from pytree.utils.global_vars import STREAM_FORMATS
+from pytree.utils.global_vars import LOC_CHUNK_SIZE
+from pytree.utils.global_vars import ENCODED_COLUMNS
+from pytree.utils.global_vars import OUTPUT_EXTENSIONS
+from pytree.utils.global_vars import SIZE_STRING_PATTERN
+from pytree.utils.global_vars import DEFAULT_CONSOLE_WIDTH
+
+# importing type checking only libraries (pandas is slow to import, so it's only imported when tables are required)
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 ######################################################################
 # defining auxiliary functions
@@ -27,23 +59,32 @@ from pytree.utils.global_vars import ONE_TB
 
 def get_console_width() -> int:
     """
-    Returns current console width.
+    Returns current console width
+    (or default width, if stdout
+    is not a terminal).
     """
-    # getting console dimensions
-    width, _ = get_terminal_size()
+    # getting console dimensions (raises os error if stdout is not a terminal)
+    try:
+        width, _ = get_terminal_size()
+    except OSError:
+        width = DEFAULT_CONSOLE_WIDTH
 
     # returning console width
     return width
 
 
-def flush_string(string: str) -> None:
+def flush_string(string: str,
+                 console_width: int | None = None
+                 ) -> None:
     """
     Given a string, writes and flushes it in the console using
     sys library, and resets cursor to the start of the line.
     (writes N backspaces at the end of line, where N = len(string)).
+    Console width is obtained if not given (callers flushing
+    repeatedly should cache it).
     """
     # getting console width
-    console_width = get_console_width()
+    console_width = get_console_width() if console_width is None else console_width
 
     # getting string length
     string_len = len(string)
@@ -154,85 +195,253 @@ def get_path_name(path: str) -> str:
     return path_name
 
 
-def is_cache(path: str,
-             cache_folders: list
-             ) -> bool:
+def get_path_id(path: str) -> tuple | None:
     """
-    Given a path to a folder/file,
-    returns True if path contains
-    cache keywords, else False.
+    Given a path, returns its (st_dev, st_ino)
+    id, which is shared by hardlinks and bind
+    mounts of same file/folder (or None if
+    path can't be stat-ed).
     """
-    # getting cache bool list
-    cache_bool_list = [cache_str in path for cache_str in cache_folders]
+    # getting path stat result
+    try:
+        path_stat = stat(path)
+    except OSError:
+        return None
 
-    # getting cache bool
-    cache_bool = any(cache_bool_list)
+    # getting path id
+    path_id = (path_stat.st_dev, path_stat.st_ino)
 
-    # returning cache bool
-    return cache_bool
+    # returning path id
+    return path_id
 
 
-def get_start_path(start_path: str | list) -> str:
+def get_start_paths(start_path: str | list) -> list:
     """
-    Given a parsed start path,
-    returns formatted start path.
+    Given a parsed start path (or list of start
+    paths), returns list of formatted start paths,
+    without duplicates (paths pointing to same
+    folder, e.g. bind mounts, are only kept once).
     """
     # getting path is list bool
     path_is_list = isinstance(start_path, list)
 
-    # checking if path is list
-    if path_is_list:
+    # getting start paths list
+    start_paths = start_path if path_is_list else [start_path]
 
-        # updating start path
-        start_path = start_path[0]
+    # defining placeholder value for unique start paths
+    unique_start_paths = []
 
-    # normalizing path
-    start_path = abspath(path=start_path)
+    # defining placeholder value for seen path ids
+    seen_ids = set()
 
-    # returning start path
-    return start_path
+    # iterating over start paths
+    for current_path in start_paths:
 
+        # normalizing path
+        current_path = abspath(path=current_path)
 
-def get_skip_folder(folder_path: str,
-                    start_path: str,
-                    start_is_cache: bool,
-                    cache_folders: list
-                    ) -> bool:
+        # getting path id (paths that can't be stat-ed are compared by path)
+        path_id = get_path_id(path=current_path) or current_path
+
+        # checking whether path was already seen
+        if path_id in seen_ids:
+
+            # skipping duplicate path
+            continue
+
+        # updating seen path ids
+        seen_ids.add(path_id)
+
+        # appending path to unique start paths
+        unique_start_paths.append(current_path)
+
+    # returning unique start paths
+    return unique_start_paths
+
+
+def get_other_root_ids(start_path: str,
+                       start_paths: list
+                       ) -> frozenset:
     """
-    Given a path to a folder, returns
-    True if folder should be skipped,
-    and False otherwise.
+    Given a start path and list of all start
+    paths, returns ids of other start paths
+    (folders that are not descended into while
+    walking start path, since they are scanned
+    as roots of their own, e.g. nested roots or
+    bind mounts of other roots).
     """
-    # defining placeholder value for skip conditions list
-    skip_conditions = []
+    # getting other root ids
+    other_root_ids = frozenset(get_path_id(path=other_path)
+                               for other_path
+                               in start_paths
+                               if other_path != start_path)
 
-    # getting path is root bool
-    path_is_root = (folder_path == start_path)
+    # removing placeholder id (paths that can't be stat-ed)
+    other_root_ids = other_root_ids - {None}
 
-    # checking if current path is root
-    if not path_is_root:
+    # returning other root ids
+    return other_root_ids
 
-        # getting folder is symlink bool
-        folder_is_symlink = islink(path=folder_path)
 
-        # appending current condition to skip conditions list
-        skip_conditions.append(folder_is_symlink)
+def get_entry_name(entry: DirEntry) -> str:
+    """
+    Given a DirEntry, returns its name
+    (used as sorting key).
+    """
+    # getting entry name
+    entry_name = entry.name
 
-        # checking if start path is cache
-        if not start_is_cache:
+    # returning entry name
+    return entry_name
 
-            # getting folder is cache bool
-            folder_is_cache = is_cache(path=folder_path,
-                                       cache_folders=cache_folders)
 
-            # appending current condition to skip conditions list
-            skip_conditions.append(folder_is_cache)
+def get_glob_regex(glob: str) -> str:
+    """
+    Given a gitignore style glob, returns
+    respective regex string ("*" and "?" don't
+    match "/", while "**" matches any number
+    of folders).
+    """
+    # defining placeholder value for regex parts
+    regex_parts = []
 
-    # getting skip bool
-    skip_bool = any(skip_conditions)
+    # defining starting position
+    position = 0
 
-    # returning skip bool
-    return skip_bool
+    # getting glob length
+    glob_length = len(glob)
+
+    # iterating over glob chars
+    while position < glob_length:
+
+        # getting current char
+        char = glob[position]
+
+        # checking whether glob continues with "**/" (any number of folders, including none)
+        if glob.startswith('**/', position):
+
+            # updating regex parts
+            regex_parts.append('(?:.*/)?')
+            position += 3
+
+        # checking whether glob continues with "**" (anything, including folders)
+        elif glob.startswith('**', position):
+
+            # updating regex parts
+            regex_parts.append('.*')
+            position += 2
+
+        elif char == '*':
+
+            # updating regex parts
+            regex_parts.append('[^/]*')
+            position += 1
+
+        elif char == '?':
+
+            # updating regex parts
+            regex_parts.append('[^/]')
+            position += 1
+
+        elif char == '[' and ']' in glob[position + 2:]:
+
+            # getting class end (first "]" after class start, which may itself be "]")
+            class_end = glob.index(']', position + 2)
+
+            # getting class content ("!" negates class, as "^" in regex)
+            class_content = glob[position + 1:class_end]
+            if class_content.startswith('!'):
+                class_content = '^' + class_content[1:]
+
+            # updating regex parts
+            regex_parts.append(f'[{class_content}]')
+            position = class_end + 1
+
+        elif char == '\\' and position + 1 < glob_length:
+
+            # updating regex parts (escaped char)
+            regex_parts.append(escape(glob[position + 1]))
+            position += 2
+
+        else:
+
+            # updating regex parts
+            regex_parts.append(escape(char))
+            position += 1
+
+    # getting regex string
+    regex_str = ''.join(regex_parts)
+
+    # returning regex string
+    return regex_str
+
+
+def get_ignore_rule(pattern: str) -> tuple | None:
+    """
+    Given a gitignore style pattern (a line of
+    an ignore file), returns respective rule tuple
+    (regex_str, negate, dir_only, anchored), or
+    None if line is blank/comment. Patterns
+    containing "/" (other than a trailing one) are
+    anchored (matched against path relative to
+    ignore file folder), others are matched
+    against entry name only.
+    """
+    # removing line break/trailing spaces
+    pattern = pattern.rstrip('\n').rstrip('\r').rstrip(' ')
+
+    # checking whether pattern is blank/comment
+    if pattern == '' or pattern.startswith('#'):
+
+        # returning None (not a rule)
+        return None
+
+    # getting negate bool
+    negate = pattern.startswith('!')
+    pattern = pattern[1:] if negate else pattern
+
+    # removing escape of leading "#"/"!"
+    pattern = pattern[1:] if pattern.startswith(('\\#', '\\!')) else pattern
+
+    # getting dir only bool
+    dir_only = pattern.endswith('/')
+    pattern = pattern.rstrip('/')
+
+    # checking whether pattern is empty (e.g. "/")
+    if pattern == '':
+
+        # returning None (not a rule)
+        return None
+
+    # getting anchored bool
+    anchored = ('/' in pattern)
+    pattern = pattern.lstrip('/')
+
+    # getting regex string
+    regex_str = get_glob_regex(glob=pattern)
+
+    # assembling rule tuple
+    rule_tuple = (regex_str, negate, dir_only, anchored)
+
+    # returning rule tuple
+    return rule_tuple
+
+
+def read_ignore_file(ignore_file_path: str) -> list:
+    """
+    Given a path to an ignore file
+    (.gitignore/.pytreeignore), returns
+    its lines (empty if unreadable).
+    """
+    # reading ignore file lines
+    try:
+        with open(ignore_file_path, 'r', errors='ignore') as open_file:
+            lines = open_file.readlines()
+    except OSError:
+        lines = []
+
+    # returning lines
+    return lines
 
 
 def get_skip_file(file_name: str,
@@ -275,6 +484,466 @@ def get_skip_file(file_name: str,
     return skip_bool
 
 
+def get_files_bytes(files: list,
+                    extension: str | None,
+                    keyword: str | None
+                    ) -> int:
+    """
+    Given a files DirEntry list, returns total
+    bytes of files that aren't skipped by given
+    extension/keyword (files that can't be
+    stat-ed, e.g. broken symlinks, count as empty).
+    """
+    # defining placeholder value for files bytes
+    files_bytes = 0
+
+    # iterating over files
+    for file_entry in files:
+
+        # getting skip file bool
+        skip_file = get_skip_file(file_name=file_entry.name,
+                                  extension=extension,
+                                  keyword=keyword)
+
+        # checking whether to skip current file
+        if skip_file:
+
+            # skipping current file
+            continue
+
+        # updating files bytes (stat result is cached in DirEntry)
+        try:
+            files_bytes += file_entry.stat().st_size
+        except OSError:
+            pass
+
+    # returning files bytes
+    return files_bytes
+
+
+def scan_dir(folder_path: str) -> tuple | None:
+    """
+    Given a path to a folder, returns its
+    subfolders/files DirEntry lists (or
+    None if folder can't be listed).
+    """
+    # defining placeholder values for subfolders/files lists
+    subfolders = []
+    files = []
+
+    # listing folder (unreadable folders are skipped, same as os.walk)
+    try:
+        with scandir(folder_path) as entries:
+
+            # iterating over folder entries
+            for entry in entries:
+
+                # getting entry is dir bool (follows symlinks, same as os.walk)
+                try:
+                    entry_is_dir = entry.is_dir()
+                except OSError:
+                    entry_is_dir = False
+
+                # checking whether entry is dir
+                if entry_is_dir:
+
+                    # appending entry to subfolders list
+                    subfolders.append(entry)
+
+                else:
+
+                    # appending entry to files list
+                    files.append(entry)
+
+    except OSError:
+
+        # returning None (folder can't be listed)
+        return None
+
+    # assembling folder listing
+    folder_listing = (subfolders, files)
+
+    # returning folder listing
+    return folder_listing
+
+
+def list_folder(folder_path: str,
+                ignore_rules: Any = None,
+                parent_rules: tuple | None = None,
+                stat_files: bool = False,
+                scan_cache: Any = None,
+                skip_folder_ids: frozenset | None = None,
+                profiler: Any = None
+                ) -> tuple | None:
+    """
+    Given a path to a folder, returns its
+    (subfolders, files, folder_rules) tuple,
+    keeping only subfolders that should be
+    descended into and files that aren't
+    ignored (or None if folder can't be listed).
+    If IgnoreRules are given, entries are
+    matched against folder rules (parent
+    rules plus folder ignore files).
+    If stat_files is True, files stat results are
+    obtained (and cached in DirEntry) beforehand.
+    If a ScanCache is given, unchanged folders
+    listings are taken from it instead.
+    Subfolders whose (st_dev, st_ino) id is in
+    skip_folder_ids are not descended into.
+    If a ScanProfiler is given, listing/stat
+    calls are recorded.
+    """
+    # getting listing start time
+    listing_start_time = perf_counter()
+
+    # checking whether scan cache was given
+    if scan_cache is None:
+
+        # getting folder listing
+        folder_listing = scan_dir(folder_path=folder_path)
+
+    else:
+
+        # getting folder listing (from cache, if folder didn't change)
+        folder_listing = scan_cache.scan_dir(folder_path=folder_path)
+
+    # checking whether profiler was given
+    if profiler is not None:
+
+        # recording listing call
+        profiler.add_operation(operation_name=('scandir' if scan_cache is None else 'cached listing'),
+                               elapsed_time=perf_counter() - listing_start_time)
+
+    # checking whether folder could be listed
+    if folder_listing is None:
+
+        # returning None (folder can't be listed)
+        return None
+
+    # getting folder subfolders/files
+    subfolders, files = folder_listing
+
+    # defining placeholder value for folder rules
+    folder_rules = None
+
+    # checking whether ignore rules were given
+    if ignore_rules is not None:
+
+        # getting folder rules
+        folder_rules = ignore_rules.get_folder_rules(folder_path=folder_path,
+                                                     files=files,
+                                                     parent_rules=parent_rules)
+
+        # checking whether any rules may match files
+        if ignore_rules.has_file_rules(folder_rules=folder_rules):
+
+            # removing ignored files
+            files = [file_entry
+                     for file_entry
+                     in files
+                     if not ignore_rules.is_ignored(folder_rules=folder_rules,
+                                                    entry=file_entry,
+                                                    is_dir=False)]
+
+    # defining placeholder value for kept subfolders
+    kept_subfolders = []
+
+    # iterating over subfolders
+    for subfolder in subfolders:
+
+        # getting subfolder is symlink bool (symlinks are never descended into, same as os.walk)
+        try:
+            subfolder_is_symlink = subfolder.is_symlink()
+        except OSError:
+            subfolder_is_symlink = False
+
+        # checking whether subfolder is symlink
+        if subfolder_is_symlink:
+
+            # skipping current subfolder
+            continue
+
+        # checking whether subfolder is ignored
+        if folder_rules is not None and ignore_rules.is_ignored(folder_rules=folder_rules,
+                                                                entry=subfolder,
+                                                                is_dir=True):
+
+            # skipping current subfolder
+            continue
+
+        # checking whether subfolder is skipped by id (e.g. another scan root, or a bind mount of it)
+        if skip_folder_ids and get_path_id(path=subfolder.path) in skip_folder_ids:
+
+            # skipping current subfolder
+            continue
+
+        # appending subfolder to kept subfolders
+        kept_subfolders.append(subfolder)
+
+    # checking stat files toggle
+    if stat_files:
+
+        # getting stat start time
+        stat_start_time = perf_counter()
+
+        # iterating over files
+        for file_entry in files:
+
+            # caching file stat result (errors are raised again when stat is used)
+            try:
+                file_entry.stat()
+            except OSError:
+                pass
+
+        # checking whether profiler was given
+        if profiler is not None:
+
+            # recording stat calls
+            profiler.add_operation(operation_name='stat',
+                                   elapsed_time=perf_counter() - stat_start_time,
+                                   calls=len(files))
+
+    # assembling folder listing
+    folder_listing = (kept_subfolders, files, folder_rules)
+
+    # returning folder listing
+    return folder_listing
+
+
+def request_listing(folder_path: str,
+                    list_function: Callable,
+                    executor: Executor | None
+                    ) -> Callable:
+    """
+    Given a path to a folder, returns a callable
+    that returns its listing. If an executor is
+    given, listing is submitted right away (and
+    runs concurrently), otherwise it is obtained
+    lazily when callable is called.
+    """
+    # checking whether executor was given
+    if executor is None:
+
+        # getting lazy listing function
+        get_listing = partial(list_function,
+                              folder_path=folder_path)
+
+    else:
+
+        # submitting listing to executor
+        listing_future = executor.submit(list_function,
+                                         folder_path=folder_path)
+
+        # getting listing future result function
+        get_listing = listing_future.result
+
+    # returning listing function
+    return get_listing
+
+
+def get_walk_item(folder_path: str,
+                  folder_listing: tuple,
+                  folder_depth: int,
+                  max_depth: int | None,
+                  list_function: Callable,
+                  executor: Executor | None
+                  ) -> tuple:
+    """
+    Given a folder path, its listing and depth, returns
+    walk stack item (folder_path, subfolders, files,
+    pending_subfolders, folder_depth), requesting
+    subfolders listings (concurrently, if executor is
+    given), unless folder is at max depth.
+    """
+    # getting folder subfolders/files/rules
+    subfolders, files, folder_rules = folder_listing
+
+    # getting subfolders listing function (subfolders inherit folder rules)
+    subfolder_list_function = partial(list_function,
+                                      parent_rules=folder_rules)
+
+    # defining placeholder value for pending subfolders list
+    pending_subfolders = []
+
+    # getting descend bool (subfolders below max depth are neither listed nor descended into)
+    descend = (max_depth is None or folder_depth < max_depth)
+
+    # iterating over subfolders to descend into
+    for subfolder in (subfolders if descend else []):
+
+        # requesting subfolder listing
+        get_listing = request_listing(folder_path=subfolder.path,
+                                      list_function=subfolder_list_function,
+                                      executor=executor)
+
+        # appending subfolder to pending subfolders list
+        pending_subfolders.append((subfolder, get_listing))
+
+    # getting pending subfolders iterator
+    pending_subfolders = iter(pending_subfolders)
+
+    # assembling walk item
+    walk_item = (folder_path, subfolders, files, pending_subfolders, folder_depth)
+
+    # returning walk item
+    return walk_item
+
+
+def walk_entries(start_path: str,
+                 ignore_rules: Any = None,
+                 stat_files: bool = False,
+                 executor: Executor | None = None,
+                 scan_cache: Any = None,
+                 max_depth: int | None = None,
+                 skip_folder_ids: frozenset | None = None,
+                 profiler: Any = None
+                 ) -> Iterator[tuple]:
+    """
+    Given a start path, yields (folder_path, subfolders, files)
+    tuples bottom-up (same order as os.walk with topdown=False),
+    where subfolders/files are os.DirEntry lists, so that cached
+    scandir info can be reused for sizes and symlink checks.
+    Symlinked folders, folders ignored by given IgnoreRules
+    and unreadable folders are neither descended into nor
+    included in their parent subfolders list (ignored files
+    are not included in files lists).
+    If an executor is given, folders are listed (and files
+    stat-ed, if stat_files is True) concurrently ahead of the
+    walk, while yielded order remains the same.
+    If a ScanCache is given, unchanged folders are not listed
+    again (entries are then CachedEntry instances).
+    If a max depth is given, folders at max depth (start
+    path depth being 0) are yielded with their subfolders
+    lists, but subfolders are neither listed nor yielded.
+    If skip folder ids are given, folders with matching
+    (st_dev, st_ino) ids are not descended into.
+    If a ScanProfiler is given, listing/stat calls
+    are recorded (from worker threads as well).
+    """
+    # getting listing function
+    list_function = partial(list_folder,
+                            ignore_rules=ignore_rules,
+                            stat_files=stat_files,
+                            scan_cache=scan_cache,
+                            skip_folder_ids=skip_folder_ids,
+                            profiler=profiler)
+
+    # getting start path listing
+    start_listing = list_function(folder_path=start_path)
+
+    # checking whether start path could be listed
+    if start_listing is None:
+
+        # ending walk
+        return
+
+    # getting start path walk item
+    start_item = get_walk_item(folder_path=start_path,
+                               folder_listing=start_listing,
+                               folder_depth=0,
+                               max_depth=max_depth,
+                               list_function=list_function,
+                               executor=executor)
+
+    # defining walk stack
+    walk_stack = [start_item]
+
+    # running walk until stack is empty
+    while walk_stack:
+
+        # getting current stack top
+        folder_path, subfolders, files, pending_subfolders, folder_depth = walk_stack[-1]
+
+        # getting next subfolder to descend into
+        pending_subfolder = next(pending_subfolders, None)
+
+        # checking whether all subfolders were already walked
+        if pending_subfolder is None:
+
+            # removing folder from stack
+            walk_stack.pop()
+
+            # yielding folder (all of its subfolders have already been yielded)
+            yield folder_path, subfolders, files
+
+            # skipping to next stack item
+            continue
+
+        # getting subfolder/listing function
+        subfolder, get_listing = pending_subfolder
+
+        # getting subfolder listing
+        subfolder_listing = get_listing()
+
+        # checking whether subfolder could be listed
+        if subfolder_listing is None:
+
+            # removing subfolder from parent subfolders (it won't be yielded)
+            subfolders.remove(subfolder)
+
+            # skipping to next subfolder
+            continue
+
+        # getting subfolder walk item
+        subfolder_item = get_walk_item(folder_path=subfolder.path,
+                                       folder_listing=subfolder_listing,
+                                       folder_depth=folder_depth + 1,
+                                       max_depth=max_depth,
+                                       list_function=list_function,
+                                       executor=executor)
+
+        # adding subfolder to walk stack
+        walk_stack.append(subfolder_item)
+
+
+def get_prune_depth(level: int,
+                    include_sizes: bool,
+                    include_counts: bool,
+                    loc: bool,
+                    truncate: bool
+                    ) -> int | None:
+    """
+    Given specified parameters, returns depth
+    below which walk can stop descending (None
+    if whole tree must be walked). Subtrees below
+    level are only walked if their sizes/loc (or
+    total counts) are required (and truncate is off).
+    """
+    # getting apply level filter bool
+    apply_level_filter = (level != -1)
+
+    # getting aggregates required bool (total counts shown in summary include whole tree)
+    aggregates_required = (include_sizes or include_counts or loc)
+
+    # checking whether walk can be pruned
+    if apply_level_filter and (truncate or not aggregates_required):
+
+        # returning level (folders at level are listed, so that their counts are known)
+        return level
+
+    # returning None (walking whole tree)
+    return None
+
+
+def get_walk_executor(workers: int) -> ThreadPoolExecutor | nullcontext:
+    """
+    Given a number of workers, returns context
+    manager providing walk_entries executor
+    (a thread pool if workers > 1, else None).
+    """
+    # defining placeholder value for walk executor (enters as None)
+    walk_executor = nullcontext()
+
+    # checking workers num
+    if workers > 1:
+
+        # getting thread pool (listing is io bound, so threads run concurrently)
+        walk_executor = ThreadPoolExecutor(max_workers=workers)
+
+    # returning walk executor
+    return walk_executor
+
+
 def get_path_split(path: str) -> list:
     """
     Given a path, returns its split
@@ -301,6 +970,113 @@ def get_path_depth(path: str) -> int:
     return path_depth
 
 
+def get_allocated_size(entry_stat: stat_result) -> int:
+    """
+    Given a file/folder stat result, returns
+    its allocated size (disk usage, as shown
+    by du), falling back to apparent size where
+    blocks count isn't available.
+    """
+    # getting entry blocks count (not available on every platform, nor for every cached entry)
+    entry_blocks = getattr(entry_stat, 'st_blocks', None)
+
+    # checking whether blocks count is available
+    if entry_blocks is None:
+
+        # returning apparent size
+        return entry_stat.st_size
+
+    # getting allocated size (st_blocks is always given in 512 byte units)
+    allocated_size = entry_blocks * BLOCK_SIZE
+
+    # returning allocated size
+    return allocated_size
+
+
+def get_peak_rss() -> int | None:
+    """
+    Returns current process peak resident
+    set size (rss), in bytes (or None if
+    not available, e.g. on windows).
+    """
+    # importing resource library (not available on every platform)
+    try:
+        from resource import getrusage
+        from resource import RUSAGE_SELF
+    except ImportError:
+        return None
+
+    # getting max rss (in kilobytes on linux, in bytes on macos)
+    max_rss = getrusage(RUSAGE_SELF).ru_maxrss
+
+    # getting peak rss in bytes
+    peak_rss = max_rss if platform == 'darwin' else max_rss * ONE_KB
+
+    # returning peak rss
+    return peak_rss
+
+
+def get_profile_phase(profiler: Any,
+                      phase_name: str
+                      ) -> Any:
+    """
+    Given a ScanProfiler (or None) and a phase
+    name, returns context manager recording phase
+    (or a null context, if no profiler is given),
+    yielding phase entries dict.
+    """
+    # getting profile phase
+    profile_phase = nullcontext({'entries': None}) if profiler is None else profiler.phase(phase_name=phase_name)
+
+    # returning profile phase
+    return profile_phase
+
+
+def get_folder_allocated_size(folder_path: str) -> int:
+    """
+    Given a path to a folder, returns
+    allocated size of folder itself (its
+    entries table), or 0 if folder can't
+    be stat-ed.
+    """
+    # getting folder stat result
+    try:
+        folder_stat = stat(folder_path)
+    except OSError:
+        return 0
+
+    # getting folder allocated size
+    folder_allocated_size = get_allocated_size(entry_stat=folder_stat)
+
+    # returning folder allocated size
+    return folder_allocated_size
+
+
+def get_size_bytes(size_string: str) -> int:
+    """
+    Given a human readable size string
+    (e.g. "500", "2kb", "1.5 mb", "1g"),
+    returns respective size in bytes.
+    """
+    # matching size string
+    size_match = SIZE_STRING_PATTERN.fullmatch(size_string)
+
+    # checking whether size string is valid
+    if size_match is None:
+
+        # raising value error (reported by argparse as invalid value)
+        raise ValueError(f'invalid size: {size_string}')
+
+    # getting size value/unit
+    size_value, size_unit = size_match.groups()
+
+    # getting size in bytes
+    size_in_bytes = int(float(size_value) * SIZE_UNITS[size_unit.lower()])
+
+    # returning size in bytes
+    return size_in_bytes
+
+
 def get_size_str(size_in_bytes: int) -> str:
     """
     Given a file/folder size in bytes,
@@ -352,41 +1128,133 @@ def get_size_str(size_in_bytes: int) -> str:
     return size_str
 
 
-def collapse_brackets(text: str) -> str:
+def get_delta_str(delta: int,
+                  delta_str: str
+                  ) -> str:
     """
-    Given a text, returns text clear
-    of bracket-like line breaks.
+    Given a delta (e.g. size growth between
+    two scans) and its absolute value string,
+    returns signed delta string (e.g. "+3 mb").
     """
-    # defining placeholder for bracket-likes list
-    bracket_likes = [('(', ')'),
-                     ('[', ']'),
-                     ('{', '}'),
-                     ('"""', '"""')]
+    # getting delta sign
+    delta_sign = '-' if delta < 0 else '+'
+
+    # assembling signed delta string
+    signed_delta_str = f'{delta_sign}{delta_str}'
+
+    # returning signed delta string
+    return signed_delta_str
+
+
+def collapse_bracket_like(lines: Iterable,
+                          bracket_start: str,
+                          bracket_end: str
+                          ) -> Iterator[str]:
+    """
+    Given an iterable of text lines and a bracket-like
+    start/end, yields lines with bracket-like contents
+    removed (so that lines spanning brackets become
+    one line), as regex "start.*?end" substitution
+    applied to whole text would, but streaming.
+    Contents of an unclosed bracket-like are kept
+    (buffered until end of text, since no match
+    is possible after it).
+    """
+    # defining placeholder values for current output line and unclosed contents
+    output_line = ''
+    pending_contents = []
+
+    # defining placeholder value for inside bracket bool
+    inside_bracket = False
+
+    # iterating over lines
+    for line in lines:
+
+        # checking whether line can be yielded as is (most lines have no bracket-likes)
+        if not inside_bracket and bracket_start not in line:
+
+            # yielding line
+            yield line
+
+            # skipping to next line
+            continue
+
+        # defining placeholder value for scan position
+        position = 0
 
-    # iterating over bracket-likes list
-    for bracket_like in bracket_likes:
+        # iterating over bracket starts/ends in line
+        while True:
 
-        # getting bracket start/end
-        bracket_start, bracket_end = bracket_like
+            # checking whether position is inside bracket-like
+            if inside_bracket:
 
-        # assembling current pattern string
-        pattern = f'({escape(bracket_start)}).*?({escape(bracket_end)})'
+                # getting bracket end position
+                end_position = line.find(bracket_end, position)
 
-        # clearing text of current bracket like
-        text = sub(pattern=pattern,
-                   repl=r'\1\2',
-                   string=text,
-                   flags=DOTALL)
+                # checking whether bracket-like ends on current line
+                if end_position == -1:
 
-    # returning clean text
-    return text
+                    # buffering line rest (kept only if bracket-like never ends)
+                    pending_contents.append(line[position:])
 
+                    # ending line scan
+                    break
 
-def get_loc(file_path: str) -> int:
+                # updating output line (contents are dropped)
+                output_line += bracket_end
+                pending_contents = []
+
+                # updating position/inside bracket bool
+                position = end_position + len(bracket_end)
+                inside_bracket = False
+
+            else:
+
+                # getting bracket start position
+                start_position = line.find(bracket_start, position)
+
+                # checking whether bracket-like starts on current line
+                if start_position == -1:
+
+                    # updating output line
+                    output_line += line[position:]
+
+                    # ending line scan
+                    break
+
+                # updating output line
+                output_line += line[position:start_position + len(bracket_start)]
+
+                # updating position/inside bracket bool
+                position = start_position + len(bracket_start)
+                inside_bracket = True
+
+        # checking whether output line is complete
+        if not inside_bracket:
+
+            # yielding output line
+            yield output_line
+
+            # resetting output line
+            output_line = ''
+
+    # checking whether a bracket-like was left unclosed (output line is only non-empty inside bracket-likes)
+    if inside_bracket:
+
+        # yielding unclosed bracket-like contents (kept as is, line by line)
+        pending_contents[0] = output_line + pending_contents[0]
+        yield from pending_contents
+
+
+def get_loc(file_path: str) -> tuple:
     """
     Given a path to a python file,
     returns number of lines of code
     (disconsidering comments and enters)
+    and comments.
+    Bracket-like contents are collapsed while
+    streaming file lines (instead of running
+    regex substitutions on whole file text).
     """
     # defining placeholder value for lines of code (loc) and comments (com)
     loc = 0
@@ -401,20 +1269,22 @@ def get_loc(file_path: str) -> int:
     # defining read mode
     read_mode = 'r'
 
-    # reading file
+    # reading file (line by line)
     with open(file_path, read_mode) as open_file:
 
-        # getting text
-        text = open_file.read()
+        # defining placeholder value for collapsed lines
+        collapsed_lines = open_file
 
-        # cleaning text
-        text = collapse_brackets(text=text)
+        # iterating over bracket-likes (chained, same order as previous regex passes)
+        for bracket_start, bracket_end in BRACKET_LIKES:
 
-        # getting file lines
-        lines = text.split('\n')
+            # getting collapsed lines
+            collapsed_lines = collapse_bracket_like(lines=collapsed_lines,
+                                                    bracket_start=bracket_start,
+                                                    bracket_end=bracket_end)
 
-        # iterating over lines
-        for line in lines:
+        # iterating over collapsed lines
+        for line in collapsed_lines:
 
             # cleaning line
             line = line.strip()
@@ -464,10 +1334,59 @@ def get_loc(file_path: str) -> int:
             # updating lines of code count
             loc += 1
 
-    # returning lines of code count
+    # returning lines of code/comments count
     return loc, com
 
 
+def get_loc_batch(file_paths: list) -> list:
+    """
+    Given a list of paths to python files,
+    returns list of respective (loc, com)
+    counts (used as process pool task).
+    """
+    # getting loc/com counts
+    loc_com_list = [get_loc(file_path=file_path) for file_path in file_paths]
+
+    # returning loc/com counts
+    return loc_com_list
+
+
+def get_loc_dict(file_paths: list,
+                 workers: int,
+                 chunk_size: int = LOC_CHUNK_SIZE
+                 ) -> dict:
+    """
+    Given a list of paths to python files, returns
+    a {file_path: (loc, com)} dict, counting lines
+    in chunked batches on a process pool (line
+    counting is cpu bound, so threads don't help).
+    """
+    # importing process pool (only imported when lines are counted in parallel, since it imports multiprocessing)
+    from concurrent.futures import ProcessPoolExecutor
+
+    # defining placeholder value for loc dict
+    loc_dict = {}
+
+    # getting file paths chunks
+    chunks = [file_paths[index:index + chunk_size] for index in range(0, len(file_paths), chunk_size)]
+
+    # running line counting on process pool
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        # getting chunks results (in submission order)
+        chunks_results = executor.map(get_loc_batch,
+                                      chunks)
+
+        # iterating over chunks/results
+        for chunk, chunk_results in zip(chunks, chunks_results):
+
+            # updating loc dict
+            loc_dict.update(zip(chunk, chunk_results))
+
+    # returning loc dict
+    return loc_dict
+
+
 def get_loc_com_str(loc: int,
                     com: int
                     ) -> str:
@@ -498,34 +1417,287 @@ def get_loc_com_str(loc: int,
     return loc_com_str
 
 
-def reverse_dict(a_dict: dict) -> dict:
+def get_table_columns(include_sizes: bool,
+                      include_counts: bool,
+                      include_loc: bool,
+                      include_truncated: bool = False,
+                      include_extra_sizes: bool = False
+                      ) -> list:
+    """
+    Given specified parameters, returns
+    output table columns (same order
+    as saved tables).
+    """
+    # defining base columns
+    columns = ['name', 'path', 'level', 'parent', 'type']
+
+    # checking include sizes toggle
+    if include_sizes:
+
+        # updating columns
+        columns.append('size')
+
+    # checking include extra sizes toggle
+    if include_extra_sizes:
+
+        # updating columns
+        columns.extend(['apparent_size', 'allocated_size'])
+
+    # checking include counts toggle
+    if include_counts:
+
+        # updating columns
+        columns.append('count')
+
+    # checking include loc toggle
+    if include_loc:
+
+        # updating columns
+        columns.extend(['loc', 'com'])
+
+    # checking include truncated toggle
+    if include_truncated:
+
+        # updating columns
+        columns.append('truncated')
+
+    # returning columns
+    return columns
+
+
+def get_output_format(output_path: str,
+                      output_format: str | None
+                      ) -> str:
     """
-    Given a dictionary, returns
-    reversed dict.
+    Given an output path and specified
+    output format (None if not given),
+    returns output format (inferred from
+    output path extension, csv by default).
     """
-    # getting dict items
-    dict_items = a_dict.items()
+    # checking whether output format was given
+    if output_format is not None:
+
+        # returning given output format
+        return output_format
+
+    # getting lower output path
+    lower_output_path = output_path.lower()
+
+    # iterating over known extensions
+    for extension, extension_format in OUTPUT_EXTENSIONS.items():
+
+        # checking whether output path has current extension
+        if lower_output_path.endswith(extension):
+
+            # returning extension format
+            return extension_format
+
+    # returning default output format (other compressed csv extensions, e.g. ".csv.bz2", are inferred by pandas)
+    return 'csv'
 
-    # reversing items
-    reversed_items = reversed(dict_items)
 
-    # reassembling dict
-    reversed_dict = dict(reversed_items)
+def check_output_format(output_format: str,
+                        stream: bool
+                        ) -> None:
+    """
+    Given an output format, raises an error if it
+    can't be written (missing optional dependency,
+    or format not supported by streaming output),
+    so that it fails before scanning.
+    """
+    # checking whether output format is streamed
+    if stream and output_format not in STREAM_FORMATS:
+
+        # raising value error
+        raise ValueError(f'streaming output supports {", ".join(STREAM_FORMATS)} formats only (got {output_format})')
+
+    # checking whether output format requires pyarrow
+    if output_format in ARROW_FORMATS and find_spec('pyarrow') is None:
+
+        # raising import error
+        raise ImportError(f'saving {output_format} output requires pyarrow (pip install pyarrow)')
+
+
+def get_encoded_df(df: 'DataFrame') -> 'DataFrame':
+    """
+    Given a tree dataframe, returns copy with
+    repetitive string columns (names, parents,
+    types) converted to categories, so that
+    they are dictionary encoded by arrow.
+    """
+    # getting encoded columns dict
+    encoded_columns_dict = {column: df[column].astype('category')
+                            for column in ENCODED_COLUMNS
+                            if column in df.columns}
+
+    # getting encoded df
+    encoded_df = df.assign(**encoded_columns_dict)
 
-    # returning reversed dict
-    return reversed_dict
+    # returning encoded df
+    return encoded_df
 
 
 def save_df(save_path: str,
-            df: DataFrame
+            df: 'DataFrame',
+            output_format: str = 'csv'
             ) -> None:
     """
     Given a dataframe, saves it
-    to given save path.
+    to given save path, in given
+    output format.
+    """
+    # checking output format
+    if output_format == 'parquet':
+
+        # saving df (written in row groups)
+        get_encoded_df(df=df).to_parquet(path=save_path,
+                                         index=False,
+                                         compression='zstd',
+                                         row_group_size=ROW_GROUP_SIZE)
+
+    elif output_format == 'feather':
+
+        # saving df (written in record batches)
+        get_encoded_df(df=df).to_feather(path=save_path,
+                                         chunksize=ROW_GROUP_SIZE)
+
+    elif output_format == 'ndjson':
+
+        # saving df
+        df.to_json(path_or_buf=save_path,
+                   orient='records',
+                   lines=True)
+
+    elif output_format == 'csv.gz':
+
+        # saving df
+        df.to_csv(path_or_buf=save_path,
+                  index=False,
+                  compression='gzip')
+
+    else:
+
+        # saving df (compression is inferred from extension)
+        df.to_csv(path_or_buf=save_path,
+                  index=False)
+
+
+def read_df(load_path: str,
+            input_format: str = 'csv'
+            ) -> 'DataFrame':
+    """
+    Given a path to a saved output table,
+    and its format, returns it as a df
+    (inverse of save_df).
+    """
+    # importing pandas readers (only imported when tables are read)
+    from pandas import read_csv
+    from pandas import read_json
+    from pandas import read_parquet
+    from pandas import read_feather
+
+    # checking input format
+    if input_format == 'parquet':
+
+        # reading df
+        df = read_parquet(path=load_path)
+
+    elif input_format == 'feather':
+
+        # reading df
+        df = read_feather(path=load_path)
+
+    elif input_format == 'ndjson':
+
+        # reading df (names are kept as strings, even if they look like numbers)
+        df = read_json(path_or_buf=load_path,
+                       orient='records',
+                       lines=True,
+                       dtype={column: str for column in ENCODED_COLUMNS})
+
+    else:
+
+        # reading df (names such as "nan"/"null" are kept, only empty counts, of files, are missing)
+        df = read_csv(filepath_or_buffer=load_path,
+                      compression='gzip' if input_format == 'csv.gz' else 'infer',
+                      dtype={column: str for column in ENCODED_COLUMNS},
+                      keep_default_na=False,
+                      na_values={'count': ['']})
+
+    # returning df
+    return df
+
+
+def read_totals_file(totals_path: str) -> dict:
+    """
+    Given a path to a totals file, returns
+    saved totals dict (or an empty dict if
+    file is missing or unreadable).
+    """
+    # defining placeholder value for totals dict
+    totals_dict = {}
+
+    # checking whether totals file exists
+    if exists(totals_path):
+
+        # reading totals file (ignoring corrupted/unreadable files)
+        try:
+            with open(totals_path, 'r') as open_file:
+                totals_dict = load(open_file)
+        except (OSError, ValueError):
+            pass
+
+    # returning totals dict
+    return totals_dict
+
+
+def load_totals(start_path: str,
+                totals_path: str
+                ) -> dict | None:
+    """
+    Given a start path, returns folders/files
+    totals saved for it on a previous run
+    (or None if no previous run was saved).
+    """
+    # getting saved totals dict
+    totals_dict = read_totals_file(totals_path=totals_path)
+
+    # getting current start path totals
+    start_path_totals = totals_dict.get(start_path)
+
+    # returning start path totals
+    return start_path_totals
+
+
+def save_totals(start_path: str,
+                totals_path: str,
+                folders_num: int,
+                files_num: int,
+                bytes_num: int = 0
+                ) -> None:
+    """
+    Given a start path and its folders/files
+    (and files bytes) totals, saves them to
+    totals file, so that next runs can use
+    them as progress estimate.
     """
-    # saving df
-    df.to_csv(path_or_buf=save_path,
-              index=False)
+    # getting saved totals dict
+    totals_dict = read_totals_file(totals_path=totals_path)
+
+    # updating totals dict
+    totals_dict[start_path] = {'folders': folders_num,
+                               'files': files_num,
+                               'bytes': bytes_num}
+
+    # writing totals file (totals are only an estimate, so failing to save them is not an error)
+    try:
+        makedirs(dirname(totals_path),
+                 exist_ok=True)
+        with open(totals_path, 'w') as open_file:
+            dump(totals_dict,
+                 open_file)
+    except OSError:
+        pass
 
 ######################################################################
 # end of current module
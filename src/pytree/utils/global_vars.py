@@ -3,21 +3,72 @@
 # Code destined to storing global
 # variables used in main script.
 
+######################################################################
+# imports
+
+# importing required libraries
+from re import compile
+from os.path import join
+from os.path import expanduser
+
 ######################################################################
 # defining global variables
 
 UPDATE_TIME = 0.1
+RATE_SMOOTHING_TIME = 2.0
+DEFAULT_CONSOLE_WIDTH = 80
+LOC_CHUNK_SIZE = 64
 ONE_BYTE = 1
 MULTIPLIER = 1024
 ONE_KB = ONE_BYTE * MULTIPLIER
 ONE_MB = ONE_KB * MULTIPLIER
 ONE_GB = ONE_MB * MULTIPLIER
 ONE_TB = ONE_GB * MULTIPLIER
-CACHE_FOLDERS = ['__pycache__',
-                 '.git',
-                 '.idea',
-                 '.cache',
-                 'egg-info']
+CACHE_FOLDERS = ['__pycache__/',
+                 '.git/',
+                 '.idea/',
+                 '.cache*/',
+                 '*egg-info/']
+IGNORE_FILE_NAME = '.pytreeignore'
+GITIGNORE_FILE_NAME = '.gitignore'
+CACHE_DIR = join(expanduser('~'), '.cache', 'pytree')
+TOTALS_FILE = join(CACHE_DIR, 'totals.json')
+SCAN_CACHE_NAME = 'scan_cache.sqlite'
+RACY_MTIME_SECONDS = 2
+FOLDER_TYPE = 0
+FILE_TYPE = 1
+SUMMARY_TYPE = 2
+NODE_TYPE_NAMES = ('folder', 'file', 'summary')
+NO_PARENT = -1
+SIZE_MODES = ['apparent', 'allocated']
+BLOCK_SIZE = 512
+OUTPUT_FORMATS = ['csv', 'csv.gz', 'ndjson', 'parquet', 'feather']
+PROFILE_FORMATS = ['table', 'json']
+PROFILE_OPERATIONS = ['scandir', 'cached listing', 'stat', 'loc']
+OUTPUT_EXTENSIONS = {'.csv.gz': 'csv.gz',
+                     '.ndjson': 'ndjson',
+                     '.jsonl': 'ndjson',
+                     '.parquet': 'parquet',
+                     '.feather': 'feather',
+                     '.arrow': 'feather'}
+STREAM_FORMATS = ['csv', 'csv.gz', 'ndjson']
+ARROW_FORMATS = ['parquet', 'feather']
+ENCODED_COLUMNS = ['name', 'parent', 'type']
+ROW_GROUP_SIZE = 1_000_000
+SNAPSHOT_COLUMNS = ['name', 'path', 'level', 'parent', 'type']
+DIFF_COLUMNS = ['size', 'apparent_size', 'allocated_size', 'count', 'loc', 'com']
+SAME_STATUS = 'same'
+CHANGED_STATUS = 'changed'
+ADDED_STATUS = 'added'
+REMOVED_STATUS = 'removed'
+RENDER_CHUNK_SIZE = 10_000
+VERTICAL_LINE_PREFIX = '\u2502   '
+EMPTY_PREFIX = '    '
+BOX_LINE_PREFIX = '\u251c\u2500\u2500 '
+CORNER_LINE_PREFIX = '\u2514\u2500\u2500 '
+BRACKET_LIKES = [('(', ')'), ('[', ']'), ('{', '}'), ('"""', '"""')]
+SIZE_STRING_PATTERN = compile(r'(?i)\s*(\d+(?:\.\d+)?)\s*([kmgt]?)b?(?:ytes?)?\s*')
+SIZE_UNITS = {'': ONE_BYTE, 'k': ONE_KB, 'm': ONE_MB, 'g': ONE_GB, 't': ONE_TB}
 
 ######################################################################
 # end of current module